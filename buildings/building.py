@@ -1,16 +1,24 @@
 """
 Object for simulating a single building, accounting for energy, emissions, and costs
 """
+import json
 import os
 from typing import Dict, List
 
 import numpy as np
 import pandas as pd
 
+from buildings.building_timeline import BuildingTimeline
 from end_uses.building_end_uses.clothes_dryer import ClothesDryer
 from end_uses.building_end_uses.domestic_hot_water import DHW
+from end_uses.building_end_uses.end_use_table import EndUseTable
 from end_uses.building_end_uses.hvac import HVAC
 from end_uses.building_end_uses.stove import Stove
+from loads.load_store import BASELINE, FUELS, RETROFIT, LoadStore
+from loads.profile_library import ProfileLibrary
+from loads.profile_reader import TIMESTAMP_COLUMN, is_profile_column, read_fixed_grid_profile
+from loads.time_axis import get_intervals_per_hour, to_positional
+from reference_data.reference_data import REFERENCE_DATA
 
 
 CUSTOM_RESSTOCK_MAPPING = {
@@ -46,22 +54,12 @@ CUSTOM_RESSTOCK_MAPPING = {
     'lpg.hot_water': 'out.propane.hot_water.energy_consumption',
 }
 
-
-METHANE_LEAKS = {
-    "GAS": 2,
-    "HPL": 1,
-}
-
-
-#TODO: Make configurable for different geographies
-EMISSION_FACTORS = { # tCO2 / kWh
-    "natural_gas": (53 / (293 * 907)), # Input of kgCO2 / MMBtu
-    "electricity": 0.45 / 1000, # Input of tCO2 / MWh
-    "fuel_oil": (73.96 / (293 * 907)), # Input of kgCO2 / MMBtu
-    "propane": (61.71 / (293 * 907)), # Input of kgCO2 / MMBtu
-    "hybrid_gas": (53 / (293 * 907)), # Same as natural_gas
-    "hybrid_npa": (61.71 / (293 * 907)), # Same as propane
-}
+# Identifies the parsing in Building._load_profile for the on-disk profile cache. Update this if
+# the parsing changes so that stale cache entries are not used
+CUSTOM_ENERGY_CACHE_SALT = (
+    "shift=-15T|totals|mapped-only|sparse|"
+    + json.dumps(CUSTOM_RESSTOCK_MAPPING, sort_keys=True)
+)
 
 
 class Building:
@@ -72,36 +70,67 @@ class Building:
         building_params (dict): Dict of input parameters for the building
         sim_settings (dict): Dict of simulation settings
 
+    Optional args:
+        load_store (LoadStore): Shared store for the building fuel profiles. If not provided, the
+            building creates its own store
+        profile_library (ProfileLibrary): Shared cache of parsed consumption profiles. If not
+            provided, profiles are parsed from file for each building
+        end_use_table (EndUseTable): Shared table of the building end uses. If not provided, the
+            building creates its own table
+        building_timeline (BuildingTimeline): Shared timeline table of the buildings. If provided,
+            the building is registered with it and its timelines are set when the table is
+            initialized with the other buildings. If not, the building computes its own
+
     Attributes:
         building_params (dict): Dict of input parameters for the building
         years_vec (List[int]): List of simulation years
         building_id (str): The building ID, also referred to as parcel ID
         retrofit_scenario (str): The energy intervention scenario
         end_uses (dict): Dict of building asset objects, organized by asset type
-        baseline_consumption (pd.DataFrame): Baseline energy consumption timeseries for the building
-        retrofit_consumption (pd.DataFrame): Retrofit energy consumption timeseries for the buliding
+        baseline_consumption (pd.DataFrame): Baseline energy consumption timeseries for the building,
+            before load scaling. Shared with the other buildings of the same archetype file
+        retrofit_consumption (pd.DataFrame): Retrofit energy consumption timeseries for the
+            building, before load scaling. Shared with the other buildings of the same archetype
+            file
+        load_scaling_factor (float): Factor applied to the consumption profiles when they are read
+        load_store (LoadStore): Store holding the total consumption profile by fuel for the building
+        load_index (int): Position of the building in the load store
+        end_use_table (EndUseTable): Table holding the cost vectors of the building end uses
+        building_timeline (BuildingTimeline): Shared timeline table of the buildings, if any
 
     Methods:
         populate_building (None): Executes downstream calculations for the building simulation
         calc_building_utility_costs (Dict[str, List[float]]): Returns dict of annual consumption costs by energy source
         write_building_cost_info (None): Write building cost information to a CSV
         write_building_energy_info (None): Write building energy timeseries to a CSV
+        release_consumption (None): Drop the consumption DataFrames once the building is populated
+        move_to_load_store (None): Copy the building fuel profiles into another load store
+        move_to_end_use_table (None): Register the building end uses with another end use table
     """
     def __init__(
             self,
             building_params: dict,
-            sim_settings: dict
+            sim_settings: dict,
+            load_store: LoadStore = None,
+            profile_library: ProfileLibrary = None,
+            end_use_table: EndUseTable = None,
+            building_timeline: BuildingTimeline = None
     ):
         self.building_params: dict = building_params
         self._sim_settings: dict = sim_settings
+        self.load_store: LoadStore = load_store
+        self._profile_library: ProfileLibrary = profile_library
+        self.load_index: int = None
+        self.end_use_table: EndUseTable = end_use_table
+        self.building_timeline: BuildingTimeline = building_timeline
 
-        self._year_timestamps: pd.DatetimeIndex = None
         self.years_vec: List[int] = []
         self.building_id: str = ""
         self.retrofit_scenario: str = ""
         self.end_uses: dict = {}
         self.baseline_consumption: pd.DataFrame = pd.DataFrame()
         self.retrofit_consumption: pd.DataFrame = pd.DataFrame()
+        self.load_scaling_factor: float = 1.
         self._retrofit_vec: List[bool] = []
         self._is_retrofit_vec: List[bool] = []
         self._annual_energy_by_fuel: Dict[str, List[float]] = {}
@@ -124,15 +153,14 @@ class Building:
         self.retrofit_scenario = self._get_retrofit_scenario()
         self._get_building_energies()
         self._create_end_uses()
-        self._calc_total_energy_baseline()
-        self._calc_total_energy_retrofit()
-        self._retrofit_vec = self._get_replacement_vec()
-        self._is_retrofit_vec = self._get_is_retrofit_vec()
-        self._annual_energy_by_fuel = self._calc_annual_energy_consump()
-        self._building_annual_costs_other = self._calc_building_costs()
-        self._fuel_type = self._get_fuel_type_vec()
-        self._methane_leaks = self._get_methane_leaks()
-        self._combustion_emissions = self._get_combustion_emissions()
+        self._register_loads()
+
+        # Retrofit, fuel, leak, consumption and emissions timelines are rows of a BuildingTimeline
+        if self.building_timeline is not None:
+            self.building_timeline.add_building(self)
+
+        else:
+            BuildingTimeline([self]).initialize_buildings()
 
     def _get_years_vec(self) -> None:
         """
@@ -143,10 +171,6 @@ class Building:
             self._sim_settings.get("sim_end_year", 2050)
         ))
 
-        self._year_timestamps = pd.date_range(
-            start="2018-01-01", end="2019-01-01", freq="H", inclusive="left"
-        )
-
     def _get_building_id(self) -> None:
         self.building_id = self.building_params.get("building_id")
 
@@ -161,21 +185,48 @@ class Building:
         reference_consump_filepath = self.building_params.get("reference_consump_filepath")
         retrofit_consump_filepath = self.building_params.get("retrofit_consump_filepath")
 
-        self.baseline_consumption = self._load_custom_energy(reference_consump_filepath)
-        self.retrofit_consumption = self._load_custom_energy(retrofit_consump_filepath)
+        # Profiles are kept unscaled, so buildings of the same archetype share them. The load
+        # scaling factor is applied when the profiles are read
+        if self._profile_library is not None:
+            self.baseline_consumption = self._profile_library.get(
+                reference_consump_filepath, self._load_profile, CUSTOM_ENERGY_CACHE_SALT
+            )
+            self.retrofit_consumption = self._profile_library.get(
+                retrofit_consump_filepath, self._load_profile, CUSTOM_ENERGY_CACHE_SALT
+            )
+
+        else:
+            self.baseline_consumption = self._load_profile(reference_consump_filepath)
+            self.retrofit_consumption = self._load_profile(retrofit_consump_filepath)
 
-        load_scaling_factor = self.building_params.get("load_scaling_factor", 1)
-        self.baseline_consumption[
-            self.baseline_consumption.select_dtypes(include=["number"]).columns
-        ]  *= load_scaling_factor
+        self.load_scaling_factor = self.building_params.get("load_scaling_factor", 1)
 
-        self.retrofit_consumption[
-            self.retrofit_consumption.select_dtypes(include=["number"]).columns
-        ] *= load_scaling_factor
+    @staticmethod
+    def _load_profile(consump_filepath: str) -> pd.DataFrame:
+        """
+        Parse a consumption profile, drop its all-zero columns, and add its totals by fuel
+        """
+        return Building._add_total_consumption(
+            Building._drop_zero_columns(Building._load_custom_energy(consump_filepath))
+        )
 
     @staticmethod
     def _load_custom_energy(consump_filepath: str) -> pd.DataFrame:
-        consump_df = pd.read_csv(consump_filepath).set_index("timestamp")
+        """
+        Parse a consumption profile. Profiles on the fixed 15-minute grid of one year are read
+        without parsing their timestamps; others are parsed in full. Only the mapped consumption
+        columns are read
+        """
+        consump_df = read_fixed_grid_profile(consump_filepath, CUSTOM_RESSTOCK_MAPPING)
+        if consump_df is not None:
+            return consump_df
+
+        consump_df = pd.read_csv(
+            consump_filepath,
+            usecols=lambda column: (
+                column == TIMESTAMP_COLUMN or is_profile_column(column, CUSTOM_RESSTOCK_MAPPING)
+            )
+        ).set_index(TIMESTAMP_COLUMN)
         consump_df.index = pd.to_datetime(consump_df.index)
         consump_df.index = consump_df.index.shift(-1, "15T")
         consump_df = consump_df.rename(mapper=CUSTOM_RESSTOCK_MAPPING, axis=1)
@@ -192,19 +243,15 @@ class Building:
         cost_original_filepath = self.building_params.get("original_asset_cost_filepath")
         cost_retrofit_filepath = self.building_params.get("retrofit_asset_cost_filepath")
 
-        costs_original = pd.read_csv(
-            cost_original_filepath,
-            index_col="building_id"
-        ).to_dict(orient="index")
-
-        costs_retrofit = pd.read_csv(
-            cost_retrofit_filepath,
-            index_col="building_id"
-        ).to_dict(orient="index")
+        costs_original = REFERENCE_DATA.get_building_costs(cost_original_filepath)
+        costs_retrofit = REFERENCE_DATA.get_building_costs(cost_retrofit_filepath)
 
         building_costs_original = costs_original.get(self.building_id)
         building_costs_retrofit = costs_retrofit.get(self.building_id)
 
+        if self.end_use_table is None:
+            self.end_use_table = EndUseTable()
+
         for end_use in end_use_params:
             end_use_type = end_use.get("end_use")
 
@@ -219,6 +266,9 @@ class Building:
                 self.years_vec,
                 self.baseline_consumption,
                 self.retrofit_consumption,
+                end_use_table=self.end_use_table,
+                building_id=self.building_id,
+                load_scaling_factor=self.load_scaling_factor,
                 **params
             )
 
@@ -231,6 +281,9 @@ class Building:
                 self.years_vec,
                 self.baseline_consumption,
                 self.retrofit_consumption,
+                end_use_table=self.end_use_table,
+                building_id=self.building_id,
+                load_scaling_factor=self.load_scaling_factor,
                 **params,
             )
 
@@ -243,6 +296,9 @@ class Building:
                 self.years_vec,
                 self.baseline_consumption,
                 self.retrofit_consumption,
+                end_use_table=self.end_use_table,
+                building_id=self.building_id,
+                load_scaling_factor=self.load_scaling_factor,
                 **params
             )
 
@@ -255,6 +311,9 @@ class Building:
                 self.years_vec,
                 self.baseline_consumption,
                 self.retrofit_consumption,
+                end_use_table=self.end_use_table,
+                building_id=self.building_id,
+                load_scaling_factor=self.load_scaling_factor,
                 **params
             )
 
@@ -264,195 +323,180 @@ class Building:
 
         return None
     
-    def _calc_total_energy_baseline(self) -> None:
+    @staticmethod
+    def _drop_zero_columns(consump_df: pd.DataFrame) -> pd.DataFrame:
         """
-        Calculate the total baseline consumption for the building. Contains logic for direct
-        connection to ResStock or overwrite using locally-provided energy consumption profiles
+        Drop the consumption columns that are zero in every interval. Absent columns read as zeros
+        everywhere downstream: end uses share a zero profile and fuel totals leave them out
         """
-        if self.building_params.get("resstock_overwrite"):
-            self._calc_total_custom_baseline()
+        is_nonzero = (consump_df != 0).any()
+        if is_nonzero.all():
+            return consump_df
+
+        return consump_df.loc[:, is_nonzero]
 
-    def _calc_total_custom_baseline(self) -> None:
+    @staticmethod
+    def _add_total_consumption(consump_df: pd.DataFrame) -> pd.DataFrame:
         """
-        Calculate the baseline energy consumption using custom input energy consumption profiles
+        Add the total consumption by fuel, and over all fuels, to a parsed consumption profile.
+        Fuels without any consumption column get no total column, and are zeros in the load store
         """
-        for fuel in ["electricity", "natural_gas", "propane", "fuel_oil"]:
+        total_cols = []
+        for fuel in FUELS:
             filter_cols = [
                 col
-                for col in self.baseline_consumption
+                for col in consump_df
                 if col.startswith("out.{}".format(fuel))
             ]
 
-            self.baseline_consumption["out.{}.total.energy_consumption".format(fuel)] = \
-                self.baseline_consumption[filter_cols].sum(axis=1)
-            
-        self.baseline_consumption["out.total.energy_consumption"] = self.baseline_consumption[[
-            "out.{}.total.energy_consumption".format(i)
-            for i in ["electricity", "natural_gas", "propane", "fuel_oil"]
-        ]].sum(axis=1)
-   
-    def _calc_total_energy_retrofit(self) -> None:
-        if self.building_params.get("resstock_overwrite"):
-            self._calc_total_custom_retrofit()
+            if not filter_cols:
+                continue
 
-    def _calc_total_custom_retrofit(self) -> None:
-        for fuel in ["electricity", "natural_gas", "propane", "fuel_oil"]:
-            filter_cols = [
-                col
-                for col in self.retrofit_consumption
-                if col.startswith("out.{}".format(fuel))
-            ]
+            consump_df["out.{}.total.energy_consumption".format(fuel)] = \
+                consump_df[filter_cols].sum(axis=1)
+            total_cols.append("out.{}.total.energy_consumption".format(fuel))
 
-            self.retrofit_consumption["out.{}.total.energy_consumption".format(fuel)] = \
-                self.retrofit_consumption[filter_cols].sum(axis=1)
-            
-        self.retrofit_consumption["out.total.energy_consumption"] = self.retrofit_consumption[[
-            "out.{}.total.energy_consumption".format(i)
-            for i in ["electricity", "natural_gas", "propane", "fuel_oil"]
-        ]].sum(axis=1)
+        consump_df["out.total.energy_consumption"] = consump_df[total_cols].sum(axis=1)
 
-    def _calc_building_costs(self) -> List[float]:
-        """
-        Calculate building-level costs
-        """
-        building_level_costs = self.building_params.get("building_level_costs", {})
-        retrofit_adders = building_level_costs.get("retrofit_adder", {})
-        retrofit_size = self.building_params.get("retrofit_size", "")
-        retrofit_adder = retrofit_adders.get(retrofit_size.lower(), 0)
-
-        return np.multiply(retrofit_adder, self._retrofit_vec).tolist()
+        return consump_df
 
-    def _get_replacement_vec(self) -> List[bool]:
-        """
-        The replacement vector is a vector of True when the index is the retrofit year, False o/w
-        """
-        replacement_year = self.building_params.get("retrofit_year", self.years_vec[-1])
-        return [True if i==replacement_year else False for i in self.years_vec]
-    
-    def _get_is_retrofit_vec(self) -> List[bool]:
+    def _register_loads(self) -> None:
         """
-        Derived from the retrofit vec; =True in years including and after the retrofit, 0 o/w
+        Register the total consumption profile by fuel with the load store
         """
-        return [max(self._retrofit_vec[:i]) for i in range(1, len(self._retrofit_vec) + 1)]
-    
-    def _calc_annual_energy_consump(self) -> Dict[str, List[float]]:
-        """
-        Calculate the total annual energy consumption, by energy type
-        """
-        annual_energy_use = {
-            "electricity": [],
-            "natural_gas": [],
-            "propane": [],
-            "fuel_oil": [],
-        }
+        if self.baseline_consumption.empty or self.retrofit_consumption.empty:
+            return
 
-        for fuel in ["electricity", "natural_gas", "propane", "fuel_oil"]:
-            for replaced in self._is_retrofit_vec:
-                if replaced:
-                    annual_use = self.retrofit_consumption[
-                        "out.{}.total.energy_consumption".format(fuel)
-                    ]
+        if self.load_store is None:
+            self.load_store = LoadStore(capacity=2)
 
-                else:
-                    annual_use = self.baseline_consumption[
-                        "out.{}.total.energy_consumption".format(fuel)
-                    ]
+        # Profiles are aligned to the positional time axis once, here. Baseline and retrofit
+        # profiles are matched by position, whatever their timestamps
+        intervals_per_hour = get_intervals_per_hour(self.baseline_consumption.index)
 
-                annual_use = annual_use.resample("AS").sum().values[0]
-                annual_energy_use[fuel].append(annual_use)
+        if len(self.retrofit_consumption) != len(self.baseline_consumption):
+            raise ValueError(
+                f"Building {self.building_id} has {len(self.baseline_consumption)} baseline and "
+                f"{len(self.retrofit_consumption)} retrofit profile intervals."
+            )
 
-        return annual_energy_use
+        # Profiles are keyed by their source file, so each archetype is held once by the store
+        profile_rows = []
+        for consumption, filepath_key in [
+            (self.baseline_consumption, "reference_consump_filepath"),
+            (self.retrofit_consumption, "retrofit_consump_filepath"),
+        ]:
+            key = self.building_params.get(filepath_key)
+            row = self.load_store.get_profile_row(key) if key else None
+
+            if row is None:
+                # Fuels without a total column are all zeros and are left out of the profile. A
+                # profile with no fuel at all still registers every fuel, so its length is known
+                fuels = [
+                    fuel
+                    for fuel in FUELS
+                    if "out.{}.total.energy_consumption".format(fuel) in consumption
+                ] or FUELS
+                columns = ["out.{}.total.energy_consumption".format(fuel) for fuel in fuels]
+
+                row = self.load_store.add_profile(
+                    dict(zip(fuels, to_positional(consumption, columns, intervals_per_hour))),
+                    intervals_per_hour=intervals_per_hour,
+                    key=key,
+                )
+
+            profile_rows.append(row)
+
+        self.load_index = self.load_store.add_building(
+            self.building_id,
+            *profile_rows,
+            intervals_per_hour=intervals_per_hour,
+            scale=self.load_scaling_factor,
+        )
 
     def calc_building_utility_costs(self) -> Dict[str, List[float]]:
         """
         Calculate the utility billing metrics for the building, based on total energy consumption
         """
         energy_consump_cost_filepath = self.building_params.get("consump_costs_filepath")
-        consump_rates = pd.read_csv(energy_consump_cost_filepath, index_col=0)
-
-        annual_utility_costs = {
-            "electricity": [],
-            "natural_gas": [],
-            "propane": [],
-            "fuel_oil": [],
-        }
-
-        for fuel in ["electricity", "natural_gas", "propane", "fuel_oil"]:
-            for replaced, rate in zip(self._is_retrofit_vec, consump_rates[fuel].to_list()):
-                if replaced:
-                    annual_use = self.retrofit_consumption[
-                        "out.{}.total.energy_consumption".format(fuel)
-                    ]
+        consump_rates = REFERENCE_DATA.get_consumption_rates(energy_consump_cost_filepath)
 
-                else:
-                    annual_use = self.baseline_consumption[
-                        "out.{}.total.energy_consumption".format(fuel)
-                    ]
+        annual_utility_costs = {}
+        for fuel in FUELS:
+            annual_use = np.asarray(self._annual_energy_by_fuel[fuel])
+            rates = consump_rates[fuel]
 
-                annual_use = annual_use.resample("AS").sum().values[0]
-
-                annual_utility_costs[fuel].append(annual_use * rate)
+            # Costs cover the years with both consumption and a rate
+            n_years = min(len(annual_use), len(rates))
+            annual_utility_costs[fuel] = (annual_use[:n_years] * rates[:n_years]).tolist()
 
         return annual_utility_costs
     
-    def _get_fuel_type_vec(self) -> List[str]:
-        """
-        Fuel type vector of dominant fuel in building. Based on inputs original_fuel_type and
-        retrofit_fuel_type
+    def release_consumption(self) -> None:
         """
-        original_fuel = self.building_params.get("original_fuel_type", None)
-        retrofit_fuel = self.building_params.get("retrofit_fuel_type", None)
-
-        fuel_mappings = {
-            "natural_gas": "GAS",
-            "fuel_oil": "OIL",
-            "electricity": "ELEC",
-            "propane": "LPG",
-            "hybrid_gas": "HPL",
-            "hybrid_npa": "NPH",
-        }
+        Drop the consumption DataFrames of the building and its end uses. Annual values and the fuel
+        profiles in the load store are kept, so the building stays usable by meters and outputs
 
-        return [
-            fuel_mappings.get(retrofit_fuel) if i
-            else fuel_mappings.get(original_fuel)
-            for i in self._is_retrofit_vec
-        ]
+        Args:
+            None
 
-    def _get_methane_leaks(self) -> List[str]:
-        """
-        Get (hardcoded) methane leaks in the building annually
+        Returns:
+            None
         """
-        return [
-            METHANE_LEAKS.get(i, 0)
-            for i in self._fuel_type
-        ]
-    
-    def _get_combustion_emissions(self) -> List[str]:
+        self.baseline_consumption = pd.DataFrame()
+        self.retrofit_consumption = pd.DataFrame()
+
+        for end_use in self.end_uses.values():
+            if end_use:
+                end_use.release_energy_use()
+
+    def move_to_load_store(self, load_store: LoadStore) -> None:
         """
-        Combustion emissions from energy consumption
+        Copy the building fuel profiles into another load store and index into it from then on.
+        Profiles already held by the destination under the same key are shared rather than copied
+
+        Args:
+            load_store (LoadStore): The destination load store
+
+        Returns:
+            None
         """
-        combusion_emissions = {}
+        if self.load_index is not None:
+            profile_rows = []
+            for state in [BASELINE, RETROFIT]:
+                row = self.load_store.get_building_profile_row(self.load_index, state)
+
+                profile_rows.append(load_store.add_profile(
+                    dict(zip(FUELS, self.load_store.profiles[row])),
+                    intervals_per_hour=self.load_store.intervals_per_hour,
+                    key=self.load_store.get_profile_key(row),
+                ))
+
+            self.load_index = load_store.add_building(
+                self.building_id,
+                *profile_rows,
+                intervals_per_hour=self.load_store.intervals_per_hour,
+                scale=self.load_store.get_scale(self.load_index),
+            )
 
-        for fuel in ["electricity", "natural_gas", "propane", "fuel_oil"]:
-            annual_fuel_consump = self._annual_energy_by_fuel[fuel]
-            emissions_factor = EMISSION_FACTORS.get(fuel, 0)
+        self.load_store = load_store
 
-            if fuel == "electricity":
-                emissions_factor = np.zeros(len(self.years_vec))
-                for i in range(len(self.years_vec)):
-                    year = self.years_vec[i]
-                    if year < 2024:
-                        emissions_factor[i] = EMISSION_FACTORS.get(fuel, 0)
+    def move_to_end_use_table(self, end_use_table: EndUseTable) -> None:
+        """
+        Register the building end uses with another end use table and read their cost vectors from
+        there
 
-                    else:
-                        emissions_factor[i] = emissions_factor[i-1] * (1 - 0.03)
+        Args:
+            end_use_table (EndUseTable): The destination end use table
 
-            combusion_emissions[fuel] = (
-                np.array(annual_fuel_consump)
-                * emissions_factor
-            ).tolist()
+        Returns:
+            None
+        """
+        for end_use in self.end_uses.values():
+            if end_use:
+                end_use.move_to_end_use_table(end_use_table)
 
-        return combusion_emissions
+        self.end_use_table = end_use_table
 
     def write_building_energy_info(self, freq: int=60) -> None:
         """
@@ -479,13 +523,27 @@ class Building:
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-        self.baseline_consumption.resample(resample_string).sum().to_csv(
-            "./outputs/{}_baseline_consump.csv".format(self.building_id)
-        )
+        self._get_scaled_consumption(self.baseline_consumption).resample(
+            resample_string
+        ).sum().to_csv("./outputs/{}_baseline_consump.csv".format(self.building_id))
 
-        self.retrofit_consumption.resample(resample_string).sum().to_csv(
-            "./outputs/{}_retrofit_consump.csv".format(self.building_id)
-        )
+        self._get_scaled_consumption(self.retrofit_consumption).resample(
+            resample_string
+        ).sum().to_csv("./outputs/{}_retrofit_consump.csv".format(self.building_id))
+
+    def _get_scaled_consumption(self, consumption: pd.DataFrame) -> pd.DataFrame:
+        """
+        Copy of a consumption profile with the load scaling factor applied to its numeric columns
+        """
+        if self.load_scaling_factor == 1:
+            return consumption
+
+        scaled_consumption = consumption.copy()
+        scaled_consumption[
+            scaled_consumption.select_dtypes(include=["number"]).columns
+        ] *= self.load_scaling_factor
+
+        return scaled_consumption
 
     def write_building_cost_info(self) -> None:
         """
@@ -509,56 +567,29 @@ class Building:
 
         cost_table.to_csv("./outputs/{}_costs.csv".format(self.building_id))
 
-    def _get_retrofit_cost_vec(self) -> List[float]:
+    def _get_end_use_totals(self, name: str) -> List[float]:
         """
-        Sum replacement_cost vec from each asset to get total
+        Sum a cost vector over the end uses of the building, from the end use table
         """
-        replacement_costs = pd.DataFrame(index=self.years_vec)
+        if self.end_use_table is None:
+            return [0.] * len(self.years_vec)
 
-        for asset_type in ["stove", "clothes_dryer", "domestic_hot_water", "hvac"]:
-            asset = self.end_uses.get(asset_type)
+        return self.end_use_table.get_building_totals(name, self.building_id).tolist()
 
-            if asset:
-                replacement_cost = asset.replacement_cost
-                replacement_costs[asset_type] = replacement_cost
+    def _get_retrofit_cost_vec(self) -> List[float]:
+        """
+        Sum replacement_cost vec from each asset to get total
+        """
+        return self._get_end_use_totals("replacement_cost")
 
-        return replacement_costs.sum(axis=1).to_list()
-    
     def _get_retrofit_book_value_vec(self) -> List[float]:
         """
         Sum replacement_book_val vec
         """
-        replacement_costs = pd.DataFrame(index=self.years_vec)
+        return self._get_end_use_totals("replacement_book_val")
 
-        for asset_type in ["stove", "clothes_dryer", "domestic_hot_water", "hvac"]:
-            asset = self.end_uses.get(asset_type)
-
-            if asset:
-                replacement_cost = asset.replacement_book_val
-                replacement_costs[asset_type] = replacement_cost
-
-        return replacement_costs.sum(axis=1).to_list()
-    
     def _get_exising_book_val_vec(self) -> List[float]:
-        existing_book_val = pd.DataFrame(index=self.years_vec)
+        return self._get_end_use_totals("existing_book_val")
 
-        for asset_type in ["stove", "clothes_dryer", "domestic_hot_water", "hvac"]:
-            asset = self.end_uses.get(asset_type)
-
-            if asset:
-                book_val = asset.existing_book_val
-                existing_book_val[asset_type] = book_val
-
-        return existing_book_val.sum(axis=1).to_list()
-    
     def _get_exising_stranded_val_vec(self) -> List[float]:
-        existing_stranded = pd.DataFrame(index=self.years_vec)
-
-        for asset_type in ["stove", "clothes_dryer", "domestic_hot_water", "hvac"]:
-            asset = self.end_uses.get(asset_type)
-
-            if asset:
-                book_val = asset.existing_stranded_val
-                existing_stranded[asset_type] = book_val
-
-        return existing_stranded.sum(axis=1).to_list()
+        return self._get_end_use_totals("existing_stranded_val")
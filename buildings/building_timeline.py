@@ -0,0 +1,265 @@
+"""
+Array-backed table of the annual timelines of every building: retrofit year, fuel type, methane
+leaks, energy consumption and combustion emissions, computed for all buildings at once
+"""
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from loads.load_store import BASELINE, FUEL_INDEX, FUELS, RETROFIT
+
+
+FUEL_TYPE_LABELS = {
+    "natural_gas": "GAS",
+    "fuel_oil": "OIL",
+    "electricity": "ELEC",
+    "propane": "LPG",
+    "hybrid_gas": "HPL",
+    "hybrid_npa": "NPH",
+}
+
+METHANE_LEAKS = {
+    "GAS": 2,
+    "HPL": 1,
+}
+
+#TODO: Make configurable for different geographies
+EMISSION_FACTORS = { # tCO2 / kWh
+    "natural_gas": (53 / (293 * 907)), # Input of kgCO2 / MMBtu
+    "electricity": 0.45 / 1000, # Input of tCO2 / MWh
+    "fuel_oil": (73.96 / (293 * 907)), # Input of kgCO2 / MMBtu
+    "propane": (61.71 / (293 * 907)), # Input of kgCO2 / MMBtu
+    "hybrid_gas": (53 / (293 * 907)), # Same as natural_gas
+    "hybrid_npa": (61.71 / (293 * 907)), # Same as propane
+}
+
+# The electricity emissions factor decays every year from this year on
+ELEC_EMISSIONS_DECAY_YEAR = 2024
+ELEC_EMISSIONS_DECAY_RATE = 0.03
+
+# Fuel type codes index FUEL_TYPES. Code 0 is a building without a known fuel
+FUEL_TYPES = np.array([None, *FUEL_TYPE_LABELS.values()], dtype=object)
+FUEL_TYPE_CODES = {fuel: code for code, fuel in enumerate(FUEL_TYPE_LABELS, start=1)}
+FUEL_TYPE_LEAKS = np.array([METHANE_LEAKS.get(fuel_type, 0) for fuel_type in FUEL_TYPES])
+
+# Read-only emissions factors shared by every building, by simulation years
+_EMISSIONS_FACTORS: Dict[Tuple[int, ...], np.ndarray] = {}
+
+
+def get_emissions_factors(years_vec: List[int]) -> np.ndarray:
+    """
+    Combustion emissions factor of each fuel in each simulation year, shared by every building.
+    The electricity factor decays from ELEC_EMISSIONS_DECAY_YEAR on
+
+    Args:
+        years_vec (List[int]): The simulation years
+
+    Returns:
+        np.ndarray: The emissions factors, shape (len(FUELS), years), in the order of FUELS
+    """
+    key = tuple(years_vec)
+
+    if key not in _EMISSIONS_FACTORS:
+        emissions_factors = np.array([
+            np.full(len(years_vec), EMISSION_FACTORS.get(fuel, 0.)) for fuel in FUELS
+        ])
+
+        # Each year from the decay year on decays from the previous one, as a running product of
+        # the factor of the first year. A decay from the first year on has no previous year and
+        # starts from 0
+        is_decay = np.asarray(years_vec) >= ELEC_EMISSIONS_DECAY_YEAR
+        decay = np.where(is_decay, 1 - ELEC_EMISSIONS_DECAY_RATE, 1.)
+        if len(decay):
+            decay[0] = 0. if is_decay[0] else EMISSION_FACTORS["electricity"]
+
+        emissions_factors[FUEL_INDEX["electricity"]] = np.cumprod(decay)
+        emissions_factors.flags.writeable = False
+        _EMISSIONS_FACTORS[key] = emissions_factors
+
+    return _EMISSIONS_FACTORS[key]
+
+
+class BuildingTimeline:
+    """
+    Holds the buildings of a scenario as arrays, one row per building: retrofit year, original and
+    retrofit fuel, retrofit adder, and annual consumption by fuel before and after the retrofit.
+    The timelines of every building are computed at once as (buildings x years) matrices
+
+    Optional args:
+        buildings (List[Building]): The buildings of the table. More can be added
+
+    Attributes:
+        buildings (List[Building]): The buildings of the table
+        years_vec (List[int]): The simulation years, shared by all buildings
+        retrofit_vec (np.ndarray): True in the retrofit year, shape (buildings, years)
+        is_retrofit_vec (np.ndarray): True from the retrofit year on, shape (buildings, years)
+        fuel_type_code (np.ndarray): Index of the fuel type in FUEL_TYPES, shape (buildings, years)
+        fuel_type (np.ndarray): Fuel type labels, shape (buildings, years)
+        methane_leaks (np.ndarray): Methane leaks, shape (buildings, years)
+        building_costs (np.ndarray): Building-level retrofit costs, shape (buildings, years)
+        annual_energy_by_fuel (Dict[str, np.ndarray]): Annual consumption, shape
+            (buildings, years), by fuel
+        combustion_emissions (Dict[str, np.ndarray]): Combustion emissions, shape
+            (buildings, years), by fuel
+
+    Methods:
+        add_building (int): Register a populated building and return its row
+        initialize_buildings (None): Compute the timelines and set them on the buildings
+    """
+    def __init__(self, buildings: list = None):
+        self.buildings: list = []
+        self.years_vec: List[int] = None
+
+        self.retrofit_vec: np.ndarray = None
+        self.is_retrofit_vec: np.ndarray = None
+        self.fuel_type_code: np.ndarray = None
+        self.fuel_type: np.ndarray = None
+        self.methane_leaks: np.ndarray = None
+        self.building_costs: np.ndarray = None
+        self.annual_energy_by_fuel: Dict[str, np.ndarray] = {}
+        self.combustion_emissions: Dict[str, np.ndarray] = {}
+
+        for building in buildings or []:
+            self.add_building(building)
+
+    def __len__(self) -> int:
+        return len(self.buildings)
+
+    def add_building(self, building) -> int:
+        """
+        Register a building whose loads are registered with its load store
+
+        Args:
+            building (Building): The building
+
+        Returns:
+            int: The row of the building in the table
+        """
+        if self.years_vec is None:
+            self.years_vec = list(building.years_vec)
+
+        if list(building.years_vec) != self.years_vec:
+            raise ValueError(
+                f"Building {building.building_id} has different simulation years than the other "
+                "buildings of the timeline."
+            )
+
+        self.buildings.append(building)
+
+        return len(self.buildings) - 1
+
+    def initialize_buildings(self) -> None:
+        """
+        Compute the timelines of every building and set them on the buildings as read-only rows of
+        the table
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if not self.buildings:
+            return
+
+        years = np.asarray(self.years_vec)
+
+        # A building without a retrofit year is retrofitted in the last simulation year. A null
+        # retrofit year is NaN, which never matches a simulation year
+        retrofit_year = np.array([
+            building.building_params.get("retrofit_year", self.years_vec[-1])
+            for building in self.buildings
+        ], dtype=float)
+
+        self.retrofit_vec = years[None, :] == retrofit_year[:, None]
+        self.is_retrofit_vec = np.logical_or.accumulate(self.retrofit_vec, axis=1)
+
+        self.fuel_type_code = np.where(
+            self.is_retrofit_vec,
+            self._get_fuel_type_codes("retrofit_fuel_type")[:, None],
+            self._get_fuel_type_codes("original_fuel_type")[:, None]
+        ).astype(np.int8)
+        self.fuel_type = FUEL_TYPES[self.fuel_type_code]
+        self.methane_leaks = FUEL_TYPE_LEAKS[self.fuel_type_code]
+
+        self.building_costs = self._get_retrofit_adders()[:, None] * self.retrofit_vec
+
+        emissions_factors = get_emissions_factors(self.years_vec)
+        totals = self._get_annual_totals()
+
+        for fuel_idx, fuel in enumerate(FUELS):
+            self.annual_energy_by_fuel[fuel] = np.where(
+                self.is_retrofit_vec,
+                totals[RETROFIT, fuel_idx][:, None],
+                totals[BASELINE, fuel_idx][:, None]
+            )
+            self.combustion_emissions[fuel] = (
+                self.annual_energy_by_fuel[fuel] * emissions_factors[fuel_idx]
+            )
+
+        for values in [
+            self.retrofit_vec, self.is_retrofit_vec, self.fuel_type_code, self.fuel_type,
+            self.methane_leaks, self.building_costs,
+            *self.annual_energy_by_fuel.values(), *self.combustion_emissions.values()
+        ]:
+            values.flags.writeable = False
+
+        for row, building in enumerate(self.buildings):
+            building._retrofit_vec = self.retrofit_vec[row]
+            building._is_retrofit_vec = self.is_retrofit_vec[row]
+            building._annual_energy_by_fuel = {
+                fuel: values[row] for fuel, values in self.annual_energy_by_fuel.items()
+            }
+            building._building_annual_costs_other = self.building_costs[row]
+            building._fuel_type = self.fuel_type[row]
+            building._methane_leaks = self.methane_leaks[row]
+            building._combustion_emissions = {
+                fuel: values[row] for fuel, values in self.combustion_emissions.items()
+            }
+
+    def _get_fuel_type_codes(self, param: str) -> np.ndarray:
+        return np.array([
+            FUEL_TYPE_CODES.get(building.building_params.get(param), 0)
+            for building in self.buildings
+        ], dtype=np.int8)
+
+    def _get_retrofit_adders(self) -> np.ndarray:
+        adders = []
+        for building in self.buildings:
+            building_level_costs = building.building_params.get("building_level_costs", {})
+            retrofit_size = building.building_params.get("retrofit_size", "")
+
+            adders.append(
+                building_level_costs.get("retrofit_adder", {}).get(retrofit_size.lower(), 0)
+            )
+
+        return np.array(adders)
+
+    def _get_annual_totals(self) -> np.ndarray:
+        """
+        Scaled annual consumption of each building before and after the retrofit, read from the
+        cached totals of the load stores of the buildings, shape (2, len(FUELS), buildings)
+        """
+        totals = np.zeros((2, len(FUELS), len(self.buildings)))
+
+        load_stores = {id(building.load_store): building.load_store for building in self.buildings}
+        for load_store in load_stores.values():
+            if load_store is None:
+                continue
+
+            rows = np.array([
+                row for row, building in enumerate(self.buildings)
+                if building.load_store is load_store
+            ])
+            load_index = np.array([self.buildings[row].load_index for row in rows])
+
+            profile_rows = load_store.profile_rows[load_index]
+            scales = load_store.scales[load_index]
+
+            for fuel_idx, fuel in enumerate(FUELS):
+                fuel_totals = load_store.get_totals(fuel)
+
+                for state in [BASELINE, RETROFIT]:
+                    totals[state, fuel_idx, rows] = fuel_totals[profile_rows[:, state]] * scales
+
+        return totals
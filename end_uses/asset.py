@@ -6,6 +6,9 @@ from typing import List
 import numpy as np
 import pandas as pd
 
+from end_uses.asset_table import AssetTable
+from loads.time_axis import YEAR_TIMESTAMPS
+
 
 class Asset:
     """
@@ -29,21 +32,27 @@ class Asset:
         sim_start_year (int): The simulation start year
         sim_end_year (int): The simulation end year (exclusive)
         years_vector (list): List of all years for the simulation
-        year_timestamps (pd.DatetimeIndex): DatetimeIndex of hourly timestamps for a full year
-        operational_vector (list): Boolean vals for years of the simulation when asset in operation
-        retrofit_vector (list): Indicates that the asset has been retrofit; 1 for the retrofit year
-            and all following years, 0 o/w
-        replacement_vector (list): Indicates when the asset is retrofit; 1 in the retrofit year, 0 o/w
-        install_cost (list): Install cost during the simulation years
-        depreciation (list): Depreciated val during the simulation years
+        year_timestamps (pd.DatetimeIndex): Hourly timestamps of the reference year, shared by all
+            assets
+        operational_vector (np.ndarray): int8 vals for years of the simulation when asset in
+            operation
+        retrofit_vector (np.ndarray): Indicates that the asset has been retrofit; 1 for the retrofit
+            year and all following years, 0 o/w
+        replacement_vector (np.ndarray): Indicates when the asset is retrofit; True in the retrofit
+            year, False o/w
+        install_cost (np.ndarray): Install cost during the simulation years
+        depreciation (np.ndarray): Depreciated val during the simulation years
             (val is depreciated val at beginning of each year)
-        stranded_value (list): Stranded asset val for early replacement during the simulation years
-            (equal to the depreciated val at the replacement year)
+        stranded_value (np.ndarray): Stranded asset val for early replacement during the simulation
+            years (equal to the depreciated val at the replacement year)
 
     Methods:
-        initialize_end_use (None): Initializes the asset by calculating all derived variables
+        initialize_end_use (None): Initializes the asset by calculating all derived variables. The
+            lifecycle vectors are rows of an AssetTable, computed for this asset alone unless the
+            asset was just initialized in a table with other assets
         get_years_vector (list): Returns list of all simulation years
-        get_year_timestamps (pd.DatetimeIndex): Returns hourly timestamps for a full year
+        get_year_timestamps (pd.DatetimeIndex): Returns the shared hourly timestamps of the
+            reference year
         get_operational_vector (list): Returns list of 1 if asset in use that year, 0 o/w
         get_retrofit_vector (list): Return the asset retrofit_vector
         get_install_cost (list): Return list with annual install cost
@@ -51,6 +60,13 @@ class Asset:
         get_stranded_value (list): Return stranded value of asset after replacement
     """
 
+    __slots__ = (
+        "install_year", "asset_cost", "replacement_year", "lifetime", "sim_start_year",
+        "sim_end_year", "years_vector", "year_timestamps", "operational_vector", "retrofit_vector",
+        "replacement_vector", "install_cost", "depreciation", "stranded_value",
+        "_table_initialized"
+    )
+
     def __init__(
         self,
         inst_date: str,
@@ -69,22 +85,27 @@ class Asset:
 
         self.years_vector: list = []
         self.year_timestamps: pd.DatetimeIndex = None
-        self.operational_vector: list = []
-        self.retrofit_vector: list = []
-        self.replacement_vector: list = []
-        self.install_cost: List[float] = []
-        self.depreciation: list = []
-        self.stranded_value: list = []
+        self.operational_vector: np.ndarray = np.zeros(0, dtype=np.int8)
+        self.retrofit_vector: np.ndarray = np.zeros(0, dtype=np.int8)
+        self.replacement_vector: np.ndarray = np.zeros(0, dtype=bool)
+        self.install_cost: np.ndarray = np.zeros(0)
+        self.depreciation: np.ndarray = np.zeros(0)
+        self.stranded_value: np.ndarray = np.zeros(0)
+
+        self._table_initialized: bool = False
 
     def initialize_end_use(self) -> None:
-        self.years_vector = self.get_years_vector()
-        self.year_timestamps = self.get_year_timestamps()
-        self.operational_vector = self.get_operational_vector()
-        self.retrofit_vector = self.get_retrofit_vector()
-        self.replacement_vector = self._get_replacement_vec()
-        self.install_cost = self.get_install_cost()
-        self.depreciation = self.get_depreciation()
-        self.stranded_value = self.get_stranded_value()
+        if not self._table_initialized:
+            AssetTable([self]).initialize_assets()
+
+        self._table_initialized = False
+
+    def _overrides(self, method: str) -> bool:
+        """
+        True if the class of the asset overrides the Asset method, which the AssetTable then calls
+        instead of computing the values of the asset with the other assets
+        """
+        return getattr(type(self), method) is not getattr(Asset, method)
 
     def get_years_vector(self) -> list:
         return [
@@ -93,9 +114,7 @@ class Asset:
         ]
 
     def get_year_timestamps(self) -> pd.DatetimeIndex:
-        return pd.date_range(
-            start="2018-01-01", end="2019-01-01", freq="H", inclusive="left"
-        )
+        return YEAR_TIMESTAMPS
 
     def get_operational_vector(self) -> list:
         """
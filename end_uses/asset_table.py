@@ -0,0 +1,151 @@
+"""
+Array-backed table of assets, with the lifecycle vectors of all assets computed at once
+"""
+from typing import List
+
+import numpy as np
+
+from loads.time_axis import YEAR_TIMESTAMPS
+
+
+# Lifecycle attributes in the order they are computed, with the Asset method that computes each
+# one for a single asset. Later attributes may depend on earlier ones
+LIFECYCLE = [
+    ("operational_vector", "get_operational_vector"),
+    ("retrofit_vector", "get_retrofit_vector"),
+    ("replacement_vector", "_get_replacement_vec"),
+    ("install_cost", "get_install_cost"),
+    ("depreciation", "get_depreciation"),
+    ("stranded_value", "get_stranded_value"),
+]
+
+
+class AssetTable:
+    """
+    Holds the assets of a simulation as arrays, one row per asset: install year, cost, lifetime,
+    and replacement year. The lifecycle vectors of every asset are computed at once as
+    (assets x years) matrices, with the same values as Asset.initialize_end_use. Assets whose
+    class overrides the method of a lifecycle attribute get that row from their own method
+
+    Args:
+        assets (List[Asset]): The assets, all with the same simulation years
+
+    Attributes:
+        assets (List[Asset]): The assets of the table
+        years_vector (List[int]): The simulation years, shared by all assets
+        install_year (np.ndarray): Install year of each asset
+        asset_cost (np.ndarray): Cost of each asset
+        lifetime (np.ndarray): Lifetime of each asset in years
+        replacement_year (np.ndarray): Replacement year of each asset
+        operational_vector (np.ndarray): Operational vectors, shape (assets, years)
+        retrofit_vector (np.ndarray): Retrofit vectors, shape (assets, years)
+        replacement_vector (np.ndarray): Replacement vectors, shape (assets, years)
+        install_cost (np.ndarray): Install costs, shape (assets, years)
+        depreciation (np.ndarray): Depreciated values, shape (assets, years)
+        stranded_value (np.ndarray): Stranded values, shape (assets, years)
+
+    Methods:
+        initialize_assets (None): Compute the lifecycle vectors and set them on the assets
+    """
+    def __init__(self, assets: list):
+        self.assets: list = assets
+        self.years_vector: List[int] = assets[0].get_years_vector() if assets else []
+
+        for asset in assets:
+            if asset.sim_start_year != assets[0].sim_start_year \
+                    or asset.sim_end_year != assets[0].sim_end_year:
+                raise ValueError("All assets of a table must have the same simulation years.")
+
+        self.install_year: np.ndarray = np.array(
+            [asset.install_year for asset in assets], dtype=int
+        )
+        self.asset_cost: np.ndarray = np.array([asset.asset_cost for asset in assets], dtype=float)
+        self.lifetime: np.ndarray = np.array([asset.lifetime for asset in assets], dtype=float)
+        self.replacement_year: np.ndarray = np.array(
+            [asset.replacement_year for asset in assets], dtype=int
+        )
+
+        self.operational_vector: np.ndarray = None
+        self.retrofit_vector: np.ndarray = None
+        self.replacement_vector: np.ndarray = None
+        self.install_cost: np.ndarray = None
+        self.depreciation: np.ndarray = None
+        self.stranded_value: np.ndarray = None
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+    def initialize_assets(self) -> None:
+        """
+        Compute the lifecycle vectors of every asset and set them on the assets as read-only rows
+        of the table
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        for asset in self.assets:
+            asset.years_vector = self.years_vector
+            asset.year_timestamps = YEAR_TIMESTAMPS
+
+        for attribute, method in LIFECYCLE:
+            values = getattr(self, f"_get_{attribute}")()
+
+            for row, asset in enumerate(self.assets):
+                if asset._overrides(method):
+                    values[row] = getattr(asset, method)()
+
+            values.flags.writeable = False
+            setattr(self, attribute, values)
+
+            for row, asset in enumerate(self.assets):
+                setattr(asset, attribute, values[row])
+
+        for asset in self.assets:
+            asset._table_initialized = True
+
+    def _get_year_offset(self) -> np.ndarray:
+        """
+        Years since install of each asset in each simulation year, shape (assets, years)
+        """
+        return np.asarray(self.years_vector)[None, :] - self.install_year[:, None]
+
+    def _get_operational_vector(self) -> np.ndarray:
+        years = np.asarray(self.years_vector)[None, :]
+
+        return (
+            (self.install_year[:, None] <= years) & (self.replacement_year[:, None] > years)
+        ).astype(np.int8)
+
+    def _get_retrofit_vector(self) -> np.ndarray:
+        return (1 - self.operational_vector).astype(np.int8)
+
+    def _get_replacement_vector(self) -> np.ndarray:
+        return np.asarray(self.years_vector)[None, :] == self.replacement_year[:, None]
+
+    def _get_install_cost(self) -> np.ndarray:
+        return np.where(self._get_year_offset() == 0, self.asset_cost[:, None], 0.)
+
+    def _get_depreciation(self) -> np.ndarray:
+        """
+        Straight line depreciation with no salvage value, from the install year until the end of
+        the lifetime or the replacement year, whichever is first
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            depreciation_rate = self.asset_cost / self.lifetime
+
+        operational_lifetime = np.minimum(
+            self.replacement_year - self.install_year, self.lifetime
+        )
+        year_offset = self._get_year_offset()
+
+        return np.where(
+            (year_offset >= 0) & (year_offset <= operational_lifetime[:, None]),
+            self.asset_cost[:, None] - depreciation_rate[:, None] * year_offset,
+            0.
+        )
+
+    def _get_stranded_value(self) -> np.ndarray:
+        return self.depreciation * self.replacement_vector
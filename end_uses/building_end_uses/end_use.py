@@ -0,0 +1,189 @@
+"""
+Parent class for the building end uses
+"""
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from end_uses.building_end_uses.end_use_energy import EndUseEnergy
+from end_uses.building_end_uses.end_use_table import EndUseTable
+
+
+class _TableValue:
+    """
+    Cost vector of an end use. Read from the row of the end use in its EndUseTable, unless a value
+    was set on the end use directly
+    """
+    def __init__(self, name: str):
+        self._name: str = name
+
+    def __get__(self, end_use: "EndUse", owner: type = None):
+        if end_use is None:
+            return self
+
+        if self._name in end_use._values:
+            return end_use._values[self._name]
+
+        if end_use._row is None:
+            return []
+
+        return end_use._end_use_table.get_values(self._name, end_use._row)
+
+    def __set__(self, end_use: "EndUse", value: list) -> None:
+        end_use._values[self._name] = value
+
+
+class EndUse:
+    """
+    Parent class for the stove, clothes dryer, domestic hot water and HVAC end uses of a building.
+    The cost vectors of an end use are a row of an EndUseTable, computed with the other end uses of
+    the table the first time any of them is read
+
+    Args:
+        years_vec (List[int]): List of simulation years
+        custom_baseline_energy (pd.DataFrame): Custom input timeseries of baseline energy consump
+        custom_retrofit_energy (pd.DataFrame): Custom input timeseries of retrofit energy consump
+
+    Optional args:
+        end_use_table (EndUseTable): Shared table of end uses. If not provided, the end use creates
+            its own table
+        building_id (str): The building of the end use, used to sum the end uses of each building
+        load_scaling_factor (float): Factor applied to the building consumption when it is read
+
+    Keyword Args:
+        existing_install_year (int): Install year of the baseline asset
+        lifetime (int): Useful lifetime of the asset in years
+        replacement_cost_dollars_year (int): Reference year for the input costs
+        escalator (float): Inflation escalator for cost calculations
+        existing_install_cost (float): Installation cost of the baseline asset
+        replacement_year (int): Year of retrofit
+        replacement_cost (float): Cost of replacing asset
+        replacement_lifetime (int): Useful lifetime of the replacement asset in years
+        end_use (str): The asset type
+
+    Attributes:
+        existing_book_val (List[float]): The annual book value of the existing asset
+        existing_stranded_val (List[float]): The stranded value of the existing asset at retrofit
+        replacement_cost (List[float]): The annual cost of asset replacement
+        replacement_book_val (List[float]): The annual book value of the replacement asset
+        cost_table (pd.DataFrame): Table of annual costs for the asset, built when read
+        baseline_energy_use (EndUseEnergy): Baseline energy consumption for a full year, as lazy
+            views of the building profiles
+        retrofit_energy_use (EndUseEnergy): Retrofit energy consumption for a full year, as lazy
+            views of the building profiles
+
+    Methods:
+        initialize_end_use (None): Register the end use with its table and read its energy use
+        release_energy_use (None): Drop the energy consumption timeseries held by the end use
+        move_to_end_use_table (None): Register the end use with another table
+    """
+    __slots__ = (
+        "_kwargs", "_years_vec", "_custom_baseline_energy", "_custom_retrofit_energy",
+        "_end_use_table", "_building_id", "_load_scaling_factor", "_row", "_values",
+        "baseline_energy_use", "retrofit_energy_use"
+    )
+
+    END_USE_TYPE: str = None
+    ENERGY_KEYS: List[str] = []
+
+    existing_book_val = _TableValue("existing_book_val")
+    _replacement_vec = _TableValue("replacement_vec")
+    existing_stranded_val = _TableValue("existing_stranded_val")
+    replacement_cost = _TableValue("replacement_cost")
+    replacement_book_val = _TableValue("replacement_book_val")
+
+    def __init__(
+            self,
+            years_vec: List[int],
+            custom_baseline_energy: pd.DataFrame,
+            custom_retrofit_energy: pd.DataFrame,
+            end_use_table: EndUseTable = None,
+            building_id: str = None,
+            load_scaling_factor: float = 1.,
+            **kwargs
+    ):
+        self._kwargs = kwargs
+
+        self._years_vec: List[int] = years_vec
+        self._custom_baseline_energy: pd.DataFrame = custom_baseline_energy
+        self._custom_retrofit_energy: pd.DataFrame = custom_retrofit_energy
+
+        self._end_use_table: EndUseTable = end_use_table
+        self._building_id: str = building_id
+        self._load_scaling_factor: float = load_scaling_factor
+        self._row: int = None
+        self._values: Dict[str, list] = {}
+
+        self.baseline_energy_use: EndUseEnergy = None
+        self.retrofit_energy_use: EndUseEnergy = None
+
+    def initialize_end_use(self) -> None:
+        """
+        Initialize the end use. Cost vectors are computed by the table when first read
+        """
+        if self._end_use_table is None:
+            self._end_use_table = EndUseTable()
+
+        self.move_to_end_use_table(self._end_use_table)
+
+        if not self._custom_baseline_energy.empty and not self._custom_retrofit_energy.empty:
+            self._get_custom_energies()
+
+    def move_to_end_use_table(self, end_use_table: EndUseTable) -> None:
+        """
+        Register the end use with a table and read its cost vectors from there
+
+        Args:
+            end_use_table (EndUseTable): The destination table
+
+        Returns:
+            None
+        """
+        self._row = end_use_table.add_end_use(
+            self._building_id, self.END_USE_TYPE, self._years_vec, self._kwargs
+        )
+        self._end_use_table = end_use_table
+        self._values = {}
+
+    @property
+    def cost_table(self) -> pd.DataFrame:
+        if self._row is None and not self._values:
+            return None
+
+        return self._get_cost_table()
+
+    def _get_custom_energies(self) -> None:
+        self.baseline_energy_use = EndUseEnergy(
+            self._custom_baseline_energy, self.ENERGY_KEYS, self._load_scaling_factor
+        )
+        self.retrofit_energy_use = EndUseEnergy(
+            self._custom_retrofit_energy, self.ENERGY_KEYS, self._load_scaling_factor
+        )
+
+    def release_energy_use(self) -> None:
+        """
+        Drop the energy consumption timeseries. Cost values are kept
+        """
+        self._custom_baseline_energy = pd.DataFrame()
+        self._custom_retrofit_energy = pd.DataFrame()
+        self.baseline_energy_use = None
+        self.retrofit_energy_use = None
+
+    def _get_asset_type(self) -> str:
+        return self._kwargs.get("end_use", self.END_USE_TYPE)
+
+    def _get_cost_table(self) -> pd.DataFrame:
+        asset_type = self._get_asset_type()
+
+        values = {
+            "{}_existing_book_value".format(asset_type): self.existing_book_val,
+            "{}_replacement_vec".format(asset_type): np.array(self._replacement_vec, dtype=int),
+            "{}_existing_stranded_value".format(asset_type): self.existing_stranded_val,
+            "{}_replacement_cost".format(asset_type): self.replacement_cost,
+            "{}_replacement_book_val".format(asset_type): self.replacement_book_val,
+        }
+
+        cost_table = pd.DataFrame(values, index=self._years_vec)
+
+        return cost_table
@@ -0,0 +1,95 @@
+"""
+Lazy view of the energy consumption columns of an end use
+"""
+from collections.abc import Mapping
+from typing import Dict, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+
+# Read-only zero profiles shared by every missing column, by profile length
+_ZEROS: Dict[int, np.ndarray] = {}
+
+
+def get_zeros(n_intervals: int) -> np.ndarray:
+    """
+    Shared read-only zero profile of a given length
+
+    Args:
+        n_intervals (int): The number of profile intervals
+
+    Returns:
+        np.ndarray: The zero profile
+    """
+    if n_intervals not in _ZEROS:
+        zeros = np.zeros(n_intervals)
+        zeros.flags.writeable = False
+
+        _ZEROS[n_intervals] = zeros
+
+    return _ZEROS[n_intervals]
+
+
+class EndUseEnergy(Mapping):
+    """
+    Energy consumption of an end use, as a read-only dict of {energy key: np.ndarray} over the
+    consumption profiles of its building. Columns are looked up when requested and returned as
+    views of the building profiles, and keys without a column share a zero profile, so no profile
+    is copied. Buildings with a load scaling factor get scaled copies of the columns they read
+
+    Args:
+        consumption (pd.DataFrame): The consumption profiles of the building, one row per interval
+        energy_keys (List[str]): The energy keys of the end use
+
+    Optional args:
+        scale (float): The load scaling factor of the building
+
+    Attributes:
+        energy_keys (List[str]): The energy keys of the end use
+        scale (float): The load scaling factor of the building
+
+    Methods:
+        to_frame (pd.DataFrame): Copy the end use columns into a DataFrame, with zeros for missing
+            keys
+    """
+    def __init__(self, consumption: pd.DataFrame, energy_keys: List[str], scale: float = 1.):
+        self._consumption: pd.DataFrame = consumption
+        self.energy_keys: List[str] = list(energy_keys)
+        self.scale: float = scale
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in self.energy_keys:
+            raise KeyError(key)
+
+        if key not in self._consumption:
+            return get_zeros(len(self._consumption))
+
+        profile = self._consumption[key].to_numpy()
+        if self.scale != 1:
+            profile = profile * self.scale
+
+        profile.flags.writeable = False
+
+        return profile
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.energy_keys)
+
+    def __len__(self) -> int:
+        return len(self.energy_keys)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Copy the end use columns into a DataFrame indexed like the building profiles, with zeros
+        for keys without a column, scaled by the load scaling factor
+
+        Returns:
+            pd.DataFrame: The end use consumption profiles
+        """
+        consumption = self._consumption.reindex(self.energy_keys, axis=1, fill_value=0)
+
+        if self.scale != 1:
+            consumption[consumption.select_dtypes(include=["number"]).columns] *= self.scale
+
+        return consumption
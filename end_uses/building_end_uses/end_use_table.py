@@ -0,0 +1,240 @@
+"""
+Array-backed table of the end uses of every building, with the cost vectors of all end uses
+computed at once
+"""
+from typing import Dict, List
+
+import numpy as np
+
+
+END_USE_TYPES = ["stove", "clothes_dryer", "domestic_hot_water", "hvac"]
+END_USE_INDEX = {end_use_type: idx for idx, end_use_type in enumerate(END_USE_TYPES)}
+
+COST_VALUES = [
+    "existing_book_val",
+    "replacement_vec",
+    "existing_stranded_val",
+    "replacement_cost",
+    "replacement_book_val",
+]
+
+DEFAULT_LIFETIME = 10
+DEFAULT_COST_DOLLARS_YEAR = 2022
+INFLATION_ESCALATOR = 0.02
+
+
+class EndUseTable:
+    """
+    Holds the stoves, clothes dryers, domestic hot water and HVAC end uses of every building in a
+    scenario as arrays, one row per end use: end use type, install year, lifetime, costs, escalation,
+    and replacement year. Existing book values, stranded values, escalated replacement costs, and
+    replacement book values are computed for every row at once the first time they are read, and
+    cached until another end use is added. Building totals are sums over the rows of each building
+
+    Args:
+        None
+
+    Attributes:
+        years_vec (List[int]): The simulation years, shared by all end uses
+        building_ids (List[str]): The building IDs, in the order they were first added
+        building_index (np.ndarray): Position of the building of each row in building_ids
+        end_use_type (np.ndarray): Index of the type of each row in END_USE_TYPES
+
+    Methods:
+        add_end_use (int): Register an end use of a building and return its row
+        get_values (np.ndarray): Return a cost vector of a single end use
+        get_building_totals (np.ndarray): Return a cost vector summed over the end uses of a
+            building
+    """
+    def __init__(self):
+        self.years_vec: List[int] = None
+        self.building_ids: List[str] = []
+
+        self._building_rows: Dict[str, int] = {}
+        self._rows: Dict[tuple, int] = {}
+        self._params: Dict[str, list] = {
+            "building_index": [],
+            "end_use_type": [],
+            "existing_install_year": [],
+            "lifetime": [],
+            "existing_escalation": [],
+            "existing_install_cost": [],
+            "replacement_year": [],
+            "replacement_escalation": [],
+            "replacement_cost": [],
+            "replacement_lifetime": [],
+        }
+
+        self._values: Dict[str, np.ndarray] = {}
+        self._building_totals: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._params["building_index"])
+
+    @property
+    def building_index(self) -> np.ndarray:
+        return np.array(self._params["building_index"], dtype=int)
+
+    @property
+    def end_use_type(self) -> np.ndarray:
+        return np.array(self._params["end_use_type"], dtype=int)
+
+    def add_end_use(
+            self, building_id: str, end_use_type: str, years_vec: List[int], params: dict
+    ) -> int:
+        """
+        Register an end use of a building. A building has at most one end use of each type, so
+        adding the same type again replaces the parameters of its row
+
+        Args:
+            building_id (str): The building ID
+            end_use_type (str): The end use type, one of END_USE_TYPES
+            years_vec (List[int]): The simulation years
+            params (dict): The end use parameters
+
+        Returns:
+            int: The row of the end use in the table
+        """
+        if self.years_vec is None:
+            self.years_vec = list(years_vec)
+
+        if list(years_vec) != self.years_vec:
+            raise ValueError(
+                f"End use {end_use_type} of building {building_id} has simulation years "
+                f"{years_vec[0]}-{years_vec[-1]}. Expected {self.years_vec[0]}-{self.years_vec[-1]}."
+            )
+
+        if building_id not in self._building_rows:
+            self._building_rows[building_id] = len(self.building_ids)
+            self.building_ids.append(building_id)
+
+        lifetime = params.get("lifetime", DEFAULT_LIFETIME)
+        existing_install_year = params.get("existing_install_year", years_vec[0])
+        replacement_year = params.get("replacement_year", years_vec[-1])
+        cost_dollars_year = params.get("replacement_cost_dollars_year", DEFAULT_COST_DOLLARS_YEAR)
+        escalator = params.get("escalator", INFLATION_ESCALATOR)
+
+        # Escalation factors are scalars per row, computed with the same pow as the end use
+        row_params = {
+            "building_index": self._building_rows[building_id],
+            "end_use_type": END_USE_INDEX[end_use_type],
+            "existing_install_year": existing_install_year,
+            "lifetime": lifetime,
+            "existing_escalation": (1 - escalator) ** (cost_dollars_year - existing_install_year),
+            "existing_install_cost": params.get("existing_install_cost", 0),
+            "replacement_year": replacement_year,
+            "replacement_escalation": (1 + escalator) ** (replacement_year - cost_dollars_year),
+            "replacement_cost": params.get("replacement_cost", 0),
+            "replacement_lifetime": params.get("replacement_lifetime", lifetime),
+        }
+
+        key = (building_id, end_use_type)
+        if key not in self._rows:
+            self._rows[key] = len(self)
+            for name, column in self._params.items():
+                column.append(row_params[name])
+        else:
+            for name, column in self._params.items():
+                column[self._rows[key]] = row_params[name]
+
+        self._values = {}
+        self._building_totals = {}
+
+        return self._rows[key]
+
+    def get_values(self, name: str, row: int) -> np.ndarray:
+        """
+        Cost vector of a single end use. Returns a read-only row of the cached values
+
+        Args:
+            name (str): The cost vector, one of COST_VALUES
+            row (int): The row of the end use
+
+        Returns:
+            np.ndarray: The values in each simulation year
+        """
+        if not self._values:
+            self._compute()
+
+        return self._values[name][row]
+
+    def get_building_totals(self, name: str, building_id: str) -> np.ndarray:
+        """
+        Cost vector summed over the end uses of a building, in the order of END_USE_TYPES. Totals
+        are computed for all buildings at once and cached
+
+        Args:
+            name (str): The cost vector, one of COST_VALUES
+            building_id (str): The building ID
+
+        Returns:
+            np.ndarray: The totals in each simulation year
+        """
+        n_years = len(self.years_vec or [])
+
+        if building_id not in self._building_rows:
+            return np.zeros(n_years)
+
+        if name not in self._building_totals:
+            if not self._values:
+                self._compute()
+
+            order = np.lexsort((self.end_use_type, self.building_index))
+
+            totals = np.zeros((len(self.building_ids), n_years))
+            np.add.at(totals, self.building_index[order], self._values[name][order])
+            totals.flags.writeable = False
+
+            self._building_totals[name] = totals
+
+        return self._building_totals[name][self._building_rows[building_id]]
+
+    def _get_column(self, name: str) -> np.ndarray:
+        return np.array(self._params[name], dtype=float)[:, None]
+
+    def _compute(self) -> None:
+        """
+        Compute every cost vector for every row, with straight line depreciation and no salvage
+        value for the existing and replacement assets
+        """
+        years = np.array(self.years_vec or [], dtype=float)[None, :]
+
+        existing_install_year = self._get_column("existing_install_year")
+        replacement_year = self._get_column("replacement_year")
+
+        existing_adjusted_cost = (
+            self._get_column("existing_install_cost") * self._get_column("existing_escalation")
+        )
+        existing_rate = existing_adjusted_cost / self._get_column("lifetime")
+
+        existing_book_val = np.maximum(
+            existing_adjusted_cost - existing_rate * (years - existing_install_year), 0
+        )
+
+        replacement_vec = years == replacement_year
+        existing_stranded_val = existing_book_val * replacement_vec
+
+        escalated_cost = (
+            self._get_column("replacement_cost") * self._get_column("replacement_escalation")
+        )
+        replacement_cost = np.where(replacement_vec, escalated_cost, 0.)
+
+        peak_replacement_cost = replacement_cost.max(axis=1, initial=0.)[:, None]
+        replacement_rate = peak_replacement_cost / self._get_column("replacement_lifetime")
+
+        replacement_book_val = np.where(
+            years >= replacement_year,
+            np.maximum(peak_replacement_cost - replacement_rate * (years - replacement_year), 0),
+            0.
+        )
+
+        self._values = {
+            "existing_book_val": existing_book_val,
+            "replacement_vec": replacement_vec,
+            "existing_stranded_val": existing_stranded_val,
+            "replacement_cost": replacement_cost,
+            "replacement_book_val": replacement_book_val,
+        }
+
+        for values in self._values.values():
+            values.flags.writeable = False
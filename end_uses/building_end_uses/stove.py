@@ -1,10 +1,7 @@
 """
 Defines Stove end use
 """
-from typing import List
-
-import numpy as np
-import pandas as pd
+from end_uses.building_end_uses.end_use import EndUse
 
 
 ENERGY_KEYS = [
@@ -13,162 +10,34 @@ ENERGY_KEYS = [
     "out.propane.range_oven.energy_consumption"
 ]
 
-INFLATION_ESCALATOR = 0.02
-
 
-class Stove:
+class Stove(EndUse):
     """
-    Stove end use
+    Stove end use. Inherits EndUse, with its cost vectors computed in the EndUseTable
 
     Args:
         years_vec (List[int]): List of simulation years
         custom_baseline_energy (pd.DataFrame): Custom input timeseries of baseline energy consump
         custom_retrofit_energy (pd.DataFrame): Custom input timeseries of retrofit energy consump
 
+    Optional args:
+        end_use_table (EndUseTable): Shared table of end uses
+        building_id (str): The building of the end use
+        load_scaling_factor (float): Factor applied to the building consumption when it is read
+
     Keyword Args:
-        existing_install_year (int): Install year of the baseline asset
-        lifetime (int): Useful lifetime of the asset in years
-        replacement_cost_dollars_year (int): Reference year for the input costs
-        escalator (float): Inflation escalator for cost calculations
-        existing_install_cost (float): Installation cost of the baseline asset
-        replacement_year (int): Year of retrofit
-        replacement_cost (float): Cost of replacing asset
-        replacement_lifetime (int): Useful lifetime of the replacement asset in years
+        See EndUse
 
     Attributes:
-        existing_book_val (List[float]): The annual book value of the existing asset
-        replacement_cost (List[float]): The annual cost of asset replacement
-        replacement_book_val (List[float]): The annual book value of the replacement asset
-        cost_table (pd.DataFrame): Table of annual costs for the asset
-        baseline_energy_use (pd.DataFrame): Timeseries baseline energy consumption for a full year
-        retrofit_energy_use (pd.DataFrame): Timeseries retrofit energy consumption for a full year
+        See EndUse
 
     Methods:
-        initialize_end_use (None): Calculate all associated asset values
+        See EndUse
     """
-    def __init__(
-            self,
-            years_vec: List[int],
-            custom_baseline_energy: pd.DataFrame,
-            custom_retrofit_energy: pd.DataFrame,
-            **kwargs
-    ):
-        self._kwargs = kwargs
-
-        self._years_vec: List[int] = years_vec
-        self._custom_baseline_energy: pd.DataFrame = custom_baseline_energy
-        self._custom_retrofit_energy: pd.DataFrame = custom_retrofit_energy
-
-        self.existing_book_val: List[float] = []
-        self._replacement_vec: List[bool] = []
-        self.replacement_cost: List[float] = []
-        self.replacement_book_val: List[float] = []
-        self.cost_table: pd.DataFrame = None
-
-        self.baseline_energy_use = None
-        self.retrofit_energy_use = None
-
-    def initialize_end_use(self) -> None:
-        """
-        Initialize the end use and calculate values
-        """
-        self.existing_book_val = self._get_existing_book_val()
-        self._replacement_vec = self._get_replacement_vec()
-        self.existing_stranded_val = self._get_existing_stranded_val()
-        self.replacement_cost = self._get_replacement_cost()
-        self.replacement_book_val = self._get_replacement_book_value()
-        self.cost_table = self._get_cost_table()
-
-        if not self._custom_baseline_energy.empty and not self._custom_retrofit_energy.empty:
-            self._get_custom_energies()
-
-    def _get_custom_energies(self) -> None:
-        self.baseline_energy_use = self._custom_baseline_energy.reindex(
-            ENERGY_KEYS, axis=1, fill_value=0
-        )
-
-        self.retrofit_energy_use = self._custom_retrofit_energy.reindex(
-            ENERGY_KEYS, axis=1, fill_value=0
-        )
-
-    def _get_existing_book_val(self) -> List[float]:
-        existing_install_year = self._kwargs.get("existing_install_year", self._years_vec[0])
-        lifetime = self._kwargs.get("lifetime", 10)
-        existing_cost_dollars_year = self._kwargs.get("replacement_cost_dollars_year", 2022)
-        cost_escalator = self._kwargs.get("escalator", INFLATION_ESCALATOR)
-        existing_install_cost = self._kwargs.get("existing_install_cost", 0)
-        salvage_val = 0
-
-        existing_adjusted_cost = existing_install_cost * (
-            (1 - cost_escalator) ** (existing_cost_dollars_year - existing_install_year)
-        )
-
-        depreciation_rate = (existing_adjusted_cost - salvage_val) / lifetime
-
-        existing_book_val = [
-            max(existing_adjusted_cost - depreciation_rate * (i - existing_install_year), 0)
-            for i in self._years_vec
-        ]
-
-        return existing_book_val
-    
-    def _get_replacement_vec(self) -> List[bool]:
-        """
-        The replacement vector is a vector of True when the index is the retrofit year, False o/w
-        """
-        replacement_year = self._kwargs.get("replacement_year", self._years_vec[-1])
-        return [True if i==replacement_year else False for i in self._years_vec]
-
-    def _get_existing_stranded_val(self) -> List[float]:
-        stranded_val = np.multiply(self.existing_book_val, self._replacement_vec).tolist()
-        return stranded_val
-
-    def _get_replacement_cost(self) -> List[float]:
-        replacement_cost = self._kwargs.get("replacement_cost", 0)
-        replacement_year = self._kwargs.get("replacement_year", self._years_vec[-1])
-
-        cost_escalator = self._kwargs.get("escalator", INFLATION_ESCALATOR)
-        replacement_cost_dollars_year = self._kwargs.get("replacement_cost_dollars_year", 2022)
-
-        replacement_cost = replacement_cost * (
-            (1 + cost_escalator) ** (replacement_year - replacement_cost_dollars_year)
-        )
-
-        replacement_cost_vec = [
-            replacement_cost if i==replacement_year else 0 for i in self._years_vec
-        ]
-
-        return replacement_cost_vec
-    
-    def _get_replacement_book_value(self) -> List[float]:
-        replacement_cost = max(self.replacement_cost)
-        replacement_year = self._kwargs.get("replacement_year", self._years_vec[-1])
-        replacement_lifetime = self._kwargs.get(
-            "replacement_lifetime",
-            self._kwargs.get("lifetime", 10)
-        )
-        salvage_val = 0
-
-        depreciation_rate = (replacement_cost - salvage_val) / replacement_lifetime
-
-        replacement_book_val = [
-            max(replacement_cost - depreciation_rate * (i - replacement_year), 0)
-            if i >= replacement_year
-            else 0
-            for i in self._years_vec
-        ]
-
-        return replacement_book_val
-    
-    def _get_cost_table(self) -> pd.DataFrame:
-        values = {
-            "stove_existing_book_value": self.existing_book_val,
-            "stove_replacement_vec": np.array(self._replacement_vec, dtype=int),
-            "stove_existing_stranded_value": self.existing_stranded_val,
-            "stove_replacement_cost": self.replacement_cost,
-            "stove_replacement_book_val": self.replacement_book_val,
-        }
+    __slots__ = ()
 
-        cost_table = pd.DataFrame(values, index=self._years_vec)
+    END_USE_TYPE = "stove"
+    ENERGY_KEYS = ENERGY_KEYS
 
-        return cost_table
+    def _get_asset_type(self) -> str:
+        return "stove"
@@ -31,6 +31,8 @@ class ElecMeter(Meter):
         None
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(
             kwargs.get("gisid"),
@@ -45,6 +45,8 @@ class GasMeter(Meter):
         get_depreciation (list): Return the list of annual depreciated value for all sim years
         get_retrofit_cost (list): Return list of annual retrofit cost for all sim years
     """
+    __slots__ = ("_retrofit_cost", "_retrofit_freq")
+
     def __init__(self, **kwargs):
         super().__init__(
             kwargs.get("gisid"),
@@ -1,16 +1,19 @@
 """
 Defines meter parent class
 """
-import numpy as np
 from typing import List
 
 from buildings.building import Building
 from end_uses.utility_end_uses.utility_end_use import UtilityEndUse
+from loads.annual_timeseries import AnnualTimeseries
+from loads.load_states import LoadStates
+from loads.load_store import BASELINE, RETROFIT
 
 
 class Meter(UtilityEndUse):
     """
-    Defines a meter parent class. A Meter sums energy consumptions of all end uses
+    Defines a meter parent class. A Meter sums energy consumptions of all end uses. Consumption is
+    read from the building's profiles in the shared load store
 
     Args:
         gisid (str): The ID for the given asset
@@ -31,15 +34,23 @@ class Meter(UtilityEndUse):
         meter_type (str): The type of meter (ELEC, GAS)
         annual_total_energy_use (dict): Total annual energy use behind the meter, by sim year
         annual_peak_energy_use (dict): Total peak energy use at the meter, by sim year
-        annual_energy_use_timeseries (dict): Hourly annual timeseries consumption at the meter, by sim year
+        annual_energy_use_timeseries (AnnualTimeseries): Hourly annual timeseries consumption at
+            the meter, by sim year
+        load_states (LoadStates): The building profile used by the meter in each sim year
 
     Methods:
         initialize_end_use (None): Executes all calculations for the meter
         get_annual_total_energy_use (dict): Gets the total energy use for the meter
         get_annual_peak_energy_use (dict): Gets the total energy demand for the meter
-        get_annual_energy_use_timeseries (dict): Gets the energy use timeseries per year for the meter
+        get_annual_energy_use_timeseries (AnnualTimeseries): Gets the energy use timeseries per year
+            for the meter
     """
 
+    __slots__ = (
+        "building", "meter_type", "annual_total_energy_use", "annual_peak_energy_use",
+        "annual_energy_use_timeseries", "load_states"
+    )
+
     def __init__(
         self,
         gisid: str,
@@ -75,6 +86,7 @@ class Meter(UtilityEndUse):
         self.annual_total_energy_use: dict = {}
         self.annual_peak_energy_use: dict = {}
         self.annual_energy_use_timeseries: dict = {}
+        self.load_states: LoadStates = None
 
     def initialize_end_use(self) -> None:
         """
@@ -85,6 +97,12 @@ class Meter(UtilityEndUse):
             self.annual_total_energy_use = self.get_annual_total_energy_use()
             self.annual_peak_energy_use = self.get_annual_peak_energy_use()
             self.annual_energy_use_timeseries = self.get_annual_energy_use_timeseries()
+            self.load_states = LoadStates.for_building(
+                self.building.load_store,
+                self.building.load_index,
+                self.meter_type,
+                [i == 1 for i in self.operational_vector]
+            )
 
     def get_annual_total_energy_use(self) -> dict:
         """
@@ -93,13 +111,11 @@ class Meter(UtilityEndUse):
         Returns:
             list: List of annual energy consumption
         """
-        energy_attr = "out." + self.meter_type.lower() + ".total.energy_consumption"
-        annual_total_energy_baseline = np.sum(
-            self.building.baseline_consumption[[energy_attr]]
-        ).values[0]
-        annual_total_energy_retrofit = np.sum(
-            self.building.retrofit_consumption[[energy_attr]]
-        ).values[0]
+        load_store = self.building.load_store
+        load_index = self.building.load_index
+
+        annual_total_energy_baseline = load_store.get_total(load_index, BASELINE, self.meter_type)
+        annual_total_energy_retrofit = load_store.get_total(load_index, RETROFIT, self.meter_type)
 
         annual_total_energy = [
             annual_total_energy_baseline * operation
@@ -115,16 +131,17 @@ class Meter(UtilityEndUse):
         """
         Calculate the annual hourly peak consumption
         """
-        energy_attr = "out." + self.meter_type.lower() + ".total.energy_consumption"
+        load_store = self.building.load_store
+        load_index = self.building.load_index
 
         hourly_baseline_consump = \
-            self.building.baseline_consumption[energy_attr].resample("H").sum()
-        
+            load_store.get_hourly_profile(load_index, BASELINE, self.meter_type)
+
         hourly_retrofit_consump = \
-            self.building.retrofit_consumption[energy_attr].resample("H").sum()
+            load_store.get_hourly_profile(load_index, RETROFIT, self.meter_type)
 
-        annual_peak_energy_baseline = hourly_baseline_consump.max()
-        annual_peak_energy_retrofit = hourly_retrofit_consump.max()
+        annual_peak_energy_baseline = float(hourly_baseline_consump.max())
+        annual_peak_energy_retrofit = float(hourly_retrofit_consump.max())
 
         annual_peak_energy = [
             annual_peak_energy_baseline * operation
@@ -136,17 +153,20 @@ class Meter(UtilityEndUse):
 
         return dict(zip(self.years_vector, annual_peak_energy))
 
-    def get_annual_energy_use_timeseries(self) -> dict:
-        energy_attr = "out." + self.meter_type.lower() + ".total.energy_consumption"
-
-        annual_energy_use_baseline = \
-            self.building.baseline_consumption[energy_attr].resample("H").sum()
-        annual_energy_use_retrofit = \
-            self.building.retrofit_consumption[energy_attr].resample("H").sum()
+    def get_annual_energy_use_timeseries(self) -> AnnualTimeseries:
+        """
+        Hourly load in each year, as a view of the hourly profiles of the load store indexed by the
+        baseline or retrofit profile row of the building, and scaled when read
+        """
+        load_store = self.building.load_store
+        load_index = self.building.load_index
 
-        annual_energy_use_timeseries = [
-            annual_energy_use_baseline if i == 1 else annual_energy_use_retrofit
+        profiles = load_store.get_hourly_profiles(self.meter_type)
+        year_index = [
+            load_store.get_building_profile_row(load_index, BASELINE if i == 1 else RETROFIT)
             for i in self.operational_vector
         ]
 
-        return dict(zip(self.years_vector, annual_energy_use_timeseries))
+        return AnnualTimeseries(
+            self.years_vector, profiles, year_index, load_store.get_scale(load_index)
+        )
@@ -1,12 +1,13 @@
 """
 Defines distribution line parent class
 """
-import pandas as pd
 import numpy as np
 from typing import List
 
 from end_uses.utility_end_uses.utility_end_use import UtilityEndUse
 from collections import Counter
+from loads.annual_timeseries import AnnualTimeseries
+from loads.load_states import LoadStates, get_annual_timeseries
 
 
 class DistributionLine(UtilityEndUse):
@@ -33,15 +34,23 @@ class DistributionLine(UtilityEndUse):
         connected_assets (list): List of associated downstream assets
         annual_total_energy_use (dict): Total annual energy use behind the meter, by sim year
         annual_peak_energy_use (dict): Total peak energy use at the meter, by sim year
-        annual_energy_use_timeseries (dict): Hourly annual timeseries consumption at the meter, by sim year
+        annual_energy_use_timeseries (AnnualTimeseries): Hourly annual timeseries consumption at
+            the meter, by sim year
+        load_states (LoadStates): Combined building profile states of the connected assets
 
     Methods:
         initialize_end_use (None): Executes all calculations for the meter
         get_elec_losses (list): List of elec losses over sim years
         get_annual_total_energy_use (dict): Gets the total energy use for the meter
         get_annual_peak_energy_use (dict): Gets the total energy demand for the meter
-        get_annual_energy_use_timeseries (dict): Gets the energy use timeseries per year for the meter
+        get_annual_energy_use_timeseries (AnnualTimeseries): Gets the energy use timeseries per year
+            for the meter
     """
+    __slots__ = (
+        "distribution_line_type", "loss_rate", "connected_assets", "annual_total_energy_use",
+        "annual_peak_energy_use", "annual_energy_use_timeseries", "load_states"
+    )
+
     def __init__(
         self,
         gisid: str,
@@ -76,6 +85,7 @@ class DistributionLine(UtilityEndUse):
         self.annual_total_energy_use: dict = {}
         self.annual_peak_energy_use: dict = {}
         self.annual_energy_use_timeseries: dict = {}
+        self.load_states: LoadStates = None
 
     def initialize_end_use(self) -> None:
         """
@@ -109,17 +119,14 @@ class DistributionLine(UtilityEndUse):
         return dict(tmp_counter)
 
     def get_annual_peak_energy_use(self) -> dict:
-        annual_peak = []
-
-        for i in self.years_vector:
-            annual_peak.append(self.annual_energy_use_timeseries[i].max())
-
-        return annual_peak
+        return self.annual_energy_use_timeseries.max().tolist()
 
-    def get_annual_energy_use_timeseries(self) -> dict:
-        energy_timeseries = {i: pd.Series(0, index=self.year_timestamps) for i in self.years_vector}
-        for i in self.years_vector:
-            for meter in self.connected_assets:
-                energy_timeseries[i] += meter.annual_energy_use_timeseries[i]
+    def get_annual_energy_use_timeseries(self) -> AnnualTimeseries:
+        """
+        Hourly load for each year, from the combined states of the connected assets
+        """
+        self.load_states, annual_timeseries = get_annual_timeseries(
+            [asset.load_states for asset in self.connected_assets], self.years_vector
+        )
 
-        return energy_timeseries
+        return annual_timeseries
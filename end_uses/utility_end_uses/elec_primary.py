@@ -39,6 +39,8 @@ class ElecPrimary(DistributionLine):
     Methods:
         None
     """
+    __slots__ = ("circuit", "oh_ug", "phase", "pwire_size", "voltage")
+
     def __init__(self, **kwargs):
         super().__init__(
             kwargs.get("gisid"),
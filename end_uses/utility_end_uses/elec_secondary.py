@@ -39,6 +39,8 @@ class ElecSecondary(DistributionLine):
     Methods:
         None
     """
+    __slots__ = ("circuit", "oh_ug", "phase", "sec_wsize", "sec_wtype")
+
     def __init__(self, **kwargs):
         super().__init__(
             kwargs.get("gisid"),
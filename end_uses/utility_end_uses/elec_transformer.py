@@ -1,13 +1,13 @@
 """
 Defines electric transformer end use
 """
-from typing import Dict
-import pandas as pd
 import numpy as np
 import warnings
 
 from end_uses.utility_end_uses.utility_end_use import UtilityEndUse
 from collections import Counter
+from loads.annual_timeseries import AnnualTimeseries
+from loads.load_states import LoadStates, get_annual_timeseries
 
 
 POWER_FACTOR = 1
@@ -49,9 +49,11 @@ class ElecTransformer(UtilityEndUse):
         annual_bank_KVA (list): Annual kVA rating
         annual_total_energy_use (dict): Annual total energy use
         annual_peak_energy_use (list): Annual peak consumption
-        annual_energy_use_timeseries (dict): Annual energy consumption hourly timeseries
+        annual_energy_use_timeseries (AnnualTimeseries): Annual energy consumption hourly timeseries
+        load_states (LoadStates): Combined building profile states of the connected assets
         annual_upgrades (list): List of the number of transformer upgrades per year to satisfy peaks
         required_upgrade_year (list): List of years where an upgrade is required
+        is_replacement_vector (list): 1 from the first required upgrade year onward, 0 o/w
         upgrade_cost (list): Annual cost of upgrading the transformer
         overloading_flag (list): 1 if the transformer is overloaded that year, 0 o/w
         overloading_ratio (list): Annual ratio of peak load to rated peak (> 1 means overloaded)
@@ -59,7 +61,8 @@ class ElecTransformer(UtilityEndUse):
     Methods:
         initialize_end_use (None): Executes all calculations for the transformer
         get_annual_total_energy_use (dict): Gets the total energy use for the meter
-        get_annual_energy_use_timeseries (dict): Gets the energy use timeseries per year for the meter
+        get_annual_energy_use_timeseries (AnnualTimeseries): Gets the energy use timeseries per year
+            for the meter
         get_annual_peak_energy_use (dict): Gets the total energy demand for the meter
         get_upgrade_year (list): Return lists of upgrade years based ont he peak load
         update_is_replacement_vector (list): Update the is_replacement_vector
@@ -67,6 +70,13 @@ class ElecTransformer(UtilityEndUse):
         get_upgrade_cost (list): Get the annual upgrade cost
         get_overloading_status (None): Calculate the overloading flag and ratio
     """
+    __slots__ = (
+        "decarb_scenario", "circuit", "trans_qty", "tr_secvolt", "PolePadVLT", "_bank_kva",
+        "connected_assets", "annual_bank_KVA", "annual_total_energy_use", "annual_peak_energy_use",
+        "annual_energy_use_timeseries", "load_states", "annual_upgrades", "required_upgrade_year",
+        "is_replacement_vector", "upgrade_cost", "overloading_flag", "overloading_ratio"
+    )
+
     def __init__(self, **kwargs):
         super().__init__(
             kwargs.get("gisid"),
@@ -92,9 +102,11 @@ class ElecTransformer(UtilityEndUse):
         self.annual_total_energy_use: dict = {}
         self.annual_peak_energy_use: list = []
         self.annual_energy_use_timeseries: dict = {}
+        self.load_states: LoadStates = None
         self.annual_upgrades: list = []
 
         self.required_upgrade_year: list = []
+        self.is_replacement_vector: list = []
         self.upgrade_cost: list = []
         self.overloading_flag: list = []
         self.overloading_ratio: list = []
@@ -134,21 +146,18 @@ class ElecTransformer(UtilityEndUse):
 
         return dict(tmp_counter)
 
-    def get_annual_energy_use_timeseries(self) -> Dict[int, pd.Series]:
-        energy_timeseries = {i: pd.Series(0, index=self.year_timestamps) for i in self.years_vector}
-        for i in self.years_vector:
-            for meter in self.connected_assets:
-                energy_timeseries[i] += meter.annual_energy_use_timeseries[i]
+    def get_annual_energy_use_timeseries(self) -> AnnualTimeseries:
+        """
+        Hourly load for each year, from the combined states of the connected assets
+        """
+        self.load_states, annual_timeseries = get_annual_timeseries(
+            [asset.load_states for asset in self.connected_assets], self.years_vector
+        )
 
-        return energy_timeseries
+        return annual_timeseries
 
     def get_annual_peak_energy_use(self) -> list:
-        annual_peak = []
-
-        for i in self.years_vector:
-            annual_peak.append(self.annual_energy_use_timeseries[i].max())
-
-        return annual_peak
+        return self.annual_energy_use_timeseries.max().tolist()
 
     def get_upgrade_year(self) -> list:
         """
@@ -2,11 +2,11 @@
 Defines gas main asset
 """
 import numpy as np
-import pandas as pd
 from typing import List
 import warnings
 
 from end_uses.utility_end_uses.pipeline import Pipeline
+from reference_data.reference_data import REFERENCE_DATA
 
 
 GAS_SHUTOFF_SCENARIOS = [
@@ -50,8 +50,9 @@ class GasMain(Pipeline):
     Attributes:
         replacement_cost (float): Cost of gas main replacement
         shutoff_cost (float): Cost of gas main shutoff
-        book_value (list): Annual book value of the gas main
-        shutoff_year (list): 1 in the shutoff year, 0 all other years
+        book_value (np.ndarray): Annual book value of the gas main, read-only view of
+            depreciation
+        shutoff_year (np.ndarray): 1 in the shutoff year, 0 all other years
 
     Methods:
         initialize_end_use (None): Executes all calculations for the meter
@@ -63,6 +64,10 @@ class GasMain(Pipeline):
         get_shutoff_year (list): Returns vector with value 1 in shutoff year, 0 o/w
         get_system_shutoff_cost (list): Returns vector with the system shutoff cost by sim year
     """
+    __slots__ = (
+        "replacement_cost", "shutoff_cost", "shutoff_year", "annual_operating_expenses"
+    )
+
     def __init__(self, **kwargs):
         super().__init__(
             kwargs.get("gisid"),
@@ -84,15 +89,18 @@ class GasMain(Pipeline):
 
         self.replacement_cost = kwargs.get("replacement_cost", 0)
         self.shutoff_cost = kwargs.get("shutoff_cost", 0)
-        self.book_value: list = []
-        self.shutoff_year: list = []
+        self.shutoff_year: np.ndarray = np.zeros(0)
+        self.annual_operating_expenses: np.ndarray = np.zeros(0)
 
     def initialize_end_use(self) -> None:
         super().initialize_end_use()
-        self.book_value = self.get_book_value()
-        self.shutoff_year = self.get_shutoff_year()
-        self.stranded_value = self._update_stranded_value()
-        self.annual_operating_expenses = self._get_annual_om()
+        self.shutoff_year = np.asarray(self.get_shutoff_year(), dtype=np.float64)
+        self.stranded_value = np.asarray(self._update_stranded_value(), dtype=np.float64)
+        self.annual_operating_expenses = np.asarray(self._get_annual_om(), dtype=np.float64)
+
+    @property
+    def book_value(self) -> np.ndarray:
+        return self.depreciation
 
     def get_operational_vector(self) -> list:
         operational_vecs = []
@@ -162,13 +170,13 @@ class GasMain(Pipeline):
         return shutoff_year_vec
 
     def _update_stranded_value(self) -> List[float]:
-        return (np.array(self.book_value) * np.array(self.shutoff_year)).tolist()
+        return (np.asarray(self.depreciation) * np.asarray(self.shutoff_year)).tolist()
     
     def get_system_shutoff_cost(self) -> List[float]:
         return (np.array(self.shutoff_year) * self.shutoff_cost).tolist()
 
     def _get_annual_om(self) -> List[float]:
-        om_table = pd.read_csv(ANNUAL_OM_FILEPATH, index_col="material").to_dict(orient="index")
+        om_table = REFERENCE_DATA.get_operating_expenses(ANNUAL_OM_FILEPATH)
 
         if self.material not in om_table.keys():
             warnings.warn(f"Material {self.material} not in O&M table! Using $0 / year.")
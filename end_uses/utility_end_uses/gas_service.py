@@ -2,11 +2,11 @@
 Defines gas service end use
 """
 import numpy as np
-import pandas as pd
 from typing import List
 import warnings
 
 from end_uses.utility_end_uses.pipeline import Pipeline
+from reference_data.reference_data import REFERENCE_DATA
 
 
 GAS_SHUTOFF_SCENARIOS = [
@@ -48,8 +48,9 @@ class GasService(Pipeline):
 
     Attributes:
         replacement_cost (float): Cost of gas service replacement
-        book_value (list): Annual book value of the gas service
-        shutoff_year (list): 1 in the shutoff year, 0 all other years
+        book_value (np.ndarray): Annual book value of the gas service, read-only view of
+            depreciation
+        shutoff_year (np.ndarray): 1 in the shutoff year, 0 all other years
 
     Methods:
         initialize_end_use (None): Executes all calculations for the meter
@@ -60,6 +61,8 @@ class GasService(Pipeline):
         get_book_value (list): Returns annual book value vector
         get_shutoff_year (list): Returns vector with value 1 in shutoff year, 0 o/w
     """
+    __slots__ = ("replacement_cost", "shutoff_year", "annual_operating_expenses")
+
     def __init__(self, **kwargs):
         super().__init__(
             kwargs.get("gisid"),
@@ -80,15 +83,18 @@ class GasService(Pipeline):
         )
 
         self.replacement_cost = kwargs.get("replacement_cost", 0)
-        self.book_value: list = []
-        self.shutoff_year: list = []
+        self.shutoff_year: np.ndarray = np.zeros(0)
+        self.annual_operating_expenses: np.ndarray = np.zeros(0)
 
     def initialize_end_use(self) -> None:
         super().initialize_end_use()
-        self.book_value = self.get_book_value()
-        self.shutoff_year = self.get_shutoff_year()
-        self.stranded_value = self._update_stranded_value()
-        self.annual_operating_expenses = self._get_annual_om()
+        self.shutoff_year = np.asarray(self.get_shutoff_year(), dtype=np.float64)
+        self.stranded_value = np.asarray(self._update_stranded_value(), dtype=np.float64)
+        self.annual_operating_expenses = np.asarray(self._get_annual_om(), dtype=np.float64)
+
+    @property
+    def book_value(self) -> np.ndarray:
+        return self.depreciation
 
     def get_operational_vector(self) -> list:
         operational_vecs = []
@@ -149,10 +155,10 @@ class GasService(Pipeline):
         return shutoff_year_vec
 
     def _update_stranded_value(self) -> List[float]:
-        return (np.array(self.book_value) * np.array(self.shutoff_year)).tolist()
+        return (np.asarray(self.depreciation) * np.asarray(self.shutoff_year)).tolist()
 
     def _get_annual_om(self) -> List[float]:
-        om_table = pd.read_csv(ANNUAL_OM_FILEPATH, index_col="material").to_dict(orient="index")
+        om_table = REFERENCE_DATA.get_operating_expenses(ANNUAL_OM_FILEPATH)
 
         if self.material not in om_table.keys():
             warnings.warn(f"Material {self.material} not in O&M table! Using $0 / year.")
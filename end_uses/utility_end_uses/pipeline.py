@@ -2,11 +2,14 @@
 Defines pipeline parent class
 """
 import numpy as np
-import pandas as pd
-from typing import List
+from typing import List, Mapping, Tuple
 
 from end_uses.utility_end_uses.utility_end_use import UtilityEndUse
 from collections import Counter
+from reference_data.reference_data import REFERENCE_DATA
+
+
+LEAKAGE_FACTORS_FILEPATH = "./config_files/utility_network/leakage_factors.csv"
 
 
 class Pipeline(UtilityEndUse):
@@ -40,8 +43,9 @@ class Pipeline(UtilityEndUse):
         leak_rate (int): The pipe's methane leak rate
         connected_assets (list): List of associated downstream assets
         decarb_scenario (str): The energy retrofit intervention scenario
-        leakage_factors (pd.DataFrame): Table of methane leak factors by pipe material
-        annual_total_leakage (list): List of total methane leaks by year
+        leakage_factors (Mapping[Tuple[str, str], float]): Methane leak factors by asset type and
+            pipe material
+        annual_total_leakage (np.ndarray): Total methane leaks by year
         annual_total_energy_use (dict): Total annual energy use behind the pipe, by sim year
         annual_peak_energy_use (dict): Total peak energy use at the pipe, by sim year
         annual_energy_use_timeseries (dict): Hourly annual timeseries consumption at the pipe, by sim year
@@ -53,6 +57,12 @@ class Pipeline(UtilityEndUse):
         get_annual_energy_use_timeseries (dict): Gets the energy use timeseries per year for the pipe
         get_annual_total_leakage (list): Calculates the annual methane leaks from the pipe
     """
+    __slots__ = (
+        "pipeline_type", "length", "pressure", "diameter", "material", "leak_rate",
+        "connected_assets", "decarb_scenario", "leakage_factors", "annual_total_leakage",
+        "annual_total_energy_use", "annual_peak_energy_use", "annual_energy_use_timeseries"
+    )
+
     def __init__(
         self,
         gisid: str,
@@ -98,20 +108,13 @@ class Pipeline(UtilityEndUse):
 
         self.decarb_scenario: str = decarb_scenario
 
-        self.leakage_factors: pd.DataFrame = None
+        self.leakage_factors: Mapping[Tuple[str, str], float] = None
 
-        self.annual_total_leakage: list = []
+        self.annual_total_leakage: np.ndarray = np.zeros(0)
         self.annual_total_energy_use: dict = {}
         self.annual_peak_energy_use: dict = {}
         self.annual_energy_use_timeseries: dict = {}
 
-    def _read_csv_config(self, config_file_path=None) -> None:
-        """
-        Read in the utilty network config file and save to network_config attr
-        """
-        data = pd.read_csv(config_file_path)
-        return data
-
     def initialize_end_use(self) -> None:
         """
         Calculates aggregate consumption values behind the meter
@@ -122,11 +125,12 @@ class Pipeline(UtilityEndUse):
             self.annual_total_energy_use = self.get_annual_total_energy_use()
             self.annual_peak_energy_use = self.get_annual_peak_energy_use()
             self.annual_energy_use_timeseries = self.get_annual_energy_use_timeseries()
-            self.annual_total_leakage = self.get_annual_total_leakage()
+            self.annual_total_leakage = np.asarray(
+                self.get_annual_total_leakage(), dtype=np.float64
+            )
 
-    def _load_leakage_factors(self) -> int:
-        leakage_factor_file = "./config_files/utility_network/leakage_factors.csv"
-        return self._read_csv_config(config_file_path=leakage_factor_file)
+    def _load_leakage_factors(self) -> Mapping[Tuple[str, str], float]:
+        return REFERENCE_DATA.get_leakage_factors(LEAKAGE_FACTORS_FILEPATH)
 
     def get_annual_total_energy_use(self) -> dict:
         """
@@ -155,10 +159,7 @@ class Pipeline(UtilityEndUse):
         return dict(tmp_counter)
 
     def get_annual_total_leakage(self) -> list:
-        leakage_factor = float(self.leakage_factors[
-            (self.leakage_factors["asset"] == self.pipeline_type)
-            & (self.leakage_factors["code"] == self.material)
-        ].value * self.length)
+        leakage_factor = self.leakage_factors[(self.pipeline_type, self.material)] * self.length
 
         # TODO: check if the units of length and leakage factor match
 
@@ -166,12 +167,7 @@ class Pipeline(UtilityEndUse):
 
         for idx, retrofit in enumerate(self.retrofit_vector):
             if retrofit:
-                leakage_factor = float(
-                    self.leakage_factors[
-                        (self.leakage_factors["asset"] == self.pipeline_type)
-                        & (self.leakage_factors["code"] == "PL")
-                    ].value
-                )
+                leakage_factor = self.leakage_factors[(self.pipeline_type, "PL")]
 
                 annual_leakage[idx] = leakage_factor * self.length
 
@@ -27,6 +27,8 @@ class UtilityEndUse(Asset):
         None
     """
 
+    __slots__ = ("asset_id", "parent_id")
+
     def __init__(
         self,
         gisid,
@@ -0,0 +1,101 @@
+"""
+Lazy view of the hourly load of an asset in each simulation year
+"""
+from collections.abc import Mapping
+from typing import Iterator, List
+
+import numpy as np
+
+
+class AnnualTimeseries(Mapping):
+    """
+    Hourly load of an asset by simulation year, stored as the distinct hourly profiles of the asset
+    and the profile used in each year. Years that share a profile share its array, and a year is
+    only looked up when it is requested. Behaves as a read-only dict of {year: np.ndarray}
+
+    Args:
+        years (List[int]): The simulation years
+        profiles (np.ndarray): The distinct hourly profiles, shape (profiles, hours)
+        year_index (np.ndarray): The row of profiles used in each year
+
+    Optional args:
+        scale (float): Factor applied to the profiles when they are read
+
+    Attributes:
+        years (List[int]): The simulation years
+        profiles (np.ndarray): The distinct hourly profiles, shape (profiles, hours)
+        year_index (np.ndarray): The row of profiles used in each year
+        scale (float): Factor applied to the profiles when they are read
+
+    Methods:
+        max (np.ndarray): Peak hourly load in each year
+        sum (np.ndarray): Total load in each year
+        slice_hours (AnnualTimeseries): View of a range of hours of every year
+    """
+    def __init__(
+            self,
+            years: List[int],
+            profiles: np.ndarray,
+            year_index: np.ndarray,
+            scale: float = 1.
+    ):
+        if len(years) != len(year_index):
+            raise ValueError(
+                f"Received a profile index for {len(year_index)} years but there are "
+                f"{len(years)} simulation years."
+            )
+
+        self.years: List[int] = list(years)
+        self.profiles: np.ndarray = profiles
+        self.year_index: np.ndarray = np.asarray(year_index, dtype=np.intp)
+        self.scale: float = scale
+
+        self._positions: dict = {year: position for position, year in enumerate(self.years)}
+
+    def __getitem__(self, year: int) -> np.ndarray:
+        profile = self.profiles[self.year_index[self._positions[year]]]
+        if self.scale != 1:
+            profile = profile * self.scale
+
+        profile.flags.writeable = False
+
+        return profile
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.years)
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    def max(self) -> np.ndarray:
+        """
+        Peak hourly load in each year, computed once per distinct profile and returned as float64
+
+        Returns:
+            np.ndarray: Peak load, one value per simulation year
+        """
+        return (self.profiles.max(axis=1).astype(np.float64) * self.scale)[self.year_index]
+
+    def sum(self) -> np.ndarray:
+        """
+        Total load in each year, computed once per distinct profile and summed in float64
+
+        Returns:
+            np.ndarray: Total load, one value per simulation year
+        """
+        return (self.profiles.sum(axis=1, dtype=np.float64) * self.scale)[self.year_index]
+
+    def slice_hours(self, start: int = None, stop: int = None) -> "AnnualTimeseries":
+        """
+        View of a range of hours of every year, sharing memory with this timeseries
+
+        Optional args:
+            start (int): The first hour of the range
+            stop (int): The hour after the end of the range
+
+        Returns:
+            AnnualTimeseries: The timeseries restricted to the range of hours
+        """
+        return AnnualTimeseries(
+            self.years, self.profiles[:, start:stop], self.year_index, self.scale
+        )
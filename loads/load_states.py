@@ -0,0 +1,183 @@
+"""
+Yearly state of the building profiles served by a network asset
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from loads.annual_timeseries import AnnualTimeseries
+from loads.load_store import BASELINE, FUEL_INDEX, RETROFIT, LoadStore
+from loads.time_axis import HOURS_PER_YEAR
+
+
+class LoadStates:
+    """
+    Describes the yearly load of a network asset as a (years x profiles) weight matrix over the
+    hourly profiles of a load store. Each building meter is either on its baseline or its retrofit
+    profile in a given year, weighted by the load scaling factor of the building, so the load of
+    any asset is the weight matrix multiplied by the (profiles x hours) profile matrix, computed in
+    a single matrix product. Buildings sharing a profile share its column
+
+    The weights only change in breakpoint years, where a downstream building changes state. The
+    load is computed once for each distinct state and mapped back to the years, so the work scales
+    with the number of state changes rather than the number of years
+
+    Args:
+        load_store (LoadStore): Store holding the building profiles
+        fuel (str): The fuel of the profiles
+        columns (np.ndarray): Rows of the store hourly profile matrix used by the asset
+        weights (np.ndarray): Weight of each profile in each year, shape (years, len(columns))
+
+    Attributes:
+        load_store (LoadStore): Store holding the building profiles
+        fuel (str): The fuel of the profiles
+        columns (np.ndarray): Rows of the store hourly profile matrix used by the asset
+        weights (np.ndarray): Weight of each profile in each year, shape (years, len(columns))
+
+    Methods:
+        for_building (LoadStates): Returns the states of a single building
+        combine (LoadStates): Returns the states of the sum of several assets
+        get_distinct_states (Tuple[np.ndarray, np.ndarray]): Returns the distinct yearly weights
+            and the state of each year
+        get_distinct_timeseries (Tuple[np.ndarray, np.ndarray]): Returns the hourly load of each
+            distinct state and the state of each year
+        get_timeseries (np.ndarray): Returns the hourly load for every year
+    """
+    def __init__(
+            self,
+            load_store: LoadStore,
+            fuel: str,
+            columns: np.ndarray,
+            weights: np.ndarray
+    ):
+        self.load_store: LoadStore = load_store
+        self.fuel: str = fuel
+        self.columns: np.ndarray = columns
+        self.weights: np.ndarray = weights
+
+    @classmethod
+    def for_building(
+            cls,
+            load_store: LoadStore,
+            load_index: int,
+            fuel: str,
+            is_baseline: Sequence[bool]
+    ) -> "LoadStates":
+        """
+        States of a single building, on its baseline profile in the years where is_baseline is
+        True and on its retrofit profile otherwise, weighted by the load scaling factor of the
+        building
+
+        Args:
+            load_store (LoadStore): Store holding the building profiles
+            load_index (int): Position of the building in the store
+            fuel (str): The fuel of the profiles
+            is_baseline (Sequence[bool]): True in the years the building is on its baseline
+
+        Returns:
+            LoadStates: The building states
+        """
+        is_baseline = np.asarray(is_baseline, dtype=bool)
+
+        scale = load_store.get_scale(load_index)
+
+        weights = np.zeros((len(is_baseline), 2))
+        weights[:, BASELINE] = is_baseline * scale
+        weights[:, RETROFIT] = ~is_baseline * scale
+
+        columns = np.array([
+            load_store.get_building_profile_row(load_index, BASELINE),
+            load_store.get_building_profile_row(load_index, RETROFIT),
+        ])
+
+        return cls(load_store, fuel, columns, weights)
+
+    @classmethod
+    def combine(cls, states: List["LoadStates"]) -> "LoadStates":
+        """
+        States of the sum of several assets. Profiles shared by more than one asset are merged
+
+        Args:
+            states (List[LoadStates]): States of the assets. Must share a load store and fuel
+
+        Returns:
+            LoadStates: The combined states
+        """
+        load_store = states[0].load_store
+        fuel = states[0].fuel
+
+        if any(s.load_store is not load_store or s.fuel != fuel for s in states):
+            raise ValueError("Only load states from the same load store and fuel can be combined.")
+
+        columns, inverse = np.unique(
+            np.concatenate([s.columns for s in states]), return_inverse=True
+        )
+
+        weights = np.zeros((len(columns), states[0].weights.shape[0]))
+        np.add.at(weights, inverse, np.hstack([s.weights for s in states]).T)
+
+        return cls(load_store, fuel, columns, weights.T)
+
+    def get_distinct_states(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distinct rows of the weight matrix, shape (states, len(columns)), and the position of the
+        state of each year in them
+        """
+        distinct_weights, year_index = np.unique(self.weights, axis=0, return_inverse=True)
+
+        return distinct_weights, year_index.reshape(-1)
+
+    def get_distinct_timeseries(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Hourly load of each distinct state, shape (states, hours), and the position of the state
+        of each year in them. Profiles with no weight in any year, or no consumption of the fuel,
+        are left out of the product, which is computed in the dtype of the load store
+        """
+        distinct_weights, year_index = self.get_distinct_states()
+
+        used = distinct_weights.any(axis=0) & self.load_store.nonzero[
+            self.columns, FUEL_INDEX[self.fuel]
+        ]
+        hourly_profiles = self.load_store.get_hourly_profiles(self.fuel)
+        weights = distinct_weights[:, used].astype(hourly_profiles.dtype, copy=False)
+
+        return weights @ hourly_profiles[self.columns[used]], year_index
+
+    def get_timeseries(self) -> np.ndarray:
+        """
+        Hourly load for every year, shape (years, hours)
+        """
+        distinct_timeseries, year_index = self.get_distinct_timeseries()
+
+        return distinct_timeseries[year_index]
+
+
+def get_annual_timeseries(
+        states: List[Optional[LoadStates]],
+        years: List[int]
+) -> Tuple[Optional[LoadStates], AnnualTimeseries]:
+    """
+    Combined states and hourly load by year of a network asset, from the states of its connected
+    assets. The load is computed once per distinct downstream state, and years with the same state
+    share the same array. An asset without any connected states has no load
+
+    Args:
+        states (List[Optional[LoadStates]]): States of the connected assets, None for assets
+            without loads
+        years (List[int]): The simulation years
+
+    Returns:
+        Tuple[Optional[LoadStates], AnnualTimeseries]: The combined states, None if no connected
+            asset has states, and the hourly load by year
+    """
+    states = [s for s in states if s is not None]
+
+    if not states:
+        return None, AnnualTimeseries(
+            years, np.zeros((1, HOURS_PER_YEAR)), np.zeros(len(years), dtype=int)
+        )
+
+    combined_states = LoadStates.combine(states)
+    distinct_timeseries, year_index = combined_states.get_distinct_timeseries()
+
+    return combined_states, AnnualTimeseries(years, distinct_timeseries, year_index)
@@ -0,0 +1,336 @@
+"""
+Array-backed store of building energy consumption profiles, shared by buildings and network assets
+"""
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+FUELS = ["electricity", "natural_gas", "propane", "fuel_oil"]
+FUEL_INDEX = {fuel: idx for idx, fuel in enumerate(FUELS)}
+
+BASELINE = 0
+RETROFIT = 1
+
+DEFAULT_CAPACITY = 16
+
+# Floating point types the profiles can be held in. Annual totals are always summed in float64
+PRECISIONS = {"float64": np.float64, "float32": np.float32}
+
+
+class LoadStore:
+    """
+    Contiguous store of the total consumption profiles by fuel used by the buildings of a scenario.
+    Profiles are held once in one array of shape (profiles, fuels, intervals). Each building refers
+    to a baseline and a retrofit profile row plus a load scaling factor, so buildings built from the
+    same archetype file share its profiles and the store grows with the number of archetypes rather
+    than the number of buildings. Buildings, meters, and network assets refer to a building by its
+    integer position in the store
+
+    Profiles added with a key are interned: adding a profile under a key that is already held
+    returns the existing row without copying. Scaling factors are applied when a building profile
+    is read, and network loads are weighted sums of the shared profiles
+
+    Hourly profiles and annual totals are computed once per fuel for all profiles and shared by
+    every reader, so meters on the same building do not resample its profiles again. Profiles and
+    hourly profiles are held in the dtype of the store, and annual totals are summed in float64.
+    Fuels a profile does not use are left as zeros and skipped by the hourly profiles, the totals,
+    and the network load aggregation
+
+    Args:
+        None
+
+    Optional args:
+        capacity (int): The number of profiles to allocate space for. The store grows as needed
+        dtype (np.dtype): The floating point type used to hold the profiles
+
+    Attributes:
+        building_ids (List[str]): The building ID at each position of the store
+        intervals_per_hour (int): Number of profile intervals per hour
+        dtype (np.dtype): The floating point type used to hold the profiles
+        profiles (np.ndarray): Profiles held by the store, shape (profiles, 4, intervals)
+        nonzero (np.ndarray): Whether each profile has any consumption of each fuel, shape
+            (profiles, 4)
+        profile_rows (np.ndarray): Baseline and retrofit profile row of each building, shape
+            (buildings, 2)
+        scales (np.ndarray): Load scaling factor of each building
+
+    Methods:
+        add_profile (int): Register a fuel profile and return its row, reusing the row of a key
+            that is already held
+        get_profile_row (int): Return the row of the profile held under a key, if any
+        get_profile_key (Hashable): Return the key of a profile row
+        add_building (int): Register the baseline and retrofit profiles of a building and return
+            its position
+        get_profile (np.ndarray): Return the interval profile for a building, state, and fuel
+        get_hourly_profile (np.ndarray): Return the hourly profile for a building, state, and fuel
+        get_total (float): Return the total annual consumption for a building, state, and fuel
+        get_hourly_profiles (np.ndarray): Return the hourly profiles of all profile rows for a fuel
+        get_totals (np.ndarray): Return the total annual consumption of all profile rows for a fuel
+    """
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, dtype: np.dtype = np.float64):
+        self._capacity: int = max(capacity, 1)
+        self._dtype: np.dtype = np.dtype(dtype)
+        self._profiles: np.ndarray = None
+        self._nonzero: np.ndarray = None
+        self._n_profiles: int = 0
+        self._profile_keys: List[Hashable] = []
+        self._key_rows: Dict[Hashable, int] = {}
+
+        self.building_ids: List[str] = []
+        self.intervals_per_hour: int = 1
+
+        self._profile_rows: List[Tuple[int, int]] = []
+        self._scales: List[float] = []
+
+        self._hourly_profiles: Dict[str, np.ndarray] = {}
+        self._totals: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.building_ids)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def profiles(self) -> np.ndarray:
+        if self._profiles is None:
+            return np.zeros((0, len(FUELS), 0), dtype=self._dtype)
+
+        return self._profiles[:self._n_profiles]
+
+    @property
+    def nonzero(self) -> np.ndarray:
+        if self._nonzero is None:
+            return np.zeros((0, len(FUELS)), dtype=bool)
+
+        return self._nonzero[:self._n_profiles]
+
+    @property
+    def profile_rows(self) -> np.ndarray:
+        return np.array(self._profile_rows, dtype=np.intp).reshape(-1, 2)
+
+    @property
+    def scales(self) -> np.ndarray:
+        return np.array(self._scales, dtype=np.float64)
+
+    def add_profile(
+            self,
+            profile: Dict[str, np.ndarray],
+            intervals_per_hour: int = 1,
+            key: Hashable = None
+    ) -> int:
+        """
+        Register a total consumption profile by fuel. A profile added under a key that is already
+        held is not copied again, and the existing row is returned. Missing and all-zero fuels are
+        not copied, and are marked as zero
+
+        Args:
+            profile (Dict[str, np.ndarray]): Total consumption profile, by fuel
+
+        Optional args:
+            intervals_per_hour (int): Number of profile intervals per hour
+            key (Hashable): Identifies the source of the profile, such as its filepath. Profiles
+                without a key are never shared
+
+        Returns:
+            int: The row of the profile in the store
+        """
+        if key is not None and key in self._key_rows:
+            return self._key_rows[key]
+
+        n_intervals = len(next(iter(profile.values()))) if profile else self._get_n_intervals()
+
+        if self._profiles is None:
+            self.intervals_per_hour = intervals_per_hour
+            self._profiles = np.zeros(
+                (self._capacity, len(FUELS), n_intervals), dtype=self._dtype
+            )
+            self._nonzero = np.zeros((self._capacity, len(FUELS)), dtype=bool)
+
+        if n_intervals != self._profiles.shape[-1] or intervals_per_hour != self.intervals_per_hour:
+            raise ValueError(
+                f"Profile {key} has {n_intervals} intervals at {intervals_per_hour} per hour. "
+                f"Expected {self._profiles.shape[-1]} intervals at {self.intervals_per_hour} "
+                "per hour."
+            )
+
+        row = self._n_profiles
+        if row == self._profiles.shape[0]:
+            self._grow()
+
+        for fuel, fuel_idx in FUEL_INDEX.items():
+            if fuel in profile and np.any(profile[fuel]):
+                self._profiles[row, fuel_idx] = profile[fuel]
+                self._nonzero[row, fuel_idx] = True
+
+        self._n_profiles += 1
+        self._profile_keys.append(key)
+        if key is not None:
+            self._key_rows[key] = row
+
+        self._hourly_profiles = {}
+        self._totals = {}
+
+        return row
+
+    def _get_n_intervals(self) -> int:
+        if self._profiles is None:
+            return 0
+
+        return self._profiles.shape[-1]
+
+    def get_profile_row(self, key: Hashable) -> Optional[int]:
+        """
+        Row of the profile held under a key, or None if the key is not held
+        """
+        return self._key_rows.get(key)
+
+    def get_profile_key(self, row: int) -> Hashable:
+        """
+        Key of a profile row, or None if the profile was added without a key
+        """
+        return self._profile_keys[row]
+
+    def add_building(
+            self,
+            building_id: str,
+            baseline: Union[Dict[str, np.ndarray], int],
+            retrofit: Union[Dict[str, np.ndarray], int],
+            intervals_per_hour: int = 1,
+            scale: float = 1.
+    ) -> int:
+        """
+        Register the baseline and retrofit profiles of a building
+
+        Args:
+            building_id (str): The building ID
+            baseline (Union[Dict[str, np.ndarray], int]): Baseline total consumption profile, by
+                fuel, or the row of a profile already in the store
+            retrofit (Union[Dict[str, np.ndarray], int]): Retrofit total consumption profile, by
+                fuel, or the row of a profile already in the store
+
+        Optional args:
+            intervals_per_hour (int): Number of profile intervals per hour
+            scale (float): Load scaling factor applied to both profiles of the building
+
+        Returns:
+            int: The position of the building in the store
+        """
+        rows = []
+        for profile in [baseline, retrofit]:
+            if isinstance(profile, dict):
+                profile = self.add_profile(profile, intervals_per_hour)
+
+            elif not 0 <= profile < self._n_profiles:
+                raise ValueError(
+                    f"Building {building_id} refers to profile row {profile} but the store holds "
+                    f"{self._n_profiles} profiles."
+                )
+
+            rows.append(profile)
+
+        self.building_ids.append(building_id)
+        self._profile_rows.append(tuple(rows))
+        self._scales.append(float(scale))
+
+        return len(self.building_ids) - 1
+
+    def _grow(self) -> None:
+        grown = np.zeros(
+            (2 * self._profiles.shape[0], *self._profiles.shape[1:]), dtype=self._dtype
+        )
+        grown[:self._profiles.shape[0]] = self._profiles
+        self._profiles = grown
+
+        nonzero = np.zeros((grown.shape[0], len(FUELS)), dtype=bool)
+        nonzero[:self._nonzero.shape[0]] = self._nonzero
+        self._nonzero = nonzero
+
+    def get_building_profile_row(self, idx: int, state: int) -> int:
+        """
+        Profile row used by a building in a state
+        """
+        return self._profile_rows[idx][state]
+
+    def get_scale(self, idx: int) -> float:
+        """
+        Load scaling factor of a building
+        """
+        return self._scales[idx]
+
+    def get_profile(self, idx: int, state: int, fuel: str) -> np.ndarray:
+        """
+        Interval profile for a building, scaled by its load scaling factor. Returns a read-only
+        view into the store for unscaled buildings
+        """
+        profile = self._profiles[self._profile_rows[idx][state], FUEL_INDEX[fuel]]
+
+        if self._scales[idx] != 1:
+            profile = profile * self._scales[idx]
+
+        profile.flags.writeable = False
+
+        return profile
+
+    def get_hourly_profile(self, idx: int, state: int, fuel: str) -> np.ndarray:
+        """
+        Hourly profile for a building, summing the intervals within each hour and scaled by its
+        load scaling factor. Returns a read-only row of the cached hourly profiles of the fuel for
+        unscaled buildings
+        """
+        profile = self.get_hourly_profiles(fuel)[self._profile_rows[idx][state]]
+
+        if self._scales[idx] != 1:
+            profile = profile * self._scales[idx]
+            profile.flags.writeable = False
+
+        return profile
+
+    def get_total(self, idx: int, state: int, fuel: str) -> float:
+        """
+        Total annual consumption for a building, read from the cached totals of the fuel and scaled
+        by its load scaling factor
+        """
+        return self.get_totals(fuel)[self._profile_rows[idx][state]] * self._scales[idx]
+
+    def get_hourly_profiles(self, fuel: str) -> np.ndarray:
+        """
+        Hourly profiles of all profile rows for a fuel, shape (profiles, hours), before load
+        scaling. Only profiles with consumption of the fuel are summed. The result is cached until
+        another profile is added
+        """
+        if fuel not in self._hourly_profiles:
+            nonzero = self.nonzero[:, FUEL_INDEX[fuel]]
+            profiles = self.profiles[nonzero, FUEL_INDEX[fuel]]
+
+            n_hours = self._get_n_intervals() // self.intervals_per_hour
+
+            hourly_profiles = np.zeros((self._n_profiles, n_hours), dtype=self._dtype)
+            hourly_profiles[nonzero] = profiles.reshape(
+                len(profiles), n_hours, self.intervals_per_hour
+            ).sum(axis=2)
+            hourly_profiles.flags.writeable = False
+
+            self._hourly_profiles[fuel] = hourly_profiles
+
+        return self._hourly_profiles[fuel]
+
+    def get_totals(self, fuel: str) -> np.ndarray:
+        """
+        Total annual consumption of all profile rows for a fuel, shape (profiles,), summed in
+        float64 before load scaling. Only profiles with consumption of the fuel are summed. The
+        result is cached until another profile is added
+        """
+        if fuel not in self._totals:
+            nonzero = self.nonzero[:, FUEL_INDEX[fuel]]
+            profiles = self.profiles[nonzero, FUEL_INDEX[fuel]]
+
+            totals = np.zeros(self._n_profiles)
+            totals[nonzero] = profiles.sum(axis=1, dtype=np.float64)
+            totals.flags.writeable = False
+
+            self._totals[fuel] = totals
+
+        return self._totals[fuel]
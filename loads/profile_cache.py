@@ -0,0 +1,161 @@
+"""
+On-disk cache of parsed consumption profiles, keyed by the content hash of the source file
+"""
+import hashlib
+import json
+import os
+import tempfile
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+PROFILE_CACHE_VERSION = 1
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+class ProfileCache:
+    """
+    Stores parsed consumption profiles as binary arrays so later runs memory-map them instead of
+    re-parsing the source CSV. Each entry is an ``.npy`` file of the profile values, an ``.npy``
+    file of the timestamps, and a small JSON index of the columns and dtypes. Entries are keyed
+    by the SHA-256 of the source file contents, so an edited file is parsed again
+
+    Only profiles with a naive DatetimeIndex and unique, all-numeric columns are cached. Other
+    profiles are returned from the parser unchanged
+
+    Args:
+        cache_dir (str): Directory holding the cache entries. Created on first write
+
+    Attributes:
+        cache_dir (str): Directory holding the cache entries
+
+    Methods:
+        get (pd.DataFrame): Return the parsed profile for a file, from the cache if present
+        get_key (str): Return the cache key for a file
+    """
+    def __init__(self, cache_dir: str):
+        self.cache_dir: str = cache_dir
+
+    def get_key(self, filepath: str, salt: str = "") -> str:
+        """
+        Cache key for a file, combining the file contents with the cache version and a salt
+        identifying the parser
+
+        Args:
+            filepath (str): Filepath of the source profile
+
+        Optional args:
+            salt (str): Identifies the parsing applied to the file
+
+        Returns:
+            str: Hex digest used to name the cache entry
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{PROFILE_CACHE_VERSION}|{salt}|".encode())
+
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def get(
+            self,
+            filepath: str,
+            parser: Callable[[str], pd.DataFrame],
+            salt: str = ""
+    ) -> pd.DataFrame:
+        """
+        Return the parsed profile for a file. On a cache miss the file is parsed and the result is
+        written to the cache. Profiles read from the cache are backed by read-only memory maps
+
+        Args:
+            filepath (str): Filepath of the source profile
+            parser (Callable[[str], pd.DataFrame]): Function that parses the source file
+
+        Optional args:
+            salt (str): Identifies the parsing applied to the file
+
+        Returns:
+            pd.DataFrame: The parsed profile
+        """
+        key = self.get_key(filepath, salt)
+        index_path = os.path.join(self.cache_dir, f"{key}.json")
+
+        if os.path.exists(index_path):
+            return self._read(key, index_path)
+
+        profile = parser(filepath)
+        self._write(key, index_path, profile)
+
+        return profile
+
+    def _read(self, key: str, index_path: str) -> pd.DataFrame:
+        with open(index_path) as f:
+            index = json.load(f)
+
+        values = np.load(os.path.join(self.cache_dir, f"{key}.values.npy"), mmap_mode="r")
+        timestamps = np.load(os.path.join(self.cache_dir, f"{key}.index.npy"), mmap_mode="r")
+
+        profile = pd.DataFrame(
+            values,
+            index=pd.DatetimeIndex(timestamps, name=index["index_name"]),
+            columns=index["columns"],
+            copy=False
+        )
+
+        if index["dtypes"]:
+            profile = profile.astype(index["dtypes"])
+
+        return profile
+
+    def _write(self, key: str, index_path: str, profile: pd.DataFrame) -> None:
+        """
+        Write a cache entry. The JSON index is written last, so an entry is only visible once its
+        arrays are complete
+        """
+        if not isinstance(profile.index, pd.DatetimeIndex) or profile.index.tz is not None:
+            return
+
+        if not profile.columns.is_unique:
+            return
+
+        if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in profile.dtypes):
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._write_atomic(
+            os.path.join(self.cache_dir, f"{key}.values.npy"),
+            lambda f: np.save(f, profile.to_numpy(dtype=np.float64))
+        )
+        self._write_atomic(
+            os.path.join(self.cache_dir, f"{key}.index.npy"),
+            lambda f: np.save(f, profile.index.values.astype("datetime64[ns]"))
+        )
+
+        index = {
+            "columns": list(profile.columns),
+            "index_name": profile.index.name,
+            "dtypes": {
+                column: str(dtype)
+                for column, dtype in profile.dtypes.items()
+                if dtype != np.float64
+            },
+        }
+        self._write_atomic(index_path, lambda f: f.write(json.dumps(index).encode()))
+
+    def _write_atomic(self, path: str, write: Callable) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+
+        except BaseException:
+            os.remove(tmp_path)
+            raise
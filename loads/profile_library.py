@@ -0,0 +1,62 @@
+"""
+Cache of parsed consumption profiles shared across buildings and scenarios
+"""
+from typing import Callable, Dict
+
+import pandas as pd
+
+from loads.profile_cache import ProfileCache
+
+
+class ProfileLibrary:
+    """
+    Holds each parsed consumption profile once, keyed by filepath. Profiles returned by the library
+    are shared and must not be modified in place
+
+    Args:
+        None
+
+    Optional args:
+        profile_cache (ProfileCache): On-disk cache used to load profiles that are not yet held
+
+    Attributes:
+        profiles (Dict[str, pd.DataFrame]): Parsed profiles, keyed by filepath
+        profile_cache (ProfileCache): On-disk cache used to load profiles that are not yet held
+
+    Methods:
+        get (pd.DataFrame): Return the parsed profile for a filepath, loading it on first use
+    """
+    def __init__(self, profile_cache: ProfileCache = None):
+        self.profiles: Dict[str, pd.DataFrame] = {}
+        self.profile_cache: ProfileCache = profile_cache
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def get(
+            self,
+            filepath: str,
+            loader: Callable[[str], pd.DataFrame],
+            cache_salt: str = ""
+    ) -> pd.DataFrame:
+        """
+        Return the parsed profile for a filepath
+
+        Args:
+            filepath (str): Filepath of the consumption profile
+            loader (Callable[[str], pd.DataFrame]): Function that parses the profile on first use
+
+        Optional args:
+            cache_salt (str): Identifies the parsing applied by the loader in the on-disk cache
+
+        Returns:
+            pd.DataFrame: The shared parsed profile
+        """
+        if filepath not in self.profiles:
+            if self.profile_cache is not None:
+                self.profiles[filepath] = self.profile_cache.get(filepath, loader, cache_salt)
+
+            else:
+                self.profiles[filepath] = loader(filepath)
+
+        return self.profiles[filepath]
@@ -0,0 +1,112 @@
+"""
+Fast ingest of consumption profiles that sit on a fixed interval grid over one year
+"""
+import csv
+import os
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from loads.time_axis import HOURS_PER_YEAR
+
+
+PROFILE_INTERVAL = pd.Timedelta(minutes=15)
+PROFILE_INTERVALS = HOURS_PER_YEAR * int(pd.Timedelta(hours=1) / PROFILE_INTERVAL)
+
+TIMESTAMP_COLUMN = "timestamp"
+
+# Bytes read from the end of a file to find its last row
+TAIL_SIZE = 1 << 12
+
+
+def is_profile_column(column: str, column_mapping: Dict[str, str]) -> bool:
+    """
+    Whether a column of a profile file is kept when it is parsed: columns renamed by the mapping
+    and columns already named ``out.*`` are kept. All other columns are skipped
+
+    Args:
+        column (str): The column of the file
+        column_mapping (Dict[str, str]): Mapping of file columns to consumption columns
+
+    Returns:
+        bool: True if the column is kept
+    """
+    return column in column_mapping or column.startswith("out.")
+
+
+def read_fixed_grid_profile(
+        filepath: str,
+        column_mapping: Dict[str, str],
+        shift: int = -1
+) -> Optional[pd.DataFrame]:
+    """
+    Parse a consumption profile on the fixed 15-minute grid of one year. Only the first and last
+    timestamps and the row count are checked; the index is built from them rather than parsed on
+    every row. Kept columns are read as float64 and renamed with the mapping
+
+    Files that are not on the grid, that are not UTF-8, or whose kept columns would collide once
+    renamed, are not parsed, and None is returned so the caller can fall back to a general parser
+
+    Args:
+        filepath (str): Filepath of the profile CSV, with a timestamp column
+        column_mapping (Dict[str, str]): Mapping of file columns to consumption columns
+
+    Optional args:
+        shift (int): Number of intervals the timestamps are shifted by
+
+    Returns:
+        Optional[pd.DataFrame]: The parsed profile, one row per interval, or None
+    """
+    # The tail is read in binary, as the seek can land inside a multi-byte character. Only the
+    # last line is decoded
+    with open(filepath, "rb") as f:
+        header_line = f.readline()
+        first_row = f.readline()
+
+        f.seek(0, os.SEEK_END)
+        f.seek(max(f.tell() - TAIL_SIZE, 0))
+        tail = f.read().rstrip(b"\r\n").rsplit(b"\n", 1)[-1]
+
+    try:
+        header = next(csv.reader([header_line.decode("utf-8-sig")]), [])
+        first_row = first_row.decode("utf-8")
+        tail = tail.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+    if TIMESTAMP_COLUMN not in header or not first_row:
+        return None
+
+    columns = [column for column in header if is_profile_column(column, column_mapping)]
+    renamed = [column_mapping.get(column, column) for column in columns]
+    if len(set(renamed)) != len(renamed):
+        return None
+
+    timestamp_position = header.index(TIMESTAMP_COLUMN)
+    try:
+        first = pd.Timestamp(next(csv.reader([first_row]))[timestamp_position])
+        last = pd.Timestamp(next(csv.reader([tail]))[timestamp_position])
+    except (IndexError, ValueError):
+        return None
+
+    if last - first != (PROFILE_INTERVALS - 1) * PROFILE_INTERVAL:
+        return None
+
+    profile = pd.read_csv(
+        filepath,
+        usecols=columns,
+        dtype={column: np.float64 for column in columns},
+        engine="c",
+    )
+
+    if len(profile) != PROFILE_INTERVALS:
+        return None
+
+    profile.columns = renamed
+    profile.index = pd.DatetimeIndex(
+        first + (np.arange(PROFILE_INTERVALS) + shift) * PROFILE_INTERVAL,
+        name=TIMESTAMP_COLUMN,
+    )
+
+    return profile
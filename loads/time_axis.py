@@ -0,0 +1,70 @@
+"""
+Canonical positional time axis shared by building profiles and network assets
+"""
+import numpy as np
+import pandas as pd
+
+
+# Profiles are aligned to a single reference year when they are ingested. From then on, a
+# timestep is identified by its position in the year, and profiles are combined positionally
+REFERENCE_YEAR = 2018
+HOURS_PER_YEAR = 8760
+
+HOUR_OF_YEAR = np.arange(HOURS_PER_YEAR)
+HOUR_OF_YEAR.flags.writeable = False
+
+YEAR_TIMESTAMPS = pd.date_range(
+    start=f"{REFERENCE_YEAR}-01-01", end=f"{REFERENCE_YEAR + 1}-01-01", freq="H", inclusive="left"
+)
+
+
+def get_intervals_per_hour(index: pd.DatetimeIndex) -> int:
+    """
+    Number of profile intervals per hour, for a profile with a regular index. Only the spacing of
+    the index is used, so profiles with shifted timestamps share the same positions
+
+    Args:
+        index (pd.DatetimeIndex): The index of the profile
+
+    Returns:
+        int: The number of intervals per hour
+    """
+    if len(index) < 2:
+        raise ValueError("A profile needs at least two timestamps to infer its interval.")
+
+    steps = np.diff(index.asi8)
+    if (steps != steps[0]).any():
+        raise ValueError("Profile timestamps must be evenly spaced.")
+
+    interval = pd.Timedelta(steps[0], unit="ns")
+    if interval <= pd.Timedelta(0) or pd.Timedelta(hours=1) % interval != pd.Timedelta(0):
+        raise ValueError(f"A profile interval of {interval} does not divide an hour.")
+
+    return int(pd.Timedelta(hours=1) / interval)
+
+
+def to_positional(frame: pd.DataFrame, columns: list, intervals_per_hour: int) -> np.ndarray:
+    """
+    Align profile columns to the positional axis: one row per column, one value per interval of
+    the year. Missing columns are zeros
+
+    Args:
+        frame (pd.DataFrame): The profiles, with one row per interval
+        columns (list): The columns to take from the frame
+        intervals_per_hour (int): The number of intervals per hour
+
+    Returns:
+        np.ndarray: The aligned profiles, shape (columns, intervals)
+    """
+    if len(frame) % intervals_per_hour:
+        raise ValueError(
+            f"A profile of {len(frame)} intervals at {intervals_per_hour} per hour does not cover "
+            "whole hours."
+        )
+
+    aligned = np.zeros((len(columns), len(frame)))
+    for row, column in enumerate(columns):
+        if column in frame:
+            aligned[row] = frame[column].to_numpy(dtype=np.float64, na_value=0.)
+
+    return aligned
@@ -1,57 +1,48 @@
 """
 Simple script for post-processing output tables from multiple runs
 """
-import os
+import argparse
 
-import pandas as pd
+from results.result_combiner import DEFAULT_WORKERS, ResultCombiner
+from scenario_creator.create_scenario import OUTPUTS_BASEPATH
 
 
 def main():
     """
-    Post-processing script for combining output tables across scenarios
+    Post-processing script for combining output tables across scenarios. Only scenarios whose
+    outputs changed since the last run are re-read
     """
-    scenarios = [
-        "accelerated_elec",
-        "accelerated_elec_higheff",
-        "continued_gas",
-        "hybrid_gas",
-        "hybrid_npa",
-        "natural_elec",
-        "natural_elec_higheff",
-        "hybrid_gas_immediate",
-    ]
-
-    output_files = [
-        "book_val",
-        "consumption_costs",
-        "consumption_emissions",
-        "energy_consumption",
-        "fuel_type",
-        "is_retrofit_vec_table",
-        "methane_leaks",
-        "operating_costs",
-        "peak_consump",
-        "retrofit_cost",
-        "retrofit_year",
-        "stranded_val"
-    ]
-
-    output_dir = "./outputs_combined/scenarios/combined/"
-
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-
-    for f in output_files:
-        output_dfs = []
-        for scenario in scenarios:
-            filepath = os.path.join(f"./outputs_combined/scenarios/{scenario}/", f"{f}.csv")
-            output_df = pd.read_csv(filepath)
-            output_df.loc[:, "scenario"] = scenario
-            output_dfs.append(output_df)
-
-        combined_output = pd.concat(output_dfs)
-        combined_output.to_csv(os.path.join(output_dir, f"{f}.csv"), index=False)
-
+    parser = argparse.ArgumentParser(
+        description="Combine the CSV output tables of all scenarios for a street segment"
+    )
+    parser.add_argument(
+        "street_segment",
+        nargs="?",
+        help="The street segment to combine. Combines every street segment if omitted"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of threads used to read output tables (default: {DEFAULT_WORKERS})"
+    )
+    args = parser.parse_args()
+
+    combiner = ResultCombiner(OUTPUTS_BASEPATH, workers=args.workers)
+
+    if args.street_segment:
+        segment = args.street_segment.lower()
+        n_parsed = {segment: combiner.combine_segment(segment)}
+
+    else:
+        n_parsed = combiner.combine()
+
+    for segment, tables in n_parsed.items():
+        print(
+            "Combined {} tables for segment {}, re-reading {} scenario tables".format(
+                len(tables), segment or "<none>", sum(tables.values())
+            )
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,137 @@
+"""
+Process-wide registry of the reference tables shared by buildings and utility assets
+"""
+import os
+from types import MappingProxyType
+from typing import Callable, Dict, Hashable, Mapping, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class ReferenceData:
+    """
+    Loads each reference table once per process and indexes it for lookups. Tables are keyed by
+    kind and filepath, and lookups are read-only so they can be shared by every asset. Tables
+    loaded before a pool of worker processes is forked are shared with the workers
+
+    Args:
+        None
+
+    Attributes:
+        None
+
+    Methods:
+        get_leakage_factors (Mapping[Tuple[str, str], float]): Leakage factor by asset type and
+            material code
+        get_operating_expenses (Mapping[str, Mapping[str, float]]): O&M expenses by material
+        get_building_costs (Mapping[str, Mapping[str, float]]): Asset costs by building ID
+        get_consumption_rates (Mapping[str, np.ndarray]): Annual consumption rates by fuel
+        clear (None): Drop all loaded tables
+    """
+    def __init__(self):
+        self._tables: Dict[Tuple[str, str], Mapping] = {}
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def _get(self, kind: str, filepath: str, loader: Callable[[str], Mapping]) -> Mapping:
+        key = (kind, os.path.normpath(filepath))
+
+        if key not in self._tables:
+            self._tables[key] = loader(filepath)
+
+        return self._tables[key]
+
+    def get_leakage_factors(self, filepath: str) -> Mapping[Tuple[str, str], float]:
+        """
+        Leakage factors, indexed by asset type and material code
+
+        Args:
+            filepath (str): Filepath of the leakage factors table
+
+        Returns:
+            Mapping[Tuple[str, str], float]: Leakage factor by (asset, code)
+        """
+        return self._get("leakage_factors", filepath, _load_leakage_factors)
+
+    def get_operating_expenses(self, filepath: str) -> Mapping[str, Mapping[str, float]]:
+        """
+        Annual operating expenses of gas pipes, indexed by material
+
+        Args:
+            filepath (str): Filepath of the operating expenses table
+
+        Returns:
+            Mapping[str, Mapping[str, float]]: Row of the table by material
+        """
+        return self._get("operating_expenses", filepath, _read_indexed("material"))
+
+    def get_building_costs(self, filepath: str) -> Mapping[str, Mapping[str, float]]:
+        """
+        Asset costs of the buildings, indexed by building ID
+
+        Args:
+            filepath (str): Filepath of the asset costs table
+
+        Returns:
+            Mapping[str, Mapping[str, float]]: Row of the table by building ID
+        """
+        return self._get("building_costs", filepath, _read_indexed("building_id"))
+
+    def get_consumption_rates(self, filepath: str) -> Mapping[str, np.ndarray]:
+        """
+        Annual consumption rates by fuel, one per year in the order of the table
+
+        Args:
+            filepath (str): Filepath of the consumption rates table
+
+        Returns:
+            Mapping[str, np.ndarray]: Read-only array of annual rates by fuel
+        """
+        return self._get("consumption_rates", filepath, _load_consumption_rates)
+
+    def clear(self) -> None:
+        """
+        Drop all loaded tables, so they are read again on next use
+
+        Returns:
+            None
+        """
+        self._tables = {}
+
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    values.flags.writeable = False
+
+    return values
+
+
+def _load_leakage_factors(filepath: str) -> Mapping[Tuple[str, str], float]:
+    table = pd.read_csv(filepath)
+
+    return MappingProxyType({
+        (asset, code): float(value)
+        for asset, code, value in zip(table["asset"], table["code"], table["value"])
+    })
+
+
+def _read_indexed(index_col: str) -> Callable[[str], Mapping[Hashable, Mapping[str, float]]]:
+    def loader(filepath: str) -> Mapping[Hashable, Mapping[str, float]]:
+        rows = pd.read_csv(filepath, index_col=index_col).to_dict(orient="index")
+
+        return MappingProxyType({key: MappingProxyType(row) for key, row in rows.items()})
+
+    return loader
+
+
+def _load_consumption_rates(filepath: str) -> Mapping[str, np.ndarray]:
+    table = pd.read_csv(filepath, index_col=0)
+
+    return MappingProxyType({
+        column: _read_only(table[column].to_numpy(copy=True)) for column in table.columns
+    })
+
+
+# Shared by everything in the process, and inherited by forked worker processes
+REFERENCE_DATA = ReferenceData()
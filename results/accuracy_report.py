@@ -0,0 +1,65 @@
+"""
+Compares the output tables of a scenario run with those of a reference run
+"""
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+
+def get_max_relative_difference(table: pd.DataFrame, reference: pd.DataFrame) -> float:
+    """
+    Largest relative difference between the numeric columns of an output table and the same table
+    from a reference run. Values equal in both tables, including zeros and NaNs, have no
+    difference. A non-zero value where the reference is zero, or a NaN on one side only, has an
+    infinite difference
+
+    Args:
+        table (pd.DataFrame): The output table
+        reference (pd.DataFrame): The output table of the reference run
+
+    Returns:
+        float: The maximum relative difference, 0 for tables without numeric values
+    """
+    if table.shape != reference.shape or list(table.columns) != list(reference.columns):
+        raise ValueError("Output tables must have the same columns and rows to be compared.")
+
+    columns = table.select_dtypes(include=["number"]).columns
+    if columns.empty or table.empty:
+        return 0.
+
+    values = table[columns].to_numpy(dtype=np.float64)
+    reference_values = reference[columns].to_numpy(dtype=np.float64)
+
+    is_nan = np.isnan(values)
+    is_reference_nan = np.isnan(reference_values)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative = np.abs(values - reference_values) / np.abs(reference_values)
+
+    relative[values == reference_values] = 0.
+    relative[is_nan & is_reference_nan] = 0.
+    relative[is_nan != is_reference_nan] = np.inf
+
+    return float(relative.max())
+
+
+def get_accuracy_report(
+        tables: Dict[str, pd.DataFrame],
+        reference_tables: Dict[str, pd.DataFrame]
+) -> Dict[str, float]:
+    """
+    Maximum relative difference of every output table from the same table of a reference run
+
+    Args:
+        tables (Dict[str, pd.DataFrame]): Output tables, keyed by table name
+        reference_tables (Dict[str, pd.DataFrame]): Output tables of the reference run, keyed by
+            table name
+
+    Returns:
+        Dict[str, float]: The maximum relative difference of each table, keyed by table name
+    """
+    return {
+        table_name: get_max_relative_difference(table, reference_tables[table_name])
+        for table_name, table in tables.items()
+    }
@@ -0,0 +1,40 @@
+"""
+Writes scenario output tables to CSV files
+"""
+import json
+import os
+from typing import Dict
+
+import pandas as pd
+
+from results.result_sink import ResultSink
+
+
+RUN_METADATA_FILENAME = "run_metadata.json"
+
+
+class CsvSink(ResultSink):
+    """
+    Writes each output table to ``<base_path>/<segment>/<scenario>/<table>.csv``. Runs without a
+    segment write to ``<base_path>/<scenario>/``. The run metadata is written alongside the tables
+
+    Args:
+        base_path (str): Directory holding the results
+    """
+    def get_outputs_path(self, segment: str, scenario: str) -> str:
+        if segment:
+            return os.path.join(self.base_path, segment, scenario)
+
+        return os.path.join(self.base_path, scenario)
+
+    def write_results(self, run_metadata: dict, tables: Dict[str, pd.DataFrame]) -> None:
+        outputs_path = self.get_outputs_path(run_metadata["segment"], run_metadata["scenario"])
+
+        if not os.path.exists(outputs_path):
+            os.makedirs(outputs_path)
+
+        for table_name, table in tables.items():
+            table.to_csv(os.path.join(outputs_path, f"{table_name}.csv"), index=False)
+
+        with open(os.path.join(outputs_path, RUN_METADATA_FILENAME), "w") as f:
+            json.dump(run_metadata, f, indent=4)
@@ -0,0 +1,38 @@
+"""
+Keeps scenario output tables in memory
+"""
+from typing import Dict, Tuple
+
+import pandas as pd
+
+from results.result_sink import ResultSink
+
+
+class MemorySink(ResultSink):
+    """
+    Keeps the output tables and metadata of each run in memory, keyed by segment and scenario.
+    Used for runs whose results are compared rather than stored
+
+    Optional args:
+        base_path (str): Unused, kept for the ResultSink interface
+
+    Attributes:
+        results (Dict[Tuple[str, str], Dict[str, pd.DataFrame]]): Output tables of each run,
+            keyed by (segment, scenario)
+        run_metadata (Dict[Tuple[str, str], dict]): Metadata of each run, keyed by
+            (segment, scenario)
+    """
+    def __init__(self, base_path: str = None):
+        super().__init__(base_path)
+
+        self.results: Dict[Tuple[str, str], Dict[str, pd.DataFrame]] = {}
+        self.run_metadata: Dict[Tuple[str, str], dict] = {}
+
+    def get_outputs_path(self, segment: str, scenario: str) -> str:
+        return None
+
+    def write_results(self, run_metadata: dict, tables: Dict[str, pd.DataFrame]) -> None:
+        key = (run_metadata["segment"], run_metadata["scenario"])
+
+        self.results[key] = dict(tables)
+        self.run_metadata[key] = run_metadata
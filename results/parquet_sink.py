@@ -0,0 +1,79 @@
+"""
+Writes scenario output tables to a partitioned Parquet dataset
+"""
+import json
+import os
+from typing import Dict
+
+import pandas as pd
+
+from results.result_sink import ResultSink
+
+
+# Partition value used for runs without a segment, following the Hive convention for nulls
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+RUN_METADATA_FILENAME = "_run_metadata.json"
+
+
+class ParquetSink(ResultSink):
+    """
+    Writes each output table to a Hive-partitioned Parquet dataset at
+    ``<base_path>/segment=<segment>/scenario=<scenario>/table=<table>/``. Each table file holds the
+    run ID as a column, and the run metadata is written to the scenario partition. Requires pyarrow
+
+    Args:
+        base_path (str): Directory holding the dataset
+    """
+    def __init__(self, base_path: str):
+        super().__init__(base_path)
+
+        try:
+            import pyarrow  # noqa: F401
+
+        except ImportError as e:
+            raise ImportError("Writing Parquet results requires pyarrow to be installed.") from e
+
+    def get_outputs_path(self, segment: str, scenario: str) -> str:
+        return os.path.join(
+            self.base_path,
+            f"segment={segment or NULL_PARTITION}",
+            f"scenario={scenario}"
+        )
+
+    def write_results(self, run_metadata: dict, tables: Dict[str, pd.DataFrame]) -> None:
+        outputs_path = self.get_outputs_path(run_metadata["segment"], run_metadata["scenario"])
+
+        for table_name, table in tables.items():
+            table_path = os.path.join(outputs_path, f"table={table_name}")
+            os.makedirs(table_path, exist_ok=True)
+
+            # Files from earlier runs of this segment and scenario are replaced
+            for filename in os.listdir(table_path):
+                if filename.endswith(".parquet"):
+                    os.remove(os.path.join(table_path, filename))
+
+            table = _normalize_object_columns(table).assign(run_id=run_metadata["run_id"])
+            table.to_parquet(
+                os.path.join(table_path, f"part-{run_metadata['run_id']}.parquet"),
+                index=False
+            )
+
+        with open(os.path.join(outputs_path, RUN_METADATA_FILENAME), "w") as f:
+            json.dump(run_metadata, f, indent=4)
+
+
+def _normalize_object_columns(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast object columns holding a mix of types to strings, since Parquet columns have one type
+    """
+    mixed_columns = [
+        column for column in table.columns
+        if table[column].dtype == object
+        and pd.api.types.infer_dtype(table[column], skipna=True) not in ("string", "empty")
+    ]
+
+    if not mixed_columns:
+        return table
+
+    return table.astype({column: str for column in mixed_columns})
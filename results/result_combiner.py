@@ -0,0 +1,410 @@
+"""
+Combines the CSV output tables of every scenario of a street segment, updating only the scenarios
+whose outputs changed since the last combine
+"""
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+
+COMBINED_DIRNAME = "combined"
+MANIFEST_FILENAME = "_manifest.json"
+MANIFEST_VERSION = 1
+
+DEFAULT_WORKERS = 4
+
+
+class ResultCombiner:
+    """
+    Combines the CSV output tables written by CsvSink. Scenario partitions are discovered under
+    ``<outputs_path>/<segment>/<scenario>/`` and, for runs without a segment, under
+    ``<outputs_path>/<scenario>/``. For each segment, every table found in any of its scenarios is
+    combined into ``<segment>/combined/<table>.csv`` with a ``scenario`` column added. Missing
+    scenarios or tables are skipped
+
+    A manifest in the combined directory records the modification time, size, and SHA-256 of the
+    source of each scenario and table, and where its rows sit in the combined file. Later combines
+    only parse new or changed sources. Unchanged rows are copied from the combined file as is, and
+    new scenarios are appended to it
+
+    Args:
+        outputs_path (str): Directory holding the CSV outputs
+
+    Optional args:
+        workers (int): Number of threads used to read source tables
+
+    Attributes:
+        outputs_path (str): Directory holding the CSV outputs
+        workers (int): Number of threads used to read source tables
+
+    Methods:
+        discover_partitions (Dict[str, Dict[str, str]]): Returns the scenario output directories,
+            by segment and scenario
+        combine (Dict[str, Dict[str, int]]): Combines the outputs of every segment
+        combine_segment (Dict[str, int]): Combines the outputs of a single segment
+    """
+    def __init__(self, outputs_path: str, workers: int = DEFAULT_WORKERS):
+        self.outputs_path: str = outputs_path
+        self.workers: int = workers
+
+    def discover_partitions(self) -> Dict[str, Dict[str, str]]:
+        """
+        Find the scenario output directories. Outputs written without a segment are keyed by an
+        empty segment name
+
+        Args:
+            None
+
+        Returns:
+            Dict[str, Dict[str, str]]: Scenario output directories, by segment and scenario
+        """
+        partitions = {}
+
+        if not os.path.isdir(self.outputs_path):
+            return partitions
+
+        for name in sorted(os.listdir(self.outputs_path)):
+            path = os.path.join(self.outputs_path, name)
+
+            if name == COMBINED_DIRNAME or not os.path.isdir(path):
+                continue
+
+            if _list_tables(path):
+                partitions.setdefault("", {})[name] = path
+                continue
+
+            for scenario in sorted(os.listdir(path)):
+                scenario_path = os.path.join(path, scenario)
+
+                if scenario == COMBINED_DIRNAME or not os.path.isdir(scenario_path):
+                    continue
+
+                if _list_tables(scenario_path):
+                    partitions.setdefault(name, {})[scenario] = scenario_path
+
+        return partitions
+
+    def combine(self) -> Dict[str, Dict[str, int]]:
+        """
+        Combine the outputs of every discovered segment
+
+        Args:
+            None
+
+        Returns:
+            Dict[str, Dict[str, int]]: Number of scenario tables parsed, by segment and table
+        """
+        return {
+            segment: self.combine_segment(segment, scenarios)
+            for segment, scenarios in self.discover_partitions().items()
+        }
+
+    def combine_segment(self, segment: str, scenarios: Dict[str, str] = None) -> Dict[str, int]:
+        """
+        Combine the outputs of the scenarios of a segment
+
+        Args:
+            segment (str): The street segment. An empty string for outputs without a segment
+
+        Optional args:
+            scenarios (Dict[str, str]): Scenario output directories, by scenario. Discovered if not
+                provided
+
+        Returns:
+            Dict[str, int]: Number of scenario tables parsed, by table
+        """
+        if scenarios is None:
+            scenarios = self.discover_partitions().get(segment, {})
+
+        combined_path = os.path.join(self.outputs_path, segment, COMBINED_DIRNAME)
+        os.makedirs(combined_path, exist_ok=True)
+
+        manifest = self._read_manifest(combined_path)
+
+        # Entries are only kept while the combined file still matches them
+        for table, entries in list(manifest["tables"].items()):
+            if not _is_combined_file_valid(os.path.join(combined_path, f"{table}.csv"), entries):
+                del manifest["tables"][table]
+
+        tables = sorted({
+            table for scenario_path in scenarios.values() for table in _list_tables(scenario_path)
+        })
+
+        sources = {
+            table: {
+                scenario: os.path.join(scenario_path, f"{table}.csv")
+                for scenario, scenario_path in scenarios.items()
+                if os.path.exists(os.path.join(scenario_path, f"{table}.csv"))
+            }
+            for table in tables
+        }
+
+        # Sources are read in one pool across all tables
+        to_read = [
+            (table, scenario, filepath, manifest["tables"].get(table, {}).get(scenario))
+            for table in tables
+            for scenario, filepath in sources[table].items()
+        ]
+        to_read = [task for task in to_read if not _is_unchanged(task[3], task[2])]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            fragments = dict(zip(
+                [(table, scenario) for table, scenario, _, _ in to_read],
+                executor.map(lambda task: _read_fragment(task[2], task[1], task[3]), to_read)
+            ))
+
+        n_parsed = {}
+        for table in tables:
+            table_fragments = {
+                scenario: fragments[(table, scenario)]
+                for scenario in sources[table]
+                if (table, scenario) in fragments
+            }
+
+            manifest["tables"][table] = self._write_table(
+                os.path.join(combined_path, f"{table}.csv"),
+                sources[table],
+                manifest["tables"].get(table, {}),
+                table_fragments
+            )
+            n_parsed[table] = sum(
+                fragment["data"] is not None for fragment in table_fragments.values()
+            )
+
+        for table in set(manifest["tables"]) - set(tables):
+            del manifest["tables"][table]
+
+        self._write_manifest(combined_path, manifest)
+
+        return n_parsed
+
+    def _write_table(
+            self,
+            combined_filepath: str,
+            sources: Dict[str, str],
+            entries: Dict[str, dict],
+            fragments: Dict[str, dict]
+    ) -> Dict[str, dict]:
+        """
+        Write the combined file for a table and return its manifest entries. Rows of unchanged
+        scenarios are copied from the existing combined file, in their existing order. Changed
+        scenarios are replaced in place and new scenarios are appended
+        """
+        # Sources with a new modification time but the same contents only need their entry updated
+        for scenario, fragment in fragments.items():
+            if fragment["data"] is None and scenario in entries:
+                entries[scenario] = {**entries[scenario], **fragment["source"]}
+
+        changed = {
+            scenario: fragment for scenario, fragment in fragments.items()
+            if fragment["data"] is not None
+        }
+        stale = (set(entries) - set(sources)) | (set(changed) & set(entries))
+
+        headers = {fragment["header"] for fragment in changed.values()}
+        if entries:
+            headers.add(next(iter(entries.values()))["header"])
+
+        if len(headers) > 1:
+            return self._rebuild_table(combined_filepath, sources)
+
+        if not changed and not stale:
+            return entries
+
+        ordered = [scenario for scenario in entries if scenario in sources]
+        ordered += sorted(scenario for scenario in changed if scenario not in entries)
+
+        if not stale:
+            # Only new scenarios, which are appended to the combined file
+            with open(combined_filepath, "ab" if entries else "wb") as f:
+                offset = f.tell()
+                if not entries:
+                    header = next(iter(changed.values()))["header"]
+                    f.write(header.encode())
+                    offset = f.tell()
+
+                for scenario in ordered:
+                    if scenario in entries:
+                        continue
+
+                    f.write(changed[scenario]["data"])
+                    entries[scenario] = _get_entry(changed[scenario], offset)
+                    offset += len(changed[scenario]["data"])
+
+            return entries
+
+        tmp_filepath = f"{combined_filepath}.tmp"
+        new_entries = {}
+
+        with open(tmp_filepath, "wb") as out:
+            header = next(iter(headers))
+            out.write(header.encode())
+
+            with open(combined_filepath, "rb") as existing:
+                for scenario in ordered:
+                    offset = out.tell()
+
+                    if scenario in changed:
+                        out.write(changed[scenario]["data"])
+                        new_entries[scenario] = _get_entry(changed[scenario], offset)
+
+                    else:
+                        entry = entries[scenario]
+                        existing.seek(entry["offset"])
+                        out.write(existing.read(entry["length"]))
+                        new_entries[scenario] = {**entry, "offset": offset}
+
+        os.replace(tmp_filepath, combined_filepath)
+
+        return new_entries
+
+    def _rebuild_table(self, combined_filepath: str, sources: Dict[str, str]) -> Dict[str, dict]:
+        """
+        Rebuild a combined table from all sources, for tables whose columns differ between
+        scenarios. Columns missing from a scenario are left empty. The entries record the combined
+        header, so later combines only rebuild the table again when a changed source has other
+        columns
+        """
+        frames = {}
+        source_stats = {}
+        for scenario, filepath in sorted(sources.items()):
+            source_stats[scenario], contents = _read_source(filepath)
+
+            frames[scenario] = pd.read_csv(io.BytesIO(contents))
+            frames[scenario].loc[:, "scenario"] = scenario
+
+        columns = pd.concat([frame.iloc[:0] for frame in frames.values()]).columns
+        header = pd.DataFrame(columns=columns).to_csv(index=False)
+
+        tmp_filepath = f"{combined_filepath}.tmp"
+        entries = {}
+
+        with open(tmp_filepath, "wb") as out:
+            out.write(header.encode())
+
+            for scenario, frame in frames.items():
+                fragment = {
+                    "source": source_stats[scenario],
+                    "header": header,
+                    "data": frame.reindex(columns=columns).to_csv(
+                        index=False, header=False
+                    ).encode(),
+                }
+
+                entries[scenario] = _get_entry(fragment, out.tell())
+                out.write(fragment["data"])
+
+        os.replace(tmp_filepath, combined_filepath)
+
+        return entries
+
+    @staticmethod
+    def _read_manifest(combined_path: str) -> dict:
+        manifest_filepath = os.path.join(combined_path, MANIFEST_FILENAME)
+
+        if os.path.exists(manifest_filepath):
+            with open(manifest_filepath) as f:
+                manifest = json.load(f)
+
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest
+
+        return {"version": MANIFEST_VERSION, "tables": {}}
+
+    @staticmethod
+    def _write_manifest(combined_path: str, manifest: dict) -> None:
+        manifest_filepath = os.path.join(combined_path, MANIFEST_FILENAME)
+
+        with open(f"{manifest_filepath}.tmp", "w") as f:
+            json.dump(manifest, f, indent=4)
+
+        os.replace(f"{manifest_filepath}.tmp", manifest_filepath)
+
+
+def _list_tables(path: str) -> List[str]:
+    return sorted(
+        filename[:-len(".csv")] for filename in os.listdir(path) if filename.endswith(".csv")
+    )
+
+
+def _get_source_stat(filepath: str) -> Tuple[float, int]:
+    stat = os.stat(filepath)
+
+    return stat.st_mtime, stat.st_size
+
+
+def _is_unchanged(entry: dict, filepath: str) -> bool:
+    """
+    True if the source matches its manifest entry by modification time and size. Sources that do
+    not match are read and compared by hash
+    """
+    if entry is None:
+        return False
+
+    mtime, size = _get_source_stat(filepath)
+
+    return entry["mtime"] == mtime and entry["size"] == size
+
+
+def _is_combined_file_valid(combined_filepath: str, entries: Dict[str, dict]) -> bool:
+    if not entries:
+        return True
+
+    if not os.path.exists(combined_filepath):
+        return False
+
+    end = max(entry["offset"] + entry["length"] for entry in entries.values())
+
+    return os.path.getsize(combined_filepath) == end
+
+
+def _read_source(filepath: str) -> Tuple[dict, bytes]:
+    """
+    Read the contents of a source table, with its modification time, size and SHA-256
+    """
+    mtime, size = _get_source_stat(filepath)
+
+    with open(filepath, "rb") as f:
+        contents = f.read()
+
+    source = {
+        "mtime": mtime,
+        "size": size,
+        "sha256": hashlib.sha256(contents).hexdigest(),
+    }
+
+    return source, contents
+
+
+def _read_fragment(filepath: str, scenario: str, entry: dict = None) -> dict:
+    """
+    Read a source table and render its rows for the combined file, with the scenario column added.
+    Sources with the same contents as their manifest entry are not parsed
+    """
+    source, contents = _read_source(filepath)
+
+    if entry is not None and entry["sha256"] == source["sha256"]:
+        return {"source": source, "header": None, "data": None}
+
+    frame = pd.read_csv(io.BytesIO(contents))
+    frame.loc[:, "scenario"] = scenario
+
+    return {
+        "source": source,
+        "header": frame.iloc[:0].to_csv(index=False),
+        "data": frame.to_csv(index=False, header=False).encode(),
+    }
+
+
+def _get_entry(fragment: dict, offset: int) -> dict:
+    return {
+        **fragment["source"],
+        "header": fragment["header"],
+        "offset": offset,
+        "length": len(fragment["data"]),
+    }
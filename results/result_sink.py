@@ -0,0 +1,52 @@
+"""
+Parent class for the destinations of scenario output tables
+"""
+from typing import Dict
+
+import pandas as pd
+
+
+class ResultSink:
+    """
+    Parent class for all result sinks. A sink receives the output tables of a scenario run along
+    with the run metadata, and stores them under the street segment and scenario of the run. A new
+    run for the same segment and scenario replaces the previous results
+
+    Args:
+        base_path (str): Location of the stored results
+
+    Attributes:
+        base_path (str): Location of the stored results
+
+    Methods:
+        get_outputs_path (str): Returns the location of the results for a segment and scenario
+        write_results (None): Store the output tables and metadata of a scenario run
+    """
+    def __init__(self, base_path: str):
+        self.base_path: str = base_path
+
+    def get_outputs_path(self, segment: str, scenario: str) -> str:
+        """
+        Location of the results for a street segment and scenario
+
+        Args:
+            segment (str): The street segment. May be None for runs without a segment
+            scenario (str): The decarbonization scenario
+
+        Returns:
+            str: Location of the results
+        """
+        raise NotImplementedError
+
+    def write_results(self, run_metadata: dict, tables: Dict[str, pd.DataFrame]) -> None:
+        """
+        Store the output tables of a scenario run
+
+        Args:
+            run_metadata (dict): Metadata of the run, including run_id, segment, and scenario
+            tables (Dict[str, pd.DataFrame]): Output tables, keyed by table name
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
@@ -0,0 +1,72 @@
+"""
+Writes scenario output tables to a SQLite database
+"""
+import json
+import os
+import sqlite3
+from typing import Dict
+
+import pandas as pd
+
+from results.result_sink import ResultSink
+
+
+RUNS_TABLE = "runs"
+
+SQLITE_TIMEOUT = 60
+
+
+class SqliteSink(ResultSink):
+    """
+    Writes all output tables to a single SQLite database. Each output table is a database table
+    with segment, scenario, and run_id columns added, and the metadata of each run is stored in
+    the ``runs`` table. The rows of an earlier run for the same segment and scenario are deleted
+    before the new rows are written
+
+    Args:
+        base_path (str): Filepath of the database
+    """
+    def get_outputs_path(self, segment: str, scenario: str) -> str:
+        return self.base_path
+
+    def write_results(self, run_metadata: dict, tables: Dict[str, pd.DataFrame]) -> None:
+        db_dir = os.path.dirname(self.base_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        segment = run_metadata["segment"]
+        scenario = run_metadata["scenario"]
+
+        conn = sqlite3.connect(self.base_path, timeout=SQLITE_TIMEOUT)
+
+        try:
+            with conn:
+                existing_tables = {
+                    row[0] for row in
+                    conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+                }
+
+                for table_name in [RUNS_TABLE, *tables]:
+                    if table_name in existing_tables:
+                        conn.execute(
+                            f'DELETE FROM "{table_name}" WHERE segment IS ? AND scenario = ?',
+                            (segment, scenario)
+                        )
+
+                runs = pd.DataFrame([{
+                    "run_id": run_metadata["run_id"],
+                    "segment": segment,
+                    "scenario": scenario,
+                    "metadata": json.dumps(run_metadata),
+                }])
+                runs.to_sql(RUNS_TABLE, conn, if_exists="append", index=False)
+
+                for table_name, table in tables.items():
+                    table.assign(
+                        segment=segment,
+                        scenario=scenario,
+                        run_id=run_metadata["run_id"]
+                    ).to_sql(table_name, conn, if_exists="append", index=False)
+
+        finally:
+            conn.close()
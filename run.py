@@ -3,7 +3,16 @@ Main script to run the simulation
 """
 import argparse
 
-from scenario_creator.create_scenario import ScenarioCreator
+from loads.load_store import PRECISIONS
+from results.csv_sink import CsvSink
+from results.parquet_sink import ParquetSink
+from results.sqlite_sink import SqliteSink
+from scenario_creator.create_scenario import OUTPUTS_BASEPATH, ScenarioCreator
+from scenario_creator.scenario_batch import ScenarioBatch
+
+
+PARQUET_OUTPUTS_PATH = "./outputs_combined/parquet"
+SQLITE_OUTPUTS_PATH = "./outputs_combined/results.sqlite"
 
 
 def main():
@@ -13,6 +22,36 @@ def main():
 
     parser.add_argument("street_segment", help="The street segment you would like to analyze")
     parser.add_argument("scenario", help="The scenario you would like to run")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used to populate buildings (default: 1)"
+    )
+    parser.add_argument(
+        "--profile-cache-dir",
+        default=".profile_cache",
+        help="Directory for the binary cache of parsed consumption profiles. Pass an empty "
+        "string to parse the CSVs on every run (default: .profile_cache)"
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=["csv", "parquet", "sqlite"],
+        default="csv",
+        help="Format of the output tables (default: csv)"
+    )
+    parser.add_argument(
+        "--precision",
+        choices=list(PRECISIONS),
+        default="float64",
+        help="Floating point type of the load profiles (default: float64)"
+    )
+    parser.add_argument(
+        "--report-accuracy",
+        action="store_true",
+        help="Also run the scenario in float64 and report the max relative difference of each "
+        "table. Only applies when --precision is not float64"
+    )
     args = parser.parse_args()
 
     street_segment = args.street_segment.lower()
@@ -40,25 +79,42 @@ def main():
             f"Scenario must be in {allowable_scenarios}. Received {decarb_scenario}."
         )
     
-    if decarb_scenario == "all":
-        for scenario in allowable_scenarios:
-            print(f"==========RUNNING SCENARIO {scenario}==========")
-            settings_filepath = f"./config_files/settings/{street_segment}_{scenario}_settings_config.json"
+    if args.output_format == "parquet":
+        result_sink = ParquetSink(PARQUET_OUTPUTS_PATH)
+
+    elif args.output_format == "sqlite":
+        result_sink = SqliteSink(SQLITE_OUTPUTS_PATH)
 
-            scenario = ScenarioCreator(
-                settings_filepath
-            )
+    else:
+        result_sink = CsvSink(OUTPUTS_BASEPATH)
 
-            scenario.create_scenario()
+    if decarb_scenario == "all":
+        batch = ScenarioBatch(
+            {
+                scenario: f"./config_files/settings/{street_segment}_{scenario}_settings_config.json"
+                for scenario in allowable_scenarios
+            },
+            workers=args.workers,
+            profile_cache_dir=args.profile_cache_dir,
+            segment=street_segment,
+            result_sink=result_sink,
+            precision=args.precision,
+            report_accuracy=args.report_accuracy
+        )
 
-            print("Buildings: {}".format(list(scenario.buildings.keys())))
-            print("==================")
+        batch.run_scenarios()
 
     else:
         settings_filepath = f"./config_files/settings/{street_segment}_{decarb_scenario}_settings_config.json"
 
         scenario = ScenarioCreator(
-            settings_filepath
+            settings_filepath,
+            workers=args.workers,
+            profile_cache_dir=args.profile_cache_dir,
+            segment=street_segment,
+            result_sink=result_sink,
+            precision=args.precision,
+            report_accuracy=args.report_accuracy
         )
 
         scenario.create_scenario()
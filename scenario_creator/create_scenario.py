@@ -1,14 +1,29 @@
 """
 Creates and run a scenario based on provided configuration files
 """
+import datetime
 import json
 import os
-from typing import Dict, List
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Iterable, List, Tuple
 
 import numpy as np
 import pandas as pd
 
 from buildings.building import Building
+from buildings.building_timeline import BuildingTimeline
+from end_uses.building_end_uses.end_use_table import EndUseTable
+from loads.load_store import PRECISIONS, LoadStore
+from loads.profile_cache import ProfileCache
+from loads.profile_library import ProfileLibrary
+from reference_data.reference_data import REFERENCE_DATA
+from results.accuracy_report import get_accuracy_report
+from results.csv_sink import CsvSink
+from results.memory_sink import MemorySink
+from results.result_sink import ResultSink
+from scenario_creator.output_table import OutputTable
+from utility_network.network_topology import NetworkTopology
 from utility_network.utility_network import UtilityNetwork
 
 
@@ -19,6 +34,9 @@ FUELS = ["electricity", "natural_gas", "propane", "fuel_oil"]
 
 OUTPUTS_BASEPATH = "./outputs_combined/scenarios"
 
+# Precision of the reference run that reduced precision runs are compared with
+REFERENCE_PRECISION = "float64"
+
 DOMAIN_BUILDING = "building"
 TYPE_BUILDING_AGGREGATE = "building_aggregate"
 
@@ -42,6 +60,31 @@ DECARB_SCENARIOS = [
 ]
 
 
+# Parsed profiles kept by each worker process for the lifetime of its pool
+_WORKER_PROFILE_LIBRARY = ProfileLibrary()
+
+
+def _populate_building(task: Tuple[dict, dict, bool, str]) -> Building:
+    """
+    Populate a single building in a worker process and drop its consumption DataFrames so only
+    annual values and the fuel profiles are sent back to the parent
+    """
+    building_params, sim_config, write_building_energy_timeseries, profile_cache_dir = task
+
+    if profile_cache_dir and _WORKER_PROFILE_LIBRARY.profile_cache is None:
+        _WORKER_PROFILE_LIBRARY.profile_cache = ProfileCache(profile_cache_dir)
+
+    building = Building(building_params, sim_config, profile_library=_WORKER_PROFILE_LIBRARY)
+    building.populate_building()
+
+    if write_building_energy_timeseries:
+        building.write_building_energy_info()
+
+    building.release_consumption()
+
+    return building
+
+
 class ScenarioCreator:
     """
     Executes a scenario simulation for a given street segment and writes outputs to CSVs
@@ -52,10 +95,38 @@ class ScenarioCreator:
     Optional args:
         write_building_energy_timeseries (bool): If True, write the hourly energy consumption for
             each building to a CSV
+        workers (int): Number of worker processes used to populate buildings. Buildings are
+            populated serially by default
+        profile_library (ProfileLibrary): Shared cache of parsed consumption profiles
+        network_tables (Dict[str, pd.DataFrame]): Shared cache of parsed network typology tables
+        network_topologies (Dict[Tuple[str, Tuple[str, ...]], NetworkTopology]): Shared cache of
+            network topologies
+        executor (Executor): Process pool used when workers > 1. A pool is created for the
+            scenario if not provided
+        profile_cache_dir (str): Directory of the on-disk cache of parsed consumption profiles.
+            Profiles are parsed from CSV on every run if not provided
+        segment (str): The street segment, used to separate the results of each segment
+        result_sink (ResultSink): Destination of the output tables. Tables are written to CSVs
+            under OUTPUTS_BASEPATH if not provided
+        precision (str): Floating point type of the building load profiles and the network load
+            aggregation, one of PRECISIONS. Annual totals and costs are always computed in float64
+        report_accuracy (bool): If True and the precision is not the reference precision, run the
+            scenario again in the reference precision and report the maximum relative difference
+            of each output table
 
     Attributes:
+        segment (str): The street segment
+        run_id (str): Unique ID of the scenario run, stored with the results
         buildings (Dict[str, Building]): Dict of instantiated Building objects, mapped by parcel ID
+        load_store (LoadStore): Shared store of the building fuel profiles for the scenario
+        end_use_table (EndUseTable): Shared table of the building end uses for the scenario
+        building_timeline (BuildingTimeline): Shared timeline table of the buildings for the
+            scenario, initialized once all buildings are created
         utility_network (UtilityNetwork): Instantiated UtilityNetwork object for the street segment
+        precision (str): Floating point type of the load profiles
+        output_tables (Dict[str, pd.DataFrame]): The output tables of the run, keyed by table name
+        accuracy_report (Dict[str, float]): Maximum relative difference of each output table from
+            the reference precision run. Empty unless the accuracy is reported
 
     Methods:
         create_scenario (None): Executes the simulation
@@ -64,10 +135,42 @@ class ScenarioCreator:
     def __init__(
             self,
             sim_settings_filepath: str,
-            write_building_energy_timeseries: bool = False
+            write_building_energy_timeseries: bool = False,
+            workers: int = 1,
+            profile_library: ProfileLibrary = None,
+            network_tables: Dict[str, pd.DataFrame] = None,
+            network_topologies: Dict[Tuple[str, Tuple[str, ...]], NetworkTopology] = None,
+            executor: Executor = None,
+            profile_cache_dir: str = None,
+            segment: str = None,
+            result_sink: ResultSink = None,
+            precision: str = REFERENCE_PRECISION,
+            report_accuracy: bool = False
     ):
+        if precision not in PRECISIONS:
+            raise ValueError(
+                f"Invalid precision provided. User provided {precision} but allowable values are "
+                f"one of: {list(PRECISIONS)}"
+            )
+
         self._sim_settings_filepath: str = sim_settings_filepath
         self.write_building_energy_timeseries: bool = write_building_energy_timeseries
+        self.workers: int = workers
+        self._profile_library: ProfileLibrary = profile_library
+        self._network_tables: Dict[str, pd.DataFrame] = network_tables
+        self._network_topologies: Dict[
+            Tuple[str, Tuple[str, ...]], NetworkTopology
+        ] = network_topologies
+        self._executor: Executor = executor
+        self._profile_cache_dir: str = profile_cache_dir
+        self.segment: str = segment
+        self._result_sink: ResultSink = result_sink or CsvSink(OUTPUTS_BASEPATH)
+        self.run_id: str = uuid.uuid4().hex
+        self.precision: str = precision
+        self._report_accuracy: bool = report_accuracy and precision != REFERENCE_PRECISION
+
+        if self._profile_library is None and self._profile_cache_dir:
+            self._profile_library = ProfileLibrary(ProfileCache(self._profile_cache_dir))
 
         self._sim_config: dict = {}
         self._decarb_scenario: str = ""
@@ -76,7 +179,12 @@ class ScenarioCreator:
         self._buildings_config: dict = {}
 
         self.buildings: Dict[str, Building] = {}
+        self.load_store: LoadStore = None
+        self.end_use_table: EndUseTable = None
+        self.building_timeline: BuildingTimeline = None
         self.utility_network: UtilityNetwork = None
+        self.output_tables: Dict[str, pd.DataFrame] = {}
+        self.accuracy_report: Dict[str, float] = {}
 
     def create_scenario(self):
         self._sim_config = self._get_sim_settings()
@@ -119,7 +227,7 @@ class ScenarioCreator:
         """
         Set the outputs filepath for this simulation
         """
-        return os.path.join(OUTPUTS_BASEPATH, self._decarb_scenario)
+        return self._result_sink.get_outputs_path(self.segment, self._decarb_scenario)
 
     def _get_years_vec(self) -> List[int]:
         return list(range(
@@ -138,12 +246,30 @@ class ScenarioCreator:
         with open(building_config_filepath) as f:
             data = json.load(f)
         self._buildings_config = data
+        # Buildings of the same archetype share profiles, so the store starts small and grows
+        self.load_store = LoadStore(dtype=PRECISIONS[self.precision])
+        self.end_use_table = EndUseTable()
+        self.building_timeline = BuildingTimeline()
+
+        if self.workers > 1:
+            self._create_buildings_parallel()
+
+        else:
+            self._create_buildings_serial()
+
+        # Timelines of all buildings are computed at once, now that their loads are registered
+        self.building_timeline.initialize_buildings()
 
+    def _create_buildings_serial(self) -> None:
         for building_params in self._buildings_config:
             print("Creating building {}".format(building_params.get("building_id")))
             building = Building(
                 building_params,
-                self._sim_config
+                self._sim_config,
+                load_store=self.load_store,
+                profile_library=self._profile_library,
+                end_use_table=self.end_use_table,
+                building_timeline=self.building_timeline
             )
 
             building.populate_building()
@@ -153,6 +279,55 @@ class ScenarioCreator:
 
             self.buildings[building.building_id] = building
 
+    def _create_buildings_parallel(self) -> None:
+        """
+        Populate buildings in a pool of worker processes. Workers return buildings without their
+        consumption DataFrames, and buildings are collected in config order so results match a
+        serial run
+        """
+        tasks = [
+            (
+                building_params,
+                self._sim_config,
+                self.write_building_energy_timeseries,
+                self._profile_cache_dir
+            )
+            for building_params in self._buildings_config
+        ]
+        chunksize = max(1, len(tasks) // (4 * self.workers))
+
+        self._load_reference_data()
+
+        if self._executor is not None:
+            buildings = self._executor.map(_populate_building, tasks, chunksize=chunksize)
+            self._collect_buildings(buildings)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            buildings = executor.map(_populate_building, tasks, chunksize=chunksize)
+            self._collect_buildings(buildings)
+
+    def _load_reference_data(self) -> None:
+        """
+        Load the reference tables used by the buildings into the process-wide registry, so worker
+        processes forked afterwards share them instead of reading them again
+        """
+        for building_params in self._buildings_config:
+            for key in ["original_asset_cost_filepath", "retrofit_asset_cost_filepath"]:
+                if building_params.get(key):
+                    REFERENCE_DATA.get_building_costs(building_params[key])
+
+            if building_params.get("consump_costs_filepath"):
+                REFERENCE_DATA.get_consumption_rates(building_params["consump_costs_filepath"])
+
+    def _collect_buildings(self, buildings: Iterable[Building]) -> None:
+        for building in buildings:
+            print("Created building {}".format(building.building_id))
+            building.move_to_load_store(self.load_store)
+            building.move_to_end_use_table(self.end_use_table)
+            self.building_timeline.add_building(building)
+            self.buildings[building.building_id] = building
+
     def _create_utility_network(self):
         """
         Create the utility network based on the input config
@@ -160,7 +335,11 @@ class ScenarioCreator:
         utility_network_config_filepath = self._sim_config.get("utility_network_config_filepath")
 
         self.utility_network = UtilityNetwork(
-            utility_network_config_filepath, self._sim_config, self.buildings
+            utility_network_config_filepath,
+            self._sim_config,
+            self.buildings,
+            network_tables=self._network_tables,
+            network_topologies=self._network_topologies
         )
 
         self.utility_network.populate_utility_network()
@@ -169,137 +348,76 @@ class ScenarioCreator:
         """
         Write output tables from all buildings
         """
-        years_vec = pd.Index(data=self._years_vec, name="year")
+        asset_labels = ["asset_id", "asset_domain", "asset_type"]
+        energy_labels = ["asset_id", "energy_type", "asset_domain", "asset_type"]
+
+        building_labels = {"asset_domain": DOMAIN_BUILDING, "asset_type": TYPE_BUILDING_AGGREGATE}
+        xmfr_labels = {"asset_domain": DOMAIN_ELEC, "asset_type": TYPE_ELEC_XMFR}
+        gas_meter_labels = {"asset_domain": DOMAIN_GAS, "asset_type": TYPE_GAS_METER}
+        gas_service_labels = {"asset_domain": DOMAIN_GAS, "asset_type": TYPE_GAS_SERVICE}
+        gas_main_labels = {"asset_domain": DOMAIN_GAS, "asset_type": TYPE_GAS_MAIN}
+
+        tables = {}
 
         # ---Is Retrofit Vec---
-        all_dfs = []
+        table = OutputTable("is_retrofit", self._years_vec, asset_labels)
         for building_id, building in self.buildings.items():
-            df = pd.DataFrame({"year": years_vec, "is_retrofit": building._is_retrofit_vec})
-            df.loc[:, "asset_id"] = building_id
-            df.loc[:, "asset_domain"] = DOMAIN_BUILDING
-            df.loc[:, "asset_type"] = TYPE_BUILDING_AGGREGATE
-            all_dfs.append(df)
+            table.add(building._is_retrofit_vec, asset_id=building_id, **building_labels)
 
         for xmfr in self.utility_network.elec_transformers:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "is_retrofit": xmfr.is_replacement_vector
-            })
-            df.loc[:, "asset_id"] = xmfr.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_ELEC
-            df.loc[:, "asset_type"] = TYPE_ELEC_XMFR
-            all_dfs.append(df)
+            table.add(xmfr.is_replacement_vector, asset_id=xmfr.asset_id, **xmfr_labels)
 
         for gas_service in self.utility_network.gas_services:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "is_retrofit": gas_service.retrofit_vector
-            })
-            df.loc[:, "asset_id"] = gas_service.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_SERVICE
-            all_dfs.append(df)
+            table.add(
+                gas_service.retrofit_vector, asset_id=gas_service.asset_id, **gas_service_labels
+            )
 
         for gas_main in self.utility_network.gas_mains:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "is_retrofit": gas_main.retrofit_vector
-            })
-            df.loc[:, "asset_id"] = gas_main.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_MAIN
-            all_dfs.append(df)
-
-        all_dfs = pd.concat(all_dfs)
-
-        if not os.path.exists(self._outputs_path):
-            os.makedirs(self._outputs_path)
-            
-        all_dfs.to_csv(os.path.join(self._outputs_path, "is_retrofit_vec_table.csv"), index=False)
+            table.add(gas_main.retrofit_vector, asset_id=gas_main.asset_id, **gas_main_labels)
+
+        tables["is_retrofit_vec_table"] = table.to_frame()
 
         # ---Retrofit year---
-        all_dfs = []
+        table = OutputTable("retrofit_year", self._years_vec, asset_labels)
         for building_id, building in self.buildings.items():
-            df = pd.DataFrame({"year": years_vec, "retrofit_year": building._retrofit_vec})
-            df.loc[:, "asset_id"] = building_id
-            df.loc[:, "asset_domain"] = DOMAIN_BUILDING
-            df.loc[:, "asset_type"] = TYPE_BUILDING_AGGREGATE
-            all_dfs.append(df)
+            table.add(building._retrofit_vec, asset_id=building_id, **building_labels)
 
         for xmfr in self.utility_network.elec_transformers:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "retrofit_year": xmfr.retrofit_vector
-            })
-            df.loc[:, "asset_id"] = xmfr.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_ELEC
-            df.loc[:, "asset_type"] = TYPE_ELEC_XMFR
-            all_dfs.append(df)
+            table.add(xmfr.retrofit_vector, asset_id=xmfr.asset_id, **xmfr_labels)
 
         for gas_service in self.utility_network.gas_services:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "retrofit_year": gas_service.replacement_vector
-            })
-            df.loc[:, "asset_id"] = gas_service.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_SERVICE
-            all_dfs.append(df)
+            table.add(
+                gas_service.replacement_vector,
+                asset_id=gas_service.asset_id,
+                **gas_service_labels
+            )
 
         for gas_main in self.utility_network.gas_mains:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "retrofit_year": gas_main.replacement_vector
-            })
-            df.loc[:, "asset_id"] = gas_main.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_MAIN
-            all_dfs.append(df)
-
-        all_dfs = pd.concat(all_dfs)
-        all_dfs.to_csv(os.path.join(self._outputs_path, "retrofit_year.csv"), index=False)
+            table.add(gas_main.replacement_vector, asset_id=gas_main.asset_id, **gas_main_labels)
+
+        tables["retrofit_year"] = table.to_frame()
 
         # ---Retrofit cost---
-        all_dfs = []
+        table = OutputTable("retrofit_cost", self._years_vec, asset_labels)
         for building_id, building in self.buildings.items():
-            df = pd.DataFrame({
-                "year": years_vec,
-                "retrofit_cost": building._get_retrofit_cost_vec()
-            })
-            df.loc[:, "asset_id"] = building_id
-            df.loc[:, "asset_domain"] = DOMAIN_BUILDING
-            df.loc[:, "asset_type"] = TYPE_BUILDING_AGGREGATE
-            all_dfs.append(df)
+            table.add(
+                building._get_retrofit_cost_vec(), asset_id=building_id, **building_labels
+            )
 
         for xmfr in self.utility_network.elec_transformers:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "retrofit_cost": xmfr.upgrade_cost
-            })
-            df.loc[:, "asset_id"] = xmfr.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_ELEC
-            df.loc[:, "asset_type"] = TYPE_ELEC_XMFR
-            all_dfs.append(df)
+            table.add(xmfr.upgrade_cost, asset_id=xmfr.asset_id, **xmfr_labels)
 
         for gas_meter in self.utility_network.gas_meters:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "retrofit_cost": gas_meter.get_retrofit_cost()
-            })
-            df.loc[:, "asset_id"] = gas_meter.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_METER
-            all_dfs.append(df)
+            table.add(
+                gas_meter.get_retrofit_cost(), asset_id=gas_meter.asset_id, **gas_meter_labels
+            )
 
         for gas_service in self.utility_network.gas_services:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "retrofit_cost": gas_service.get_install_cost()
-            })
-            df.loc[:, "asset_id"] = gas_service.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_SERVICE
-            all_dfs.append(df)
+            table.add(
+                gas_service.get_install_cost(),
+                asset_id=gas_service.asset_id,
+                **gas_service_labels
+            )
 
         for gas_main in self.utility_network.gas_mains:
             total_cost = (
@@ -307,263 +425,237 @@ class ScenarioCreator:
                 + np.array(gas_main.get_system_shutoff_cost())
             ).tolist()
 
-            df = pd.DataFrame({
-                "year": years_vec,
-                "retrofit_cost": total_cost
-            })
-            df.loc[:, "asset_id"] = gas_main.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_MAIN
-            all_dfs.append(df)
+            table.add(total_cost, asset_id=gas_main.asset_id, **gas_main_labels)
 
-        all_dfs = pd.concat(all_dfs)
-        all_dfs.to_csv(os.path.join(self._outputs_path, "retrofit_cost.csv"), index=False)
+        tables["retrofit_cost"] = table.to_frame()
 
         # ---Book value---
-        all_dfs = []
+        table = OutputTable(
+            "book_val",
+            self._years_vec,
+            ["asset_id", "existing_or_retrofit", "asset_domain", "asset_type"]
+        )
         for building_id, building in self.buildings.items():
             # ---Replacement asset book value---
-            df = pd.DataFrame({
-                "year": years_vec,
-                "book_val": building._get_retrofit_book_value_vec()
-            })
-            df.loc[:, "asset_id"] = building_id
-            df.loc[:, "existing_or_retrofit"] = "retrofit"
-            df.loc[:, "asset_domain"] = DOMAIN_BUILDING
-            df.loc[:, "asset_type"] = TYPE_BUILDING_AGGREGATE
-            all_dfs.append(df)
+            table.add(
+                building._get_retrofit_book_value_vec(),
+                asset_id=building_id,
+                existing_or_retrofit="retrofit",
+                **building_labels
+            )
 
             # ---Existing book val---
-            df = pd.DataFrame({
-                "year": years_vec,
-                "book_val": building._get_exising_book_val_vec()
-            })
-            df.loc[:, "asset_id"] = building_id
-            df.loc[:, "existing_or_retrofit"] = "existing"
-            df.loc[:, "asset_domain"] = DOMAIN_BUILDING
-            df.loc[:, "asset_type"] = TYPE_BUILDING_AGGREGATE
-            all_dfs.append(df)
+            table.add(
+                building._get_exising_book_val_vec(),
+                asset_id=building_id,
+                existing_or_retrofit="existing",
+                **building_labels
+            )
 
         for gas_service in self.utility_network.gas_services:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "book_val": gas_service.book_value
-            })
-            df.loc[:, "asset_id"] = gas_service.asset_id
-            df.loc[:, "existing_or_retrofit"] = "retrofit"
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_SERVICE
-            all_dfs.append(df)
+            table.add(
+                gas_service.book_value,
+                asset_id=gas_service.asset_id,
+                existing_or_retrofit="retrofit",
+                **gas_service_labels
+            )
 
         for gas_main in self.utility_network.gas_mains:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "book_val": gas_main.book_value
-            })
-            df.loc[:, "asset_id"] = gas_main.asset_id
-            df.loc[:, "existing_or_retrofit"] = "retrofit"
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_MAIN
-            all_dfs.append(df)
-
-        all_dfs = pd.concat(all_dfs)
-        all_dfs.to_csv(os.path.join(self._outputs_path, "book_val.csv"), index=False)
+            table.add(
+                gas_main.book_value,
+                asset_id=gas_main.asset_id,
+                existing_or_retrofit="retrofit",
+                **gas_main_labels
+            )
+
+        tables["book_val"] = table.to_frame()
 
         # ---Stranded val---
-        all_dfs = []
+        table = OutputTable(
+            "stranded_val", self._years_vec, [*asset_labels, "existing_or_retrofit"]
+        )
         for building_id, building in self.buildings.items():
-            df = pd.DataFrame({
-                "year": years_vec,
-                "stranded_val": building._get_exising_stranded_val_vec()
-            })
-            df.loc[:, "asset_id"] = building_id
-            df.loc[:, "asset_domain"] = DOMAIN_BUILDING
-            df.loc[:, "asset_type"] = TYPE_BUILDING_AGGREGATE
-            df.loc[:, "existing_or_retrofit"] = "existing"
-            all_dfs.append(df)
+            table.add(
+                building._get_exising_stranded_val_vec(),
+                asset_id=building_id,
+                existing_or_retrofit="existing",
+                **building_labels
+            )
 
         for gas_service in self.utility_network.gas_services:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "stranded_val": gas_service.stranded_value
-            })
-            df.loc[:, "asset_id"] = gas_service.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_SERVICE
-            df.loc[:, "existing_or_retrofit"] = "retrofit"
-            all_dfs.append(df)
+            table.add(
+                gas_service.stranded_value,
+                asset_id=gas_service.asset_id,
+                existing_or_retrofit="retrofit",
+                **gas_service_labels
+            )
 
         for gas_main in self.utility_network.gas_mains:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "stranded_val": gas_main.stranded_value
-            })
-            df.loc[:, "asset_id"] = gas_main.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_MAIN
-            df.loc[:, "existing_or_retrofit"] = "retrofit"
-            all_dfs.append(df)
-
-        all_dfs = pd.concat(all_dfs)
-        all_dfs.to_csv(os.path.join(self._outputs_path, "stranded_val.csv"), index=False)
+            table.add(
+                gas_main.stranded_value,
+                asset_id=gas_main.asset_id,
+                existing_or_retrofit="retrofit",
+                **gas_main_labels
+            )
 
-        # ---Energy use---
-        building_energy_usage = {
-            building_id: building._calc_annual_energy_consump()
-            for building_id, building in self.buildings.items()
-        }
+        tables["stranded_val"] = table.to_frame()
 
-        all_dfs = []
-        for building_id, building_consumptions in building_energy_usage.items():
+        # ---Energy use---
+        table = OutputTable("consumption", self._years_vec, energy_labels)
+        for building_id, building in self.buildings.items():
             for fuel in FUELS:
-                df = pd.DataFrame({"year": years_vec, "consumption": building_consumptions[fuel]})
-                df.loc[:, "asset_id"] = building_id
-                df.loc[:, "energy_type"] = fuel
-                df.loc[:, "asset_domain"] = DOMAIN_BUILDING
-                df.loc[:, "asset_type"] = TYPE_BUILDING_AGGREGATE
-                all_dfs.append(df)
-
-        xmfr_energy_usage = {
-            xmfr.asset_id: list(xmfr.annual_total_energy_use.values())
-            for xmfr in self.utility_network.elec_transformers
-        }
+                table.add(
+                    building._annual_energy_by_fuel[fuel],
+                    asset_id=building_id,
+                    energy_type=fuel,
+                    **building_labels
+                )
 
-        for asset_id, elec_consumption in xmfr_energy_usage.items():
-            df = pd.DataFrame({"year": years_vec, "consumption": elec_consumption})
-            df.loc[:, "asset_id"] = asset_id
-            df.loc[:, "energy_type"] = "electricity"
-            df.loc[:, "asset_domain"] = DOMAIN_ELEC
-            df.loc[:, "asset_type"] = TYPE_ELEC_XMFR
-            all_dfs.append(df)
+        for xmfr in self.utility_network.elec_transformers:
+            table.add(
+                list(xmfr.annual_total_energy_use.values()),
+                asset_id=xmfr.asset_id,
+                energy_type="electricity",
+                **xmfr_labels
+            )
 
-        all_dfs = pd.concat(all_dfs)
-        all_dfs.to_csv(os.path.join(self._outputs_path, "energy_consumption.csv"), index=False)
+        tables["energy_consumption"] = table.to_frame()
 
         # ---Peak energy use---
-        all_dfs = []
-        xmfr_peak = {
-            xmfr.asset_id: xmfr.annual_peak_energy_use
-            for xmfr in self.utility_network.elec_transformers
-        }
-
-        for asset_id, peak_consump in xmfr_peak.items():
-            df = pd.DataFrame({"year": years_vec, "peak_consump": peak_consump})
-            df.loc[:, "asset_id"] = asset_id
-            df.loc[:, "energy_type"] = "electricity"
-            df.loc[:, "asset_domain"] = DOMAIN_ELEC
-            df.loc[:, "asset_type"] = TYPE_ELEC_XMFR
-            all_dfs.append(df)
+        table = OutputTable("peak_consump", self._years_vec, energy_labels)
+        for xmfr in self.utility_network.elec_transformers:
+            table.add(
+                xmfr.annual_peak_energy_use,
+                asset_id=xmfr.asset_id,
+                energy_type="electricity",
+                **xmfr_labels
+            )
 
-        all_dfs = pd.concat(all_dfs)
-        all_dfs.to_csv(os.path.join(self._outputs_path, "peak_consump.csv"), index=False)
+        tables["peak_consump"] = table.to_frame()
 
         # ---Building utility costs---
-        building_util_costs = {
-            building_id: building.calc_building_utility_costs()
-            for building_id, building in self.buildings.items()
-        }
+        table = OutputTable("consumption_costs", self._years_vec, energy_labels)
+        for building_id, building in self.buildings.items():
+            costs = building.calc_building_utility_costs()
 
-        all_dfs = []
-        for building_id, costs in building_util_costs.items():
             for fuel in FUELS:
-                df = pd.DataFrame({
-                    "year": years_vec,
-                    "consumption_costs": costs[fuel]
-                })
-                df.loc[:, "asset_id"] = building_id
-                df.loc[:, "energy_type"] = fuel
-                df.loc[:, "asset_domain"] = DOMAIN_BUILDING
-                df.loc[:, "asset_type"] = TYPE_BUILDING_AGGREGATE
-                all_dfs.append(df)
-        all_dfs = pd.concat(all_dfs)
-        all_dfs.to_csv(os.path.join(self._outputs_path, "consumption_costs.csv"), index=False)
+                table.add(
+                    costs[fuel], asset_id=building_id, energy_type=fuel, **building_labels
+                )
+
+        tables["consumption_costs"] = table.to_frame()
 
         # ---Building fuel---
-        all_dfs = []
+        table = OutputTable("fuel_type", self._years_vec, asset_labels)
         for building_id, building in self.buildings.items():
-            df = pd.DataFrame({"year": years_vec, "fuel_type": building._fuel_type})
-            df.loc[:, "asset_id"] = building_id
-            df.loc[:, "asset_domain"] = DOMAIN_BUILDING
-            df.loc[:, "asset_type"] = TYPE_BUILDING_AGGREGATE
-            all_dfs.append(df)
-        all_dfs = pd.concat(all_dfs)
-        all_dfs.to_csv(os.path.join(self._outputs_path, "fuel_type.csv"), index=False)
+            table.add(building._fuel_type, asset_id=building_id, **building_labels)
+
+        tables["fuel_type"] = table.to_frame()
 
         # ---Methane leaks---
-        all_dfs = []
+        table = OutputTable("leaks", self._years_vec, asset_labels)
         # Building leaks
         for building_id, building in self.buildings.items():
-            df = pd.DataFrame({"year": years_vec, "leaks": building._methane_leaks})
-            df.loc[:, "asset_id"] = building_id
-            df.loc[:, "asset_domain"] = DOMAIN_BUILDING
-            df.loc[:, "asset_type"] = TYPE_BUILDING_AGGREGATE
-            all_dfs.append(df)
+            table.add(building._methane_leaks, asset_id=building_id, **building_labels)
 
         # Gas service leaks
         for service in self.utility_network.gas_services:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "leaks": service.annual_total_leakage
-            })
-            df.loc[:, "asset_id"] = service.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_SERVICE
-            all_dfs.append(df)
+            table.add(
+                service.annual_total_leakage, asset_id=service.asset_id, **gas_service_labels
+            )
 
         # Gas main leaks
         for main in self.utility_network.gas_mains:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "leaks": main.annual_total_leakage
-            })
-            df.loc[:, "asset_id"] = main.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_MAIN
-            all_dfs.append(df)
-        all_dfs = pd.concat(all_dfs)
-        all_dfs.to_csv(os.path.join(self._outputs_path, "methane_leaks.csv"), index=False)
+            table.add(main.annual_total_leakage, asset_id=main.asset_id, **gas_main_labels)
+
+        tables["methane_leaks"] = table.to_frame()
 
         # ---Combustion emissions---
-        all_dfs = []
+        table = OutputTable("consumption_emissions", self._years_vec, energy_labels)
         for building_id, building in self.buildings.items():
             for fuel in FUELS:
-                df = pd.DataFrame({
-                    "year": years_vec,
-                    "consumption_emissions": building._combustion_emissions[fuel]
-                })
-                df.loc[:, "asset_id"] = building_id
-                df.loc[:, "energy_type"] = fuel
-                df.loc[:, "asset_domain"] = DOMAIN_BUILDING
-                df.loc[:, "asset_type"] = TYPE_BUILDING_AGGREGATE
-                all_dfs.append(df)
-        all_dfs = pd.concat(all_dfs)
-        all_dfs.to_csv(os.path.join(self._outputs_path, "consumption_emissions.csv"), index=False)
+                table.add(
+                    building._combustion_emissions[fuel],
+                    asset_id=building_id,
+                    energy_type=fuel,
+                    **building_labels
+                )
 
+        tables["consumption_emissions"] = table.to_frame()
 
         # ---O&M costs---
-        all_dfs = []
+        table = OutputTable("annual_operating_costs", self._years_vec, asset_labels)
         for gas_service in self.utility_network.gas_services:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "annual_operating_costs": gas_service.annual_operating_expenses
-            })
-            df.loc[:, "asset_id"] = gas_service.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_SERVICE
-            all_dfs.append(df)
+            table.add(
+                gas_service.annual_operating_expenses,
+                asset_id=gas_service.asset_id,
+                **gas_service_labels
+            )
 
         for gas_main in self.utility_network.gas_mains:
-            df = pd.DataFrame({
-                "year": years_vec,
-                "annual_operating_costs": gas_main.annual_operating_expenses
-            })
-            df.loc[:, "asset_id"] = gas_main.asset_id
-            df.loc[:, "asset_domain"] = DOMAIN_GAS
-            df.loc[:, "asset_type"] = TYPE_GAS_MAIN
-            all_dfs.append(df)
-
-        all_dfs = pd.concat(all_dfs)
-        all_dfs.to_csv(os.path.join(self._outputs_path, "operating_costs.csv"), index=False)
+            table.add(
+                gas_main.annual_operating_expenses,
+                asset_id=gas_main.asset_id,
+                **gas_main_labels
+            )
+
+        tables["operating_costs"] = table.to_frame()
+
+        self.output_tables = tables
+
+        if self._report_accuracy:
+            self.accuracy_report = self._get_accuracy_report()
+
+        self._result_sink.write_results(self._get_run_metadata(), tables)
+
+    def _get_accuracy_report(self) -> Dict[str, float]:
+        """
+        Run the scenario again in the reference precision, sharing the parsed inputs of this run,
+        and compare the output tables of both runs
+        """
+        print(f"Running {REFERENCE_PRECISION} reference scenario...")
+        reference = ScenarioCreator(
+            self._sim_settings_filepath,
+            workers=self.workers,
+            profile_library=self._profile_library,
+            network_tables=self._network_tables,
+            network_topologies=self._network_topologies,
+            executor=self._executor,
+            profile_cache_dir=self._profile_cache_dir,
+            segment=self.segment,
+            result_sink=MemorySink(),
+            precision=REFERENCE_PRECISION
+        )
+        reference.create_scenario()
+
+        accuracy_report = get_accuracy_report(self.output_tables, reference.output_tables)
+
+        print(f"=====Max relative difference from {REFERENCE_PRECISION}=====")
+        for table_name, difference in accuracy_report.items():
+            print(f"{table_name}: {difference:.3e}")
+
+        return accuracy_report
+
+    def _get_run_metadata(self) -> dict:
+        """
+        Metadata stored by the result sink alongside the output tables
+        """
+        run_metadata = {
+            "run_id": self.run_id,
+            "segment": self.segment,
+            "scenario": self._decarb_scenario,
+            "sim_settings_filepath": self._sim_settings_filepath,
+            "sim_start_year": self._years_vec[0] if self._years_vec else None,
+            "sim_end_year": self._years_vec[-1] + 1 if self._years_vec else None,
+            "n_buildings": len(self.buildings),
+            "precision": self.precision,
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }
+
+        if self.accuracy_report:
+            run_metadata["max_relative_difference"] = self.accuracy_report
+
+        return run_metadata
 
     def _get_utility_network_outputs(self):
         """
@@ -0,0 +1,109 @@
+"""
+Columnar builder for the long-format scenario output tables
+"""
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class OutputTable:
+    """
+    Builds an output table with one row per asset and year. Each asset adds its annual vector and
+    its label values, and the columns are assembled in bulk when the table is emitted, instead of
+    concatenating a DataFrame per asset. Columns are ordered as year, the value column, then the
+    label columns
+
+    Args:
+        value_column (str): Name of the column holding the annual values
+        years_vec (List[int]): List of simulation years
+        label_columns (List[str]): Names of the columns holding a constant value for each asset
+
+    Attributes:
+        value_column (str): Name of the column holding the annual values
+        label_columns (List[str]): Names of the columns holding a constant value for each asset
+
+    Methods:
+        add (None): Add the annual values and labels for an asset
+        to_frame (pd.DataFrame): Return the table as a DataFrame
+    """
+    def __init__(self, value_column: str, years_vec: List[int], label_columns: List[str]):
+        self.value_column: str = value_column
+        self.label_columns: List[str] = label_columns
+        self._years: np.ndarray = np.asarray(years_vec, dtype=np.int64)
+
+        self._values: List[np.ndarray] = []
+        self._labels: Dict[str, List[str]] = {column: [] for column in label_columns}
+
+    def __len__(self) -> int:
+        return len(self._values) * len(self._years)
+
+    def add(self, values: Sequence, **labels: str) -> None:
+        """
+        Add the annual values for an asset
+
+        Args:
+            values (Sequence): Annual values, one per simulation year
+            **labels (str): Value of each label column for the asset
+
+        Returns:
+            None
+        """
+        if len(values) != len(self._years):
+            raise ValueError(
+                f"Received {len(values)} values for {self.value_column} but there are "
+                f"{len(self._years)} simulation years."
+            )
+
+        self._values.append(self._infer_array(values))
+
+        for column in self.label_columns:
+            self._labels[column].append(labels[column])
+
+    @staticmethod
+    def _infer_array(values: Sequence) -> np.ndarray:
+        """
+        Convert values to an array with the dtype pandas would infer for the column
+        """
+        array = np.asarray(values)
+
+        if array.dtype.kind not in "biuf":
+            array = pd.Series(list(values), dtype=None).to_numpy()
+
+        return array
+
+    def _build_values(self) -> np.ndarray:
+        dtypes = {array.dtype for array in self._values}
+
+        if len(dtypes) == 1:
+            return np.concatenate(self._values)
+
+        # Mixed dtypes are combined with the pandas concatenation rules
+        return pd.concat(
+            [pd.Series(array) for array in self._values], ignore_index=True
+        ).to_numpy()
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return the table, with assets in the order they were added
+
+        Args:
+            None
+
+        Returns:
+            pd.DataFrame: The output table
+        """
+        if not self._values:
+            return pd.DataFrame(columns=["year", self.value_column, *self.label_columns])
+
+        n_years = len(self._years)
+
+        columns = {
+            "year": np.tile(self._years, len(self._values)),
+            self.value_column: self._build_values(),
+        }
+
+        for column in self.label_columns:
+            columns[column] = np.repeat(np.array(self._labels[column], dtype=object), n_years)
+
+        return pd.DataFrame(columns)
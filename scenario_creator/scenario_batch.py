@@ -0,0 +1,115 @@
+"""
+Runs several scenarios for a street segment, sharing inputs that do not change between scenarios
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple
+
+import pandas as pd
+
+from loads.profile_cache import ProfileCache
+from loads.profile_library import ProfileLibrary
+from results.result_sink import ResultSink
+from scenario_creator.create_scenario import REFERENCE_PRECISION, ScenarioCreator
+from utility_network.network_topology import NetworkTopology
+
+
+class ScenarioBatch:
+    """
+    Executes a list of scenario simulations. Consumption profiles, network typology tables and
+    network topologies are parsed once and shared by all scenarios. Each scenario creates its own
+    buildings and network assets from them, with its own retrofit parameters and decarb scenario,
+    and re-runs the building and network calculations
+
+    Args:
+        sim_settings_filepaths (Dict[str, str]): The filepaths for the simulation settings
+            configurations, keyed by scenario name
+
+    Optional args:
+        write_building_energy_timeseries (bool): If True, write the hourly energy consumption for
+            each building to a CSV
+        workers (int): Number of worker processes used to populate buildings. The same pool is
+            used for all scenarios
+        profile_cache_dir (str): Directory of the on-disk cache of parsed consumption profiles.
+            Profiles are parsed from CSV on every run if not provided
+        segment (str): The street segment, used to separate the results of each segment
+        result_sink (ResultSink): Destination of the output tables of every scenario
+        precision (str): Floating point type of the load profiles of every scenario
+        report_accuracy (bool): If True, report the maximum relative difference of each scenario
+            from a run in the reference precision
+
+    Attributes:
+        profile_library (ProfileLibrary): Parsed consumption profiles shared by all scenarios
+        network_tables (Dict[str, pd.DataFrame]): Parsed network typology tables shared by all
+            scenarios
+        network_topologies (Dict[Tuple[str, Tuple[str, ...]], NetworkTopology]): Network
+            topologies shared by all scenarios
+
+    Methods:
+        run_scenarios (None): Executes the simulation for every scenario
+    """
+    def __init__(
+            self,
+            sim_settings_filepaths: Dict[str, str],
+            write_building_energy_timeseries: bool = False,
+            workers: int = 1,
+            profile_cache_dir: str = None,
+            segment: str = None,
+            result_sink: ResultSink = None,
+            precision: str = REFERENCE_PRECISION,
+            report_accuracy: bool = False
+    ):
+        self._sim_settings_filepaths: Dict[str, str] = sim_settings_filepaths
+        self.write_building_energy_timeseries: bool = write_building_energy_timeseries
+        self.workers: int = workers
+        self._profile_cache_dir: str = profile_cache_dir
+        self.segment: str = segment
+        self._result_sink: ResultSink = result_sink
+        self.precision: str = precision
+        self.report_accuracy: bool = report_accuracy
+
+        self.profile_library: ProfileLibrary = ProfileLibrary(
+            ProfileCache(profile_cache_dir) if profile_cache_dir else None
+        )
+        self.network_tables: Dict[str, pd.DataFrame] = {}
+        self.network_topologies: Dict[Tuple[str, Tuple[str, ...]], NetworkTopology] = {}
+
+    def run_scenarios(self) -> None:
+        """
+        Execute the simulation for every scenario in order
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                self._run_all(executor)
+
+        else:
+            self._run_all(None)
+
+    def _run_all(self, executor: ProcessPoolExecutor) -> None:
+        for scenario_name, sim_settings_filepath in self._sim_settings_filepaths.items():
+            print(f"==========RUNNING SCENARIO {scenario_name}==========")
+
+            scenario = ScenarioCreator(
+                sim_settings_filepath,
+                write_building_energy_timeseries=self.write_building_energy_timeseries,
+                workers=self.workers,
+                profile_library=self.profile_library,
+                network_tables=self.network_tables,
+                network_topologies=self.network_topologies,
+                executor=executor,
+                profile_cache_dir=self._profile_cache_dir,
+                segment=self.segment,
+                result_sink=self._result_sink,
+                precision=self.precision,
+                report_accuracy=self.report_accuracy
+            )
+
+            scenario.create_scenario()
+
+            print("Buildings: {}".format(list(scenario.buildings.keys())))
+            print("==================")
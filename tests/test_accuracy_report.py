@@ -0,0 +1,51 @@
+"""
+Unit tests for the output table accuracy report
+"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from results.accuracy_report import get_accuracy_report, get_max_relative_difference
+
+
+class TestAccuracyReport(unittest.TestCase):
+    def setUp(self):
+        self.reference = pd.DataFrame({
+            "year": [2020, 2021, 2022],
+            "consumption": [100., 0., np.nan],
+            "asset_id": ["b1", "b1", "b1"],
+        })
+
+    def test_get_max_relative_difference(self):
+        table = self.reference.copy()
+        table["consumption"] = [100.5, 0., np.nan]
+
+        self.assertAlmostEqual(get_max_relative_difference(table, self.reference), 0.005)
+        self.assertEqual(get_max_relative_difference(self.reference, self.reference), 0.)
+
+    def test_get_max_relative_difference_zero_reference(self):
+        table = self.reference.copy()
+        table["consumption"] = [100., 1e-9, np.nan]
+
+        self.assertEqual(get_max_relative_difference(table, self.reference), np.inf)
+
+        table["consumption"] = [100., 0., 1.]
+
+        self.assertEqual(get_max_relative_difference(table, self.reference), np.inf)
+
+    def test_get_max_relative_difference_mismatched_tables(self):
+        with self.assertRaises(ValueError):
+            get_max_relative_difference(self.reference[:2], self.reference)
+
+    def test_get_accuracy_report(self):
+        table = self.reference.copy()
+        table["consumption"] = [99., 0., np.nan]
+
+        self.assertDictEqual(
+            get_accuracy_report(
+                {"energy_consumption": table, "fuel_type": self.reference[["asset_id"]]},
+                {"energy_consumption": self.reference, "fuel_type": self.reference[["asset_id"]]}
+            ),
+            {"energy_consumption": 0.01, "fuel_type": 0.}
+        )
@@ -0,0 +1,59 @@
+"""
+Unit tests for AnnualTimeseries class
+"""
+import unittest
+
+import numpy as np
+
+from loads.annual_timeseries import AnnualTimeseries
+
+
+class TestAnnualTimeseries(unittest.TestCase):
+    def setUp(self):
+        self.profiles = np.array([[1., 3., 2.], [4., 0., 5.]])
+        self.timeseries = AnnualTimeseries([2020, 2021, 2022], self.profiles, [0, 0, 1])
+
+    def test_mapping(self):
+        self.assertEqual(len(self.timeseries), 3)
+        self.assertListEqual(list(self.timeseries), [2020, 2021, 2022])
+        self.assertIn(2021, self.timeseries)
+        self.assertNotIn(2023, self.timeseries)
+
+        np.testing.assert_array_equal(self.timeseries[2022], [4., 0., 5.])
+
+        with self.assertRaises(KeyError):
+            self.timeseries[2023]
+
+    def test_getitem_is_read_only_view(self):
+        profile = self.timeseries[2020]
+
+        self.assertTrue(np.shares_memory(profile, self.profiles))
+        self.assertTrue(np.shares_memory(profile, self.timeseries[2021]))
+
+        with self.assertRaises(ValueError):
+            profile[0] = 10
+
+    def test_max_and_sum(self):
+        np.testing.assert_array_equal(self.timeseries.max(), [3., 3., 5.])
+        np.testing.assert_array_equal(self.timeseries.sum(), [6., 6., 9.])
+
+    def test_max_and_sum_float32(self):
+        timeseries = AnnualTimeseries(
+            [2020, 2021, 2022], self.profiles.astype(np.float32), [0, 0, 1], scale=0.1
+        )
+
+        self.assertEqual(timeseries[2020].dtype, np.float32)
+        self.assertEqual(timeseries.max().dtype, np.float64)
+        self.assertEqual(timeseries.sum().dtype, np.float64)
+        np.testing.assert_allclose(timeseries.sum(), [0.6, 0.6, 0.9])
+
+    def test_slice_hours(self):
+        sliced = self.timeseries.slice_hours(1, 3)
+
+        self.assertTrue(np.shares_memory(sliced.profiles, self.profiles))
+        np.testing.assert_array_equal(sliced[2022], [0., 5.])
+        np.testing.assert_array_equal(sliced.max(), [3., 3., 5.])
+
+    def test_year_index_length(self):
+        with self.assertRaises(ValueError):
+            AnnualTimeseries([2020, 2021], self.profiles, [0])
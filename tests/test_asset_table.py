@@ -0,0 +1,84 @@
+"""
+Unit tests for AssetTable class
+"""
+import unittest
+
+import numpy as np
+
+from end_uses.asset import Asset
+from end_uses.asset_table import AssetTable, LIFECYCLE
+
+
+class FullyDepreciatedAsset(Asset):
+    def get_depreciation(self) -> list:
+        return [0.] * len(self.years_vector)
+
+
+class TestAssetTable(unittest.TestCase):
+    def setUp(self):
+        # (install date, cost, lifetime, replacement year)
+        params = [
+            ("1/1/2020", 1000, 10, 2030),
+            ("1/1/2025", 1000, 10, 2032),
+            ("1/1/2015", 500, 20, 2050),
+            ("1/1/2010", 800, 8, 2025),
+            ("1/1/2045", 300, 5, 2060),
+        ]
+
+        self.assets = [Asset(*param[:3], 2020, 2040, param[3]) for param in params]
+
+    def test_matches_asset_methods(self):
+        AssetTable(self.assets).initialize_assets()
+
+        for asset in self.assets:
+            for attribute, method in LIFECYCLE:
+                np.testing.assert_array_equal(
+                    getattr(asset, attribute), getattr(asset, method)(), err_msg=attribute
+                )
+
+    def test_overridden_method(self):
+        self.assets.append(FullyDepreciatedAsset("1/1/2020", 1000, 10, 2020, 2040, 2030))
+        asset_table = AssetTable(self.assets)
+        asset_table.initialize_assets()
+
+        self.assertListEqual(self.assets[-1].depreciation.tolist(), [0.] * 20)
+        self.assertListEqual(asset_table.stranded_value[-1].tolist(), [0.] * 20)
+        self.assertEqual(asset_table.depreciation[0, 0], 1000.)
+
+    def test_rows_are_read_only_views(self):
+        asset_table = AssetTable(self.assets)
+        asset_table.initialize_assets()
+
+        self.assertTrue(np.shares_memory(self.assets[1].depreciation, asset_table.depreciation))
+
+        with self.assertRaises(ValueError):
+            self.assets[0].install_cost[0] = 0.
+
+    def test_initialize_end_use_after_table(self):
+        AssetTable(self.assets).initialize_assets()
+        asset = self.assets[0]
+
+        # The table rows are kept once, and later calls recompute the asset alone
+        asset.initialize_end_use()
+        self.assertListEqual(asset.operational_vector.tolist(), [1] * 10 + [0] * 10)
+
+        asset.replacement_year = 2035
+        asset.initialize_end_use()
+        self.assertListEqual(asset.operational_vector.tolist(), [1] * 15 + [0] * 5)
+
+    def test_sim_years_must_match(self):
+        self.assets.append(Asset("1/1/2020", 1000, 10, 2020, 2050, 2030))
+
+        with self.assertRaises(ValueError):
+            AssetTable(self.assets)
+
+    def test_empty(self):
+        AssetTable([]).initialize_assets()
+
+    def test_compact_vectors(self):
+        AssetTable(self.assets).initialize_assets()
+
+        self.assertFalse(hasattr(self.assets[0], "__dict__"))
+        self.assertEqual(self.assets[0].operational_vector.dtype, np.int8)
+        self.assertEqual(self.assets[0].retrofit_vector.dtype, np.int8)
+        self.assertEqual(self.assets[0].replacement_vector.dtype, bool)
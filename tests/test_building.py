@@ -1,7 +1,6 @@
 """
 Unit tests for the Building module
 """
-import datetime
 import json
 import os
 import unittest
@@ -12,6 +11,8 @@ import pandas as pd
 
 from buildings.building import Building
 from end_uses.building_end_uses.stove import Stove
+from loads.load_store import BASELINE, RETROFIT, LoadStore
+from reference_data.reference_data import REFERENCE_DATA
 
 
 class TestBuilding(unittest.TestCase):
@@ -100,14 +101,6 @@ class TestBuilding(unittest.TestCase):
             self.building.years_vec
         )
 
-        self.assertListEqual(
-            [
-                pd.Timestamp(datetime.datetime(2018, 1, 1) + datetime.timedelta(seconds=60*60*i))
-                for i in range(8760)
-            ],
-            self.building._year_timestamps.to_list()
-        )
-
     def test_get_building_id(self):
         self.building._get_building_id()
 
@@ -139,6 +132,9 @@ class TestBuilding(unittest.TestCase):
             [],
             "baseline_consump",
             "retrofit_consump",
+            end_use_table=self.building.end_use_table,
+            building_id=self.building.building_id,
+            load_scaling_factor=1.,
             **{
                 "end_use": "stove",
                 "replacement_config": "tests/input_data/stoves/elec_stove_config.json",
@@ -146,18 +142,16 @@ class TestBuilding(unittest.TestCase):
             }
         )
 
-    def test_calc_total_custom_baseline(self):
-        self.building.baseline_consumption = pd.DataFrame({
+    def test_add_total_consumption(self):
+        consumption = pd.DataFrame({
             "out.electricity.range_oven.energy_consumption": {1: 1, 2: 2, 3: 3},
             "out.natural_gas.range_oven.energy_consumption": {1: 0, 2: 20, 3: 23},
             "out.electricity.heating.energy_consumption": {1: 0, 2: 0, 3: 1},
             "out.natural_gas.clothes_dryer.energy_consumption": {1: 30, 2: 2, 3: 3},
         })
 
-        self.building._calc_total_custom_baseline()
-
         pd.testing.assert_frame_equal(
-            self.building.baseline_consumption,
+            Building._add_total_consumption(consumption),
             pd.DataFrame({
                 "out.electricity.range_oven.energy_consumption": {1: 1, 2: 2, 3: 3},
                 "out.natural_gas.range_oven.energy_consumption": {1: 0, 2: 20, 3: 23},
@@ -165,38 +159,133 @@ class TestBuilding(unittest.TestCase):
                 "out.natural_gas.clothes_dryer.energy_consumption": {1: 30, 2: 2, 3: 3},
                 "out.electricity.total.energy_consumption": {1: 1, 2: 2, 3: 4},
                 "out.natural_gas.total.energy_consumption": {1: 30, 2: 22, 3: 26},
-                "out.propane.total.energy_consumption": {1: 0, 2: 0, 3: 0},
-                "out.fuel_oil.total.energy_consumption": {1: 0, 2: 0, 3: 0},
                 "out.total.energy_consumption": {1: 31, 2: 24, 3: 30},
             }),
             check_dtype=False
         )
 
-    def test_calc_building_costs(self):
-        self.building.building_params = {
-            "building_level_costs": {
-                "retrofit_adder": {"small": 10, "medium": 25, "large": 100,},
-            },
-            "retrofit_size": "large",
+    def test_drop_zero_columns(self):
+        consumption = pd.DataFrame({
+            "out.electricity.range_oven.energy_consumption": [1., 2., 3.],
+            "out.propane.range_oven.energy_consumption": [0., 0., 0.],
+            "out.natural_gas.heating_hp_bkup.energy_consumption": [0., 0., 1.],
+        })
+
+        self.assertListEqual(
+            Building._drop_zero_columns(consumption).columns.tolist(),
+            [
+                "out.electricity.range_oven.energy_consumption",
+                "out.natural_gas.heating_hp_bkup.energy_consumption",
+            ]
+        )
+
+        dense_consumption = consumption.drop(columns="out.propane.range_oven.energy_consumption")
+        self.assertIs(Building._drop_zero_columns(dense_consumption), dense_consumption)
+
+    def test_register_loads(self):
+        timeseries_index = pd.date_range(start="1/1/2018", periods=8, freq="15T")
+        totals = {
+            "out.{}.total.energy_consumption".format(fuel): np.arange(8.)
+            for fuel in ["electricity", "natural_gas", "propane", "fuel_oil"]
         }
+        self.building.baseline_consumption = pd.DataFrame(totals, index=timeseries_index)
+        self.building.retrofit_consumption = pd.DataFrame(totals, index=timeseries_index) * 2
+        self.building._get_building_id()
 
-        self.building._retrofit_vec = [0, 0, 0, 1, 0]
+        self.building._register_loads()
 
-        self.assertListEqual(
-            self.building._calc_building_costs(),
-            [0, 0, 0, 100, 0]
+        self.assertEqual(self.building.load_index, 0)
+        self.assertEqual(self.building.load_store.intervals_per_hour, 4)
+        np.testing.assert_array_equal(
+            self.building.load_store.get_hourly_profile(0, RETROFIT, "propane"),
+            [12., 44.]
         )
 
-    def test_get_replacement_vec(self):
-        self.building.building_params["retrofit_year"] = 2035
-        self.building.years_vec = list(range(2020, 2040))
+    def test_register_loads_shares_archetype(self):
+        timeseries_index = pd.date_range(start="1/1/2018", periods=8, freq="15T")
+        totals = {
+            "out.{}.total.energy_consumption".format(fuel): np.arange(8.)
+            for fuel in ["electricity", "natural_gas", "propane", "fuel_oil"]
+        }
+        load_store = LoadStore()
+
+        for building_id, load_scaling_factor in [("b1", 1.), ("b2", 0.5)]:
+            building = Building(dict(self.building_params, building_id=building_id), {}, load_store)
+            building.baseline_consumption = pd.DataFrame(totals, index=timeseries_index)
+            building.retrofit_consumption = pd.DataFrame(totals, index=timeseries_index) * 2
+            building.load_scaling_factor = load_scaling_factor
+            building._get_building_id()
+
+            building._register_loads()
+
+        self.assertEqual(len(load_store), 2)
+        self.assertEqual(len(load_store.profiles), 2)
+        np.testing.assert_array_equal(
+            load_store.get_hourly_profile(1, RETROFIT, "propane"),
+            [6., 22.]
+        )
 
-        expected_vec = [False for i in range(20)]
-        expected_vec[15] = True
+    def test_release_consumption_and_move(self):
+        load_store = LoadStore(capacity=1)
+        load_store.add_building(
+            "F_753646_2717355",
+            {"electricity": np.ones(4)},
+            {"electricity": np.zeros(4)},
+        )
 
-        self.assertListEqual(
-            self.building._get_replacement_vec(),
-            expected_vec
+        stove = Mock()
+        self.building.end_uses = {"stove": stove}
+        self.building.load_store = load_store
+        self.building.load_index = 0
+        self.building.baseline_consumption = pd.DataFrame({"a": [1, 2]})
+        self.building._get_building_id()
+
+        self.building.release_consumption()
+
+        self.assertTrue(self.building.baseline_consumption.empty)
+        self.assertTrue(self.building.retrofit_consumption.empty)
+        stove.release_energy_use.assert_called_once()
+
+        shared_store = LoadStore()
+        shared_store.add_building("other", {"electricity": np.zeros(4)}, {})
+
+        self.building.move_to_load_store(shared_store)
+
+        self.assertIs(self.building.load_store, shared_store)
+        self.assertEqual(self.building.load_index, 1)
+        np.testing.assert_array_equal(
+            shared_store.get_profile(1, BASELINE, "electricity"),
+            np.ones(4)
+        )
+
+    @patch("reference_data.reference_data.pd.read_csv")
+    def test_calc_building_utility_costs_from_rates(self, mock_read_csv: Mock):
+        REFERENCE_DATA.clear()
+        self.addCleanup(REFERENCE_DATA.clear)
+        self.building.building_params["consump_costs_filepath"] = "consump_costs.csv"
+
+        mock_read_csv.return_value = pd.DataFrame({
+            "electricity": [0.1, 0.2, 0.3],
+            "natural_gas": [1., 1., 1.],
+            "propane": [0., 0., 0.],
+            "fuel_oil": [0., 0., 0.],
+        }, index=[2020, 2021, 2022])
+
+        self.building._annual_energy_by_fuel = {
+            "electricity": [10., 20.],
+            "natural_gas": [5., 0.],
+            "propane": [0., 0.],
+            "fuel_oil": [0., 0.],
+        }
+
+        self.assertDictEqual(
+            self.building.calc_building_utility_costs(),
+            {
+                "electricity": [10. * 0.1, 20. * 0.2],
+                "natural_gas": [5., 0.],
+                "propane": [0., 0.],
+                "fuel_oil": [0., 0.],
+            }
         )
 
     #TODO: Finalize standard cost data inputs and update
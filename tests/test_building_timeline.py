@@ -0,0 +1,206 @@
+"""
+Unit tests for BuildingTimeline class
+"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from buildings.building import Building
+from buildings.building_timeline import BuildingTimeline, get_emissions_factors
+from loads.load_store import LoadStore
+
+
+class TestBuildingTimeline(unittest.TestCase):
+    def setUp(self):
+        self.years_vec = [2022, 2023, 2024, 2025, 2026]
+        self.load_store = LoadStore()
+
+        self.params = [
+            {
+                "building_id": "b1",
+                "retrofit_year": 2024,
+                "original_fuel_type": "natural_gas",
+                "retrofit_fuel_type": "hybrid_gas",
+                "retrofit_size": "Large",
+                "building_level_costs": {"retrofit_adder": {"large": 100}},
+            },
+            {
+                "building_id": "b2",
+                "retrofit_year": 2030,
+                "original_fuel_type": "fuel_oil",
+                "retrofit_fuel_type": "electricity",
+            },
+            {"building_id": "b3", "original_fuel_type": "propane"},
+        ]
+
+        self.buildings = []
+        for building_params in self.params:
+            building = Building(building_params, {})
+            building.years_vec = self.years_vec
+            building.building_id = building_params["building_id"]
+            building.load_store = self.load_store
+            building.load_index = self.load_store.add_building(
+                building.building_id,
+                {"electricity": np.full(4, 1.5), "natural_gas": np.arange(4.)},
+                {"electricity": np.full(4, 3.)},
+                scale=2.,
+            )
+
+            self.buildings.append(building)
+
+        self.timeline = BuildingTimeline(self.buildings)
+        self.timeline.initialize_buildings()
+
+    @staticmethod
+    def _initialize_building(building_params: dict, years_vec: list) -> Building:
+        building = Building(building_params, {})
+        building.years_vec = years_vec
+        building.building_id = building_params["building_id"]
+        building.load_store = None
+
+        BuildingTimeline([building]).initialize_buildings()
+
+        return building
+
+    def test_building_timelines(self):
+        building = self.buildings[0]
+
+        self.assertListEqual(building._retrofit_vec.tolist(), [False, False, True, False, False])
+        self.assertListEqual(building._is_retrofit_vec.tolist(), [False, False, True, True, True])
+        self.assertListEqual(building._building_annual_costs_other.tolist(), [0, 0, 100, 0, 0])
+        self.assertListEqual(building._fuel_type.tolist(), ["GAS", "GAS", "HPL", "HPL", "HPL"])
+        self.assertListEqual(building._methane_leaks.tolist(), [2, 2, 1, 1, 1])
+        np.testing.assert_array_equal(
+            building._annual_energy_by_fuel["natural_gas"], [12., 12., 0., 0., 0.]
+        )
+        np.testing.assert_allclose(
+            building._combustion_emissions["electricity"],
+            np.array([12., 12., 24. * 0.97, 24. * 0.97 ** 2, 24. * 0.97 ** 3]) * 0.45 / 1000
+        )
+        np.testing.assert_allclose(
+            building._combustion_emissions["natural_gas"],
+            np.array([12., 12., 0., 0., 0.]) * 53 / (293 * 907)
+        )
+
+        building = self.buildings[1]
+
+        self.assertFalse(building._retrofit_vec.any())
+        self.assertListEqual(building._building_annual_costs_other.tolist(), [0] * 5)
+        self.assertListEqual(building._fuel_type.tolist(), ["OIL"] * 5)
+        self.assertListEqual(building._methane_leaks.tolist(), [0] * 5)
+        np.testing.assert_array_equal(building._annual_energy_by_fuel["natural_gas"], [12.] * 5)
+
+    def test_building_without_retrofit_year(self):
+        # The building is retrofitted in the last simulation year
+        building = self.buildings[2]
+
+        self.assertListEqual(building._retrofit_vec.tolist(), [False] * 4 + [True])
+        self.assertListEqual(building._is_retrofit_vec.tolist(), [False] * 4 + [True])
+        np.testing.assert_array_equal(
+            building._annual_energy_by_fuel["natural_gas"], [12.] * 4 + [0.]
+        )
+
+        # A null retrofit year is never reached
+        building = self._initialize_building(
+            {"building_id": "b4", "retrofit_year": None}, self.years_vec
+        )
+
+        self.assertFalse(building._is_retrofit_vec.any())
+
+    def test_retrofit_vec(self):
+        building = self._initialize_building(
+            {"building_id": "b4", "retrofit_year": 2035}, list(range(2020, 2040))
+        )
+
+        expected_vec = [False for i in range(20)]
+        expected_vec[15] = True
+
+        self.assertListEqual(building._retrofit_vec.tolist(), expected_vec)
+
+    def test_building_costs(self):
+        building = self._initialize_building(
+            {
+                "building_id": "b4",
+                "retrofit_year": 2025,
+                "building_level_costs": {
+                    "retrofit_adder": {"small": 10, "medium": 25, "large": 100,},
+                },
+                "retrofit_size": "large",
+            },
+            self.years_vec
+        )
+
+        self.assertListEqual(building._building_annual_costs_other.tolist(), [0, 0, 0, 100, 0])
+
+    def test_annual_energy_by_fuel(self):
+        building = Building({"building_id": "b4", "retrofit_year": 2024}, {})
+        building.years_vec = [2022, 2023, 2024, 2025]
+        building._get_building_id()
+
+        timeseries_index = pd.date_range(start="1/1/2018", periods=4, freq="15T")
+
+        building.baseline_consumption = pd.DataFrame({
+            "out.electricity.total.energy_consumption": [1., 2., 3., 4.],
+            "out.natural_gas.total.energy_consumption": [5., 5., 0., 0.],
+            "out.propane.total.energy_consumption": [0., 0., 0., 0.],
+            "out.fuel_oil.total.energy_consumption": [0., 0., 0., 0.],
+        }, index=timeseries_index)
+
+        building.retrofit_consumption = pd.DataFrame({
+            "out.electricity.total.energy_consumption": [2., 2., 6., 6.],
+            "out.natural_gas.total.energy_consumption": [0., 0., 0., 0.],
+            "out.propane.total.energy_consumption": [0., 0., 0., 0.],
+            "out.fuel_oil.total.energy_consumption": [0., 0., 0., 0.],
+        }, index=timeseries_index)
+
+        building._register_loads()
+        BuildingTimeline([building]).initialize_buildings()
+
+        self.assertDictEqual(
+            {fuel: values.tolist() for fuel, values in building._annual_energy_by_fuel.items()},
+            {
+                "electricity": [10., 10., 16., 16.],
+                "natural_gas": [10., 10., 0., 0.],
+                "propane": [0., 0., 0., 0.],
+                "fuel_oil": [0., 0., 0., 0.],
+            }
+        )
+
+    def test_initialize_buildings(self):
+        np.testing.assert_array_equal(
+            self.timeline.is_retrofit_vec,
+            [
+                [False, False, True, True, True],
+                [False, False, False, False, False],
+                [False, False, False, False, True],
+            ]
+        )
+        self.assertListEqual(
+            self.timeline.fuel_type[0].tolist(), ["GAS", "GAS", "HPL", "HPL", "HPL"]
+        )
+        self.assertListEqual(self.timeline.methane_leaks[0].tolist(), [2, 2, 1, 1, 1])
+        self.assertListEqual(self.timeline.fuel_type[2].tolist(), ["LPG"] * 4 + [None])
+        np.testing.assert_array_equal(
+            self.timeline.annual_energy_by_fuel["electricity"][0], [12., 12., 24., 24., 24.]
+        )
+
+        with self.assertRaises(ValueError):
+            self.buildings[0]._is_retrofit_vec[0] = True
+
+    def test_add_building_mismatched_years(self):
+        building = Building({"building_id": "b4"}, {})
+        building.years_vec = [2020, 2021]
+
+        with self.assertRaises(ValueError):
+            self.timeline.add_building(building)
+
+    def test_get_emissions_factors(self):
+        emissions_factors = get_emissions_factors(self.years_vec)
+
+        self.assertEqual(emissions_factors.shape, (4, 5))
+        self.assertIs(get_emissions_factors(list(self.years_vec)), emissions_factors)
+        np.testing.assert_allclose(
+            emissions_factors[0] / emissions_factors[0, 0], [1., 1., 0.97, 0.97 ** 2, 0.97 ** 3]
+        )
+        self.assertTrue((emissions_factors[1] == emissions_factors[1, 0]).all())
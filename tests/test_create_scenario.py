@@ -6,7 +6,9 @@ import os
 import unittest
 from unittest.mock import Mock, patch
 
-from scenario_creator.create_scenario import ScenarioCreator
+from scenario_creator.create_scenario import (
+    _WORKER_PROFILE_LIBRARY, ScenarioCreator, _populate_building
+)
 
 
 class TestScenarioCreator(unittest.TestCase):
@@ -88,6 +90,42 @@ class TestScenarioCreator(unittest.TestCase):
             os.path.join("./outputs_combined/scenarios", "hybrid_gas")
         )
 
+    def test_set_outputs_path_with_segment(self):
+        self.scenario_creator.segment = "sf"
+        self.scenario_creator._decarb_scenario = "hybrid_gas"
+
+        self.assertEqual(
+            self.scenario_creator._set_outputs_path(),
+            os.path.join("./outputs_combined/scenarios", "sf", "hybrid_gas")
+        )
+
+    def test_get_run_metadata(self):
+        self.scenario_creator.segment = "sf"
+        self.scenario_creator._decarb_scenario = "hybrid_gas"
+        self.scenario_creator._years_vec = list(range(2020, 2050))
+
+        run_metadata = self.scenario_creator._get_run_metadata()
+
+        self.assertEqual(run_metadata["run_id"], self.scenario_creator.run_id)
+        self.assertEqual(run_metadata["segment"], "sf")
+        self.assertEqual(run_metadata["scenario"], "hybrid_gas")
+        self.assertEqual(run_metadata["sim_start_year"], 2020)
+        self.assertEqual(run_metadata["sim_end_year"], 2050)
+        self.assertEqual(run_metadata["precision"], "float64")
+        self.assertNotIn("max_relative_difference", run_metadata)
+
+    def test_precision(self):
+        scenario_creator = ScenarioCreator(
+            "tests/input_data/sim_settings_config.json", precision="float32", report_accuracy=True
+        )
+
+        self.assertEqual(scenario_creator.precision, "float32")
+        self.assertTrue(scenario_creator._report_accuracy)
+        self.assertFalse(self.scenario_creator._report_accuracy)
+
+        with self.assertRaises(ValueError):
+            ScenarioCreator("tests/input_data/sim_settings_config.json", precision="float16")
+
     def test_get_years_vec(self):
         self.assertListEqual(
             list(range(2020, 2050)),
@@ -125,7 +163,11 @@ class TestScenarioCreator(unittest.TestCase):
 
         mock_building.assert_called_once_with(
             expected_config[0],
-            {"buildings_config_filepath": "./tests/input_data/building_config.json"}
+            {"buildings_config_filepath": "./tests/input_data/building_config.json"},
+            load_store=self.scenario_creator.load_store,
+            profile_library=None,
+            end_use_table=self.scenario_creator.end_use_table,
+            building_timeline=self.scenario_creator.building_timeline
         )
 
         mock_building_instance.populate_building.assert_called_once()
@@ -150,7 +192,9 @@ class TestScenarioCreator(unittest.TestCase):
         mock_utility_network.assert_called_once_with(
             "path-to-config",
             {"utility_network_config_filepath": "path-to-config"},
-            "buildings"
+            "buildings",
+            network_tables=None,
+            network_topologies=None
         )
 
         self.assertEqual(
@@ -159,3 +203,22 @@ class TestScenarioCreator(unittest.TestCase):
         )
 
         utility_instance.populate_utility_network.assert_called_once()
+
+    @patch("scenario_creator.create_scenario.Building")
+    def test_populate_building(self, mock_building: Mock):
+        building_instance = Mock()
+        mock_building.return_value = building_instance
+
+        building = _populate_building(
+            ({"building_id": "b1"}, {"sim_start_year": 2020}, True, None)
+        )
+
+        self.assertEqual(building, building_instance)
+        mock_building.assert_called_once_with(
+            {"building_id": "b1"},
+            {"sim_start_year": 2020},
+            profile_library=_WORKER_PROFILE_LIBRARY
+        )
+        building_instance.populate_building.assert_called_once()
+        building_instance.write_building_energy_info.assert_called_once()
+        building_instance.release_consumption.assert_called_once()
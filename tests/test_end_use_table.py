@@ -0,0 +1,105 @@
+"""
+Unit tests for EndUseTable class
+"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from end_uses.building_end_uses.end_use_table import EndUseTable
+from end_uses.building_end_uses.hvac import HVAC
+from end_uses.building_end_uses.stove import Stove
+
+
+class TestEndUseTable(unittest.TestCase):
+    def setUp(self):
+        self.years_vec = [2020, 2021, 2022, 2023, 2024]
+        self.end_use_table = EndUseTable()
+
+        self.params = [
+            ("b1", Stove, {
+                "existing_install_year": 2015, "lifetime": 10, "existing_install_cost": 750,
+                "replacement_year": 2023, "replacement_cost": 1000, "escalator": 0.1,
+            }),
+            ("b1", HVAC, {
+                "existing_install_year": 2018, "lifetime": 15, "existing_install_cost": 9000,
+                "replacement_year": 2022, "replacement_cost": 12000, "replacement_lifetime": 20,
+            }),
+            ("b2", Stove, {"existing_install_cost": 500, "replacement_year": 2030}),
+        ]
+
+        self.end_uses = [
+            end_use_class(
+                self.years_vec, pd.DataFrame(), pd.DataFrame(),
+                end_use_table=self.end_use_table, building_id=building_id, **params
+            )
+            for building_id, end_use_class, params in self.params
+        ]
+
+        for end_use in self.end_uses:
+            end_use.initialize_end_use()
+
+    def test_end_use_values(self):
+        stove, hvac, _ = self.end_uses
+
+        stove_book_val = 750 * 0.9 ** 7 * (1 - np.arange(5, 10) / 10)
+        np.testing.assert_allclose(stove.existing_book_val, stove_book_val)
+        self.assertListEqual(stove._replacement_vec.tolist(), [False, False, False, True, False])
+        np.testing.assert_allclose(stove.existing_stranded_val, [0, 0, 0, stove_book_val[3], 0])
+        np.testing.assert_allclose(stove.replacement_cost, [0, 0, 0, 1100., 0])
+        np.testing.assert_allclose(stove.replacement_book_val, [0, 0, 0, 1100., 990.])
+
+        hvac_book_val = 9000 * 0.98 ** 4 * (1 - np.arange(2, 7) / 15)
+        np.testing.assert_allclose(hvac.existing_book_val, hvac_book_val)
+        self.assertListEqual(hvac._replacement_vec.tolist(), [False, False, True, False, False])
+        np.testing.assert_allclose(hvac.existing_stranded_val, [0, 0, hvac_book_val[2], 0, 0])
+        np.testing.assert_allclose(hvac.replacement_cost, [0, 0, 12000., 0, 0])
+        np.testing.assert_allclose(hvac.replacement_book_val, [0, 0, 12000., 11400., 10800.])
+
+    def test_building_totals(self):
+        np.testing.assert_allclose(
+            self.end_use_table.get_building_totals("existing_book_val", "b1"),
+            np.add(self.end_uses[0].existing_book_val, self.end_uses[1].existing_book_val)
+        )
+        np.testing.assert_array_equal(
+            self.end_use_table.get_building_totals("replacement_cost", "b2"), [0.] * 5
+        )
+        np.testing.assert_array_equal(
+            self.end_use_table.get_building_totals("replacement_cost", "b3"), [0.] * 5
+        )
+
+    def test_same_type_replaces_row(self):
+        row = self.end_use_table.add_end_use(
+            "b2", "stove", self.years_vec, {"existing_install_cost": 0}
+        )
+
+        self.assertEqual(row, 2)
+        self.assertEqual(len(self.end_use_table), 3)
+        np.testing.assert_array_equal(self.end_uses[2].existing_book_val, [0.] * 5)
+
+    def test_move_to_end_use_table(self):
+        shared_table = EndUseTable()
+        self.end_uses[2].move_to_end_use_table(shared_table)
+
+        self.assertEqual(len(shared_table), 1)
+        self.assertListEqual(shared_table.building_ids, ["b2"])
+        np.testing.assert_array_equal(
+            shared_table.get_building_totals("existing_book_val", "b2"),
+            self.end_uses[2].existing_book_val
+        )
+
+    def test_values_are_read_only(self):
+        with self.assertRaises(ValueError):
+            self.end_uses[0].replacement_cost[0] = 0.
+
+    def test_cost_table(self):
+        cost_table = self.end_uses[0].cost_table
+
+        self.assertListEqual(cost_table.index.tolist(), self.years_vec)
+        self.assertListEqual(
+            cost_table["stove_replacement_vec"].tolist(), [0, 0, 0, 1, 0]
+        )
+
+    def test_years_must_match(self):
+        with self.assertRaises(ValueError):
+            self.end_use_table.add_end_use("b3", "stove", [2020, 2021], {})
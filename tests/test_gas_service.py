@@ -4,6 +4,8 @@ Unit tests for GasService class
 import unittest
 from unittest.mock import Mock
 
+import numpy as np
+
 from end_uses.utility_end_uses.gas_service import GasService
 
 
@@ -87,6 +89,14 @@ class TestGasService(unittest.TestCase):
             self.gas_service.get_book_value()
         )
 
+    def test_book_value(self):
+        self.gas_service.depreciation = np.array([10., 11., 12.])
+
+        self.assertIs(self.gas_service.book_value, self.gas_service.depreciation)
+
+        with self.assertRaises(AttributeError):
+            self.gas_service.book_value = [1., 2., 3.]
+
     def test_get_shutoff_year(self):
         self.gas_service.decarb_scenario = "hybrid_npa"
 
@@ -96,7 +106,7 @@ class TestGasService(unittest.TestCase):
         )
 
     def test_update_stranded_value(self):
-        self.gas_service.book_value = [1, 1, 2]
+        self.gas_service.depreciation = [1, 1, 2]
         self.gas_service.shutoff_year = [0, 1, 0]
 
         self.assertListEqual(
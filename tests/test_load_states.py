@@ -0,0 +1,138 @@
+"""
+Unit tests for the LoadStates class
+"""
+import unittest
+
+import numpy as np
+
+from loads.load_states import LoadStates, get_annual_timeseries
+from loads.load_store import LoadStore
+from loads.time_axis import HOURS_PER_YEAR
+
+
+class TestLoadStates(unittest.TestCase):
+    def setUp(self):
+        self.load_store = LoadStore()
+
+        self.load_store.add_building(
+            "b1",
+            {"electricity": np.array([1., 2., 3., 4.])},
+            {"electricity": np.array([2., 2., 6., 6.])},
+            intervals_per_hour=2
+        )
+        self.load_store.add_building(
+            "b2",
+            {"electricity": np.array([1., 1., 1., 1.])},
+            {"electricity": np.array([0., 0., 5., 5.])},
+            intervals_per_hour=2
+        )
+
+        self.b1_states = LoadStates.for_building(
+            self.load_store, 0, "electricity", [True, False, False]
+        )
+        self.b2_states = LoadStates.for_building(
+            self.load_store, 1, "electricity", [True, True, False]
+        )
+
+    def test_for_building(self):
+        np.testing.assert_array_equal(self.b1_states.columns, [0, 1])
+        np.testing.assert_array_equal(
+            self.b1_states.get_timeseries(),
+            [[3., 7.], [4., 12.], [4., 12.]]
+        )
+
+    def test_combine(self):
+        states = LoadStates.combine([self.b1_states, self.b2_states, self.b2_states])
+
+        np.testing.assert_array_equal(states.columns, [0, 1, 2, 3])
+        np.testing.assert_array_equal(
+            states.get_timeseries(),
+            [[7., 11.], [8., 16.], [4., 32.]]
+        )
+
+    def test_combine_mismatched_fuel(self):
+        gas_states = LoadStates.for_building(self.load_store, 1, "natural_gas", [True] * 3)
+
+        with self.assertRaises(ValueError):
+            LoadStates.combine([self.b1_states, gas_states])
+
+    def test_get_distinct_timeseries(self):
+        states = LoadStates.combine([self.b1_states, self.b2_states])
+
+        distinct_timeseries, year_index = states.get_distinct_timeseries()
+
+        self.assertEqual(distinct_timeseries.shape, (3, 2))
+        np.testing.assert_array_equal(
+            distinct_timeseries[year_index],
+            [[5., 9.], [6., 14.], [4., 22.]]
+        )
+
+    def test_get_distinct_timeseries_float32(self):
+        load_store = LoadStore(dtype=np.float32)
+        load_store.add_building(
+            "b1",
+            {"electricity": np.array([1., 2., 3., 4.])},
+            {"electricity": np.array([2., 2., 6., 6.])},
+            intervals_per_hour=2
+        )
+        states = LoadStates.for_building(load_store, 0, "electricity", [True, False, False])
+
+        distinct_timeseries, year_index = states.get_distinct_timeseries()
+
+        self.assertEqual(distinct_timeseries.dtype, np.float32)
+        np.testing.assert_array_equal(
+            distinct_timeseries[year_index], [[3., 7.], [4., 12.], [4., 12.]]
+        )
+
+    def test_get_distinct_timeseries_breakpoints(self):
+        states = LoadStates.for_building(
+            self.load_store, 0, "electricity", [True] * 30 + [False] * 50
+        )
+
+        distinct_timeseries, year_index = states.get_distinct_timeseries()
+
+        self.assertEqual(distinct_timeseries.shape, (2, 2))
+        self.assertEqual(len(year_index), 80)
+        np.testing.assert_array_equal(distinct_timeseries[year_index[0]], [3., 7.])
+        np.testing.assert_array_equal(distinct_timeseries[year_index[-1]], [4., 12.])
+
+    def test_for_building_shared_profile(self):
+        idx = self.load_store.add_building("b3", 2, 3, intervals_per_hour=2, scale=0.5)
+
+        states = LoadStates.combine([
+            self.b2_states,
+            LoadStates.for_building(self.load_store, idx, "electricity", [True, False, False]),
+        ])
+
+        np.testing.assert_array_equal(states.columns, [2, 3])
+        np.testing.assert_array_equal(
+            states.get_timeseries(),
+            [[3., 3.], [2., 7.], [0., 15.]]
+        )
+
+    def test_get_distinct_timeseries_skips_zero_profiles(self):
+        self.load_store.add_building("b3", {"natural_gas": np.ones(4)}, {}, intervals_per_hour=2)
+        states = LoadStates.for_building(self.load_store, 2, "natural_gas", [True, True, False])
+
+        distinct_timeseries, year_index = states.get_distinct_timeseries()
+
+        self.assertEqual(distinct_timeseries.shape, (2, 2))
+        np.testing.assert_array_equal(
+            distinct_timeseries[year_index], [[2., 2.], [2., 2.], [0., 0.]]
+        )
+
+    def test_get_annual_timeseries(self):
+        states, annual_timeseries = get_annual_timeseries(
+            [self.b1_states, None, self.b2_states], [2020, 2021, 2022]
+        )
+
+        np.testing.assert_array_equal(states.columns, [0, 1, 2, 3])
+        self.assertListEqual(list(annual_timeseries), [2020, 2021, 2022])
+        np.testing.assert_array_equal(annual_timeseries[2021], [6., 14.])
+
+    def test_get_annual_timeseries_without_states(self):
+        states, annual_timeseries = get_annual_timeseries([None], [2020, 2021])
+
+        self.assertIsNone(states)
+        self.assertEqual(annual_timeseries[2021].shape, (HOURS_PER_YEAR,))
+        np.testing.assert_array_equal(annual_timeseries.max(), [0., 0.])
@@ -0,0 +1,176 @@
+"""
+Unit tests for the LoadStore class
+"""
+import unittest
+
+import numpy as np
+
+from loads.load_store import BASELINE, RETROFIT, LoadStore
+
+
+class TestLoadStore(unittest.TestCase):
+    def setUp(self):
+        self.load_store = LoadStore(capacity=1)
+
+        self.idx = self.load_store.add_building(
+            "b1",
+            {"electricity": np.array([1., 2., 3., 4.]), "natural_gas": np.array([5., 5., 0., 0.])},
+            {"electricity": np.array([2., 2., 6., 6.])},
+            intervals_per_hour=2
+        )
+
+    def test_add_building(self):
+        self.assertEqual(self.idx, 0)
+        self.assertListEqual(self.load_store.building_ids, ["b1"])
+        self.assertEqual(self.load_store.profiles.shape, (2, 4, 4))
+        np.testing.assert_array_equal(self.load_store.profile_rows, [[0, 1]])
+
+        np.testing.assert_array_equal(
+            self.load_store.get_profile(0, RETROFIT, "natural_gas"),
+            [0., 0., 0., 0.]
+        )
+
+    def test_add_building_grows_store(self):
+        idx = self.load_store.add_building(
+            "b2",
+            {"electricity": np.ones(4)},
+            {"electricity": np.zeros(4)},
+            intervals_per_hour=2
+        )
+
+        self.assertEqual(idx, 1)
+        self.assertEqual(self.load_store.profiles.shape, (4, 4, 4))
+
+        np.testing.assert_array_equal(
+            self.load_store.get_profile(0, BASELINE, "electricity"),
+            [1., 2., 3., 4.]
+        )
+
+    def test_add_building_mismatched_intervals(self):
+        with self.assertRaises(ValueError):
+            self.load_store.add_building(
+                "b2",
+                {"electricity": np.ones(8)},
+                {"electricity": np.ones(8)},
+                intervals_per_hour=2
+            )
+
+    def test_get_profile_read_only(self):
+        profile = self.load_store.get_profile(0, BASELINE, "electricity")
+
+        with self.assertRaises(ValueError):
+            profile[0] = 10
+
+    def test_get_hourly_profile(self):
+        np.testing.assert_array_equal(
+            self.load_store.get_hourly_profile(0, BASELINE, "electricity"),
+            [3., 7.]
+        )
+
+    def test_get_total(self):
+        self.assertEqual(self.load_store.get_total(0, BASELINE, "natural_gas"), 10.)
+        self.assertEqual(self.load_store.get_total(0, RETROFIT, "electricity"), 16.)
+
+    def test_get_hourly_profiles(self):
+        hourly_profiles = self.load_store.get_hourly_profiles("electricity")
+
+        np.testing.assert_array_equal(hourly_profiles, [[3., 7.], [4., 12.]])
+        self.assertIs(self.load_store.get_hourly_profiles("electricity"), hourly_profiles)
+
+        self.load_store.add_building(
+            "b2",
+            {"electricity": np.ones(4)},
+            {"electricity": np.zeros(4)},
+            intervals_per_hour=2
+        )
+
+        self.assertEqual(self.load_store.get_hourly_profiles("electricity").shape, (4, 2))
+
+    def test_get_totals(self):
+        totals = self.load_store.get_totals("electricity")
+
+        np.testing.assert_array_equal(totals, [10., 16.])
+        self.assertEqual(totals.dtype, np.float64)
+        self.assertIs(self.load_store.get_totals("electricity"), totals)
+
+        self.load_store.add_building(
+            "b2",
+            {"electricity": np.ones(4)},
+            {"electricity": np.zeros(4)},
+            intervals_per_hour=2
+        )
+
+        np.testing.assert_array_equal(
+            self.load_store.get_totals("electricity"), [10., 16., 4., 0.]
+        )
+
+    def test_nonzero(self):
+        self.load_store.add_building(
+            "b2",
+            {"electricity": np.ones(4), "propane": np.zeros(4)},
+            {"electricity": np.zeros(4)},
+            intervals_per_hour=2
+        )
+
+        np.testing.assert_array_equal(
+            self.load_store.nonzero,
+            [
+                [True, True, False, False],
+                [True, False, False, False],
+                [True, False, False, False],
+                [False, False, False, False],
+            ]
+        )
+        np.testing.assert_array_equal(
+            self.load_store.get_hourly_profiles("natural_gas"),
+            [[10., 0.], [0., 0.], [0., 0.], [0., 0.]]
+        )
+        np.testing.assert_array_equal(self.load_store.get_totals("propane"), [0., 0., 0., 0.])
+
+    def test_add_profile_interned(self):
+        profile = {"electricity": np.array([1., 1., 2., 2.])}
+
+        row = self.load_store.add_profile(profile, intervals_per_hour=2, key="archetype.csv")
+
+        self.assertEqual(
+            self.load_store.add_profile({}, intervals_per_hour=2, key="archetype.csv"), row
+        )
+        self.assertEqual(self.load_store.get_profile_row("archetype.csv"), row)
+        self.assertEqual(self.load_store.get_profile_key(row), "archetype.csv")
+        self.assertIsNone(self.load_store.get_profile_row("other.csv"))
+        self.assertEqual(len(self.load_store.profiles), 3)
+
+    def test_add_building_shared_profile(self):
+        row = self.load_store.add_profile(
+            {"electricity": np.array([1., 1., 2., 2.])}, intervals_per_hour=2, key="archetype.csv"
+        )
+
+        idx = self.load_store.add_building("b2", row, row, intervals_per_hour=2, scale=0.5)
+
+        self.assertEqual(len(self.load_store.profiles), 3)
+        self.assertEqual(self.load_store.get_scale(idx), 0.5)
+        np.testing.assert_array_equal(
+            self.load_store.get_profile(idx, RETROFIT, "electricity"), [0.5, 0.5, 1., 1.]
+        )
+        np.testing.assert_array_equal(
+            self.load_store.get_hourly_profile(idx, BASELINE, "electricity"), [1., 2.]
+        )
+        self.assertEqual(self.load_store.get_total(idx, BASELINE, "electricity"), 3.)
+
+    def test_add_building_unknown_profile_row(self):
+        with self.assertRaises(ValueError):
+            self.load_store.add_building("b2", 0, 5)
+
+    def test_float32_store(self):
+        load_store = LoadStore(dtype=np.float32)
+        load_store.add_building(
+            "b1", {"electricity": np.array([0.1, 0.2, 0.3, 0.4])}, {}, intervals_per_hour=2
+        )
+
+        self.assertEqual(load_store.dtype, np.float32)
+        self.assertEqual(load_store.profiles.dtype, np.float32)
+        self.assertEqual(load_store.get_hourly_profiles("electricity").dtype, np.float32)
+
+        totals = load_store.get_totals("electricity")
+        self.assertEqual(totals.dtype, np.float64)
+        np.testing.assert_allclose(totals, [1., 0.], rtol=1e-6)
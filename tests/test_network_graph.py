@@ -0,0 +1,58 @@
+"""
+Unit tests for NetworkGraph class
+"""
+import unittest
+
+import numpy as np
+
+from utility_network.network_graph import NetworkGraph
+
+
+class TestNetworkGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = NetworkGraph()
+        self.graph.add_node("m1", "s1")
+        self.graph.add_node("m2", "s2")
+        self.graph.add_node("s1", "sec1")
+        self.graph.add_node("s2", "sec2")
+        self.graph.add_node("sec2", "sec1")
+        self.graph.add_node("sec1", "t1")
+        self.graph.add_node("t1", "substation", is_root=True)
+
+    def test_get_children(self):
+        self.assertListEqual(self.graph.get_children("sec1"), ["s1", "sec2"])
+        self.assertListEqual(self.graph.get_children("m1"), [])
+        self.assertEqual(self.graph.get_parent("sec2"), "sec1")
+
+    def test_add_node_duplicate(self):
+        with self.assertRaises(ValueError):
+            self.graph.add_node("m1", "s2")
+
+    def test_add_node_missing_parent(self):
+        self.graph.add_node("p1", np.nan, is_root=True)
+
+        self.assertIsNone(self.graph.get_parent("p1"))
+
+    def test_topological_sort(self):
+        ordered = self.graph.topological_sort()
+
+        self.assertListEqual(ordered, ["m1", "m2", "s1", "s2", "sec2", "sec1", "t1"])
+
+        for node_id in ordered:
+            for child_id in self.graph.get_children(node_id):
+                self.assertLess(ordered.index(child_id), ordered.index(node_id))
+
+    def test_topological_sort_cycle(self):
+        self.graph.add_node("a", "b")
+        self.graph.add_node("b", "a")
+
+        with self.assertRaises(ValueError):
+            self.graph.topological_sort()
+
+    def test_get_orphans(self):
+        self.assertListEqual(self.graph.get_orphans(), [])
+
+        self.graph.add_node("m3", "s3")
+        self.graph.add_node("t2", None)
+
+        self.assertListEqual(self.graph.get_orphans(), ["m3", "t2"])
@@ -0,0 +1,42 @@
+"""
+Unit tests for NetworkTopology class
+"""
+import unittest
+
+import pandas as pd
+
+from utility_network.network_topology import NetworkTopology
+
+
+class TestNetworkTopology(unittest.TestCase):
+    def setUp(self):
+        self.levels = [
+            ("meter_config", int, "meters"),
+            ("service_config", float, "services"),
+            ("mains_config", str, "mains"),
+        ]
+        self.configs = [
+            pd.DataFrame({"gisid": ["m1", "m2", "m3"], "parentid": ["s1", "s2", "s9"]}),
+            pd.DataFrame({"gisid": ["s1", "s2"], "parentid": ["g1", "g1"]}),
+            pd.DataFrame({"gisid": ["g1"], "parentid": [None]}),
+        ]
+
+        self.topology = NetworkTopology(self.levels, self.configs)
+
+    def test_ordered(self):
+        self.assertListEqual(self.topology.ordered, ["m1", "m2", "m3", "s1", "s2", "g1"])
+        self.assertListEqual(self.topology.graph.get_children("g1"), ["s1", "s2"])
+
+    def test_asset_configs(self):
+        self.assertListEqual(
+            list(self.topology.asset_configs), ["m1", "m2", "m3", "s1", "s2", "g1"]
+        )
+
+        asset_class, attribute, config = self.topology.asset_configs["s2"]
+
+        self.assertIs(asset_class, float)
+        self.assertEqual(attribute, "services")
+        self.assertEqual(config["parentid"], "g1")
+
+    def test_orphans(self):
+        self.assertListEqual(self.topology.orphans, ["m3"])
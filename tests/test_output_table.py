@@ -0,0 +1,60 @@
+"""
+Unit tests for the OutputTable class
+"""
+import unittest
+
+import pandas as pd
+
+from scenario_creator.output_table import OutputTable
+
+
+class TestOutputTable(unittest.TestCase):
+    def setUp(self):
+        self.table = OutputTable("consumption", [2020, 2021], ["asset_id", "asset_domain"])
+
+    def test_to_frame(self):
+        self.table.add([1.5, 2.5], asset_id="b1", asset_domain="building")
+        self.table.add([3, 4], asset_id="x1", asset_domain="elec_network")
+
+        expected = pd.concat([
+            pd.DataFrame({
+                "year": [2020, 2021],
+                "consumption": [1.5, 2.5],
+                "asset_id": "b1",
+                "asset_domain": "building",
+            }),
+            pd.DataFrame({
+                "year": [2020, 2021],
+                "consumption": [3, 4],
+                "asset_id": "x1",
+                "asset_domain": "elec_network",
+            }),
+        ], ignore_index=True)
+
+        self.assertEqual(len(self.table), 4)
+        pd.testing.assert_frame_equal(self.table.to_frame(), expected)
+
+    def test_to_frame_mixed_dtypes(self):
+        self.table.add([0, 1], asset_id="b1", asset_domain="building")
+        self.table.add([1.5, None], asset_id="x1", asset_domain="elec_network")
+
+        consumption = self.table.to_frame()["consumption"]
+
+        self.assertEqual(consumption.dtype, float)
+        self.assertListEqual(consumption.tolist()[:3], [0., 1., 1.5])
+        self.assertTrue(pd.isna(consumption.iloc[3]))
+
+    def test_to_frame_strings(self):
+        self.table.add(["GAS", "ELEC"], asset_id="b1", asset_domain="building")
+
+        self.assertEqual(self.table.to_frame()["consumption"].dtype, object)
+
+    def test_to_frame_empty(self):
+        self.assertListEqual(
+            list(self.table.to_frame().columns),
+            ["year", "consumption", "asset_id", "asset_domain"]
+        )
+
+    def test_add_wrong_length(self):
+        with self.assertRaises(ValueError):
+            self.table.add([1.], asset_id="b1", asset_domain="building")
@@ -0,0 +1,115 @@
+"""
+Unit tests for PipeTable class
+"""
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from end_uses.utility_end_uses.gas_main import GasMain
+from end_uses.utility_end_uses.gas_service import GasService
+from utility_network.pipe_table import PipeTable
+
+
+ATTRIBUTES = [
+    "operational_vector", "retrofit_vector", "replacement_vector", "install_cost",
+    "depreciation", "book_value", "shutoff_year", "stranded_value",
+    "annual_operating_expenses", "annual_total_leakage",
+]
+
+
+def _get_meter(operational_vector: list, retrofit_vec: list) -> Mock:
+    meter = Mock()
+    meter.operational_vector = operational_vector
+    meter.building._retrofit_vec = retrofit_vec
+    meter.annual_total_energy_use = {2020: 1.}
+    meter.annual_peak_energy_use = {2020: 0.5}
+
+    return meter
+
+
+class TestPipeTable(unittest.TestCase):
+    def _create_network(self, decarb_scenario: str) -> list:
+        sim_settings = {
+            "inst_date": "1/1/1980",
+            "inst_cost": 500,
+            "lifetime": 40,
+            "sim_start_year": 2020,
+            "sim_end_year": 2030,
+            "replacement_year": 2060,
+            "decarb_scenario": decarb_scenario,
+            "pressure": 1,
+            "diameter": 1,
+        }
+
+        meters = [
+            _get_meter([1] * 5 + [0] * 5, [False] * 4 + [True] + [False] * 5),
+            _get_meter([1] * 8 + [0] * 2, [False] * 7 + [True] + [False] * 2),
+            _get_meter([1] * 10, [False] * 10),
+        ]
+
+        services = [
+            GasService(
+                gisid="s1", parentid="m1", length_ft=10, material="WS", replacement_cost=1000,
+                connected_assets=meters[:2], **sim_settings
+            ),
+            GasService(
+                gisid="s2", parentid="m1", length_ft=20, material="BS", replacement_cost=900,
+                connected_assets=meters[2:], **sim_settings
+            ),
+        ]
+
+        main = GasMain(
+            gisid="m1", parentid="m0", length_ft=500, material="CI", replacement_cost=125000,
+            shutoff_cost=20000, connected_assets=services, **sim_settings
+        )
+
+        return [*services, main]
+
+    def _assert_matches_initialize_end_use(self, decarb_scenario: str):
+        expected = self._create_network(decarb_scenario)
+        for pipe in expected:
+            pipe.initialize_end_use()
+
+        pipes = self._create_network(decarb_scenario)
+        PipeTable(pipes).initialize_pipes()
+
+        for expected_pipe, pipe in zip(expected, pipes):
+            for attribute in ATTRIBUTES:
+                np.testing.assert_array_equal(
+                    getattr(pipe, attribute),
+                    getattr(expected_pipe, attribute),
+                    err_msg=f"{pipe.asset_id}.{attribute}"
+                )
+
+            self.assertDictEqual(pipe.annual_total_energy_use, expected_pipe.annual_total_energy_use)
+            self.assertListEqual(pipe.get_install_cost(), expected_pipe.get_install_cost())
+
+    def test_retrofit_scenario(self):
+        self._assert_matches_initialize_end_use("hybrid_gas")
+
+    def test_shutoff_scenario(self):
+        self._assert_matches_initialize_end_use("natural_elec")
+
+        pipes = self._create_network("natural_elec")
+        PipeTable(pipes).initialize_pipes()
+
+        # Mains follow the building of the first meter of each service
+        self.assertListEqual(pipes[2].shutoff_year.tolist(), [0.] * 4 + [1.] + [0.] * 5)
+
+    def test_parent_index_and_height(self):
+        pipe_table = PipeTable(self._create_network("hybrid_gas"))
+
+        self.assertListEqual(pipe_table.parent_index.tolist(), [2, 2, -1])
+        self.assertListEqual(pipe_table.height.tolist(), [0, 0, 1])
+        self.assertListEqual(pipe_table.materials.tolist(), ["BS", "CI", "WS"])
+
+    def test_results_are_read_only(self):
+        pipes = self._create_network("hybrid_gas")
+        PipeTable(pipes).initialize_pipes()
+
+        with self.assertRaises(ValueError):
+            pipes[0].annual_total_leakage[0] = 0.
+
+    def test_empty(self):
+        PipeTable([]).initialize_pipes()
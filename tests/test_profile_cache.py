@@ -0,0 +1,63 @@
+"""
+Unit tests for the ProfileCache class
+"""
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+import pandas as pd
+
+from loads.profile_cache import ProfileCache
+
+
+class TestProfileCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        self.source_filepath = os.path.join(self.tmp_dir.name, "profile.csv")
+        with open(self.source_filepath, "w") as f:
+            f.write("timestamp,elec,gas\n2018-01-01 00:15:00,1.5,0\n")
+
+        self.profile = pd.DataFrame(
+            {"elec": [1.5, 2.5], "gas": [0, 3]},
+            index=pd.DatetimeIndex(["2018-01-01 00:00", "2018-01-01 00:15"], name="timestamp")
+        )
+        self.profile_cache = ProfileCache(os.path.join(self.tmp_dir.name, "cache"))
+
+    def test_get(self):
+        parser = Mock(return_value=self.profile)
+
+        first = self.profile_cache.get(self.source_filepath, parser)
+        second = self.profile_cache.get(self.source_filepath, parser)
+
+        parser.assert_called_once_with(self.source_filepath)
+        pd.testing.assert_frame_equal(first, self.profile)
+        pd.testing.assert_frame_equal(second, self.profile)
+
+    def test_get_changed_source(self):
+        parser = Mock(return_value=self.profile)
+        self.profile_cache.get(self.source_filepath, parser)
+
+        with open(self.source_filepath, "a") as f:
+            f.write("2018-01-01 00:30:00,2.5,3\n")
+
+        self.profile_cache.get(self.source_filepath, parser)
+
+        self.assertEqual(parser.call_count, 2)
+
+    def test_get_key_salt(self):
+        self.assertNotEqual(
+            self.profile_cache.get_key(self.source_filepath, "a"),
+            self.profile_cache.get_key(self.source_filepath, "b")
+        )
+
+    def test_get_uncacheable_profile(self):
+        profile = self.profile.assign(label=["x", "y"])
+        parser = Mock(return_value=profile)
+
+        self.profile_cache.get(self.source_filepath, parser)
+        self.profile_cache.get(self.source_filepath, parser)
+
+        self.assertEqual(parser.call_count, 2)
@@ -0,0 +1,30 @@
+"""
+Unit tests for the ProfileLibrary class
+"""
+import unittest
+from unittest.mock import Mock
+
+from loads.profile_library import ProfileLibrary
+
+
+class TestProfileLibrary(unittest.TestCase):
+    def test_get(self):
+        profile_library = ProfileLibrary()
+        loader = Mock(return_value="profile")
+
+        self.assertEqual(profile_library.get("a.csv", loader), "profile")
+        self.assertEqual(profile_library.get("a.csv", loader), "profile")
+
+        loader.assert_called_once_with("a.csv")
+        self.assertEqual(len(profile_library), 1)
+
+    def test_get_with_profile_cache(self):
+        profile_cache = Mock()
+        profile_cache.get.return_value = "profile"
+        profile_library = ProfileLibrary(profile_cache)
+        loader = Mock()
+
+        self.assertEqual(profile_library.get("a.csv", loader, "salt"), "profile")
+
+        profile_cache.get.assert_called_once_with("a.csv", loader, "salt")
+        loader.assert_not_called()
@@ -0,0 +1,82 @@
+"""
+Unit tests for the fixed-grid profile reader
+"""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from loads.profile_reader import PROFILE_INTERVALS, TAIL_SIZE, read_fixed_grid_profile
+
+
+class TestProfileReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        self.mapping = {"elec.cooking": "out.electricity.range_oven.energy_consumption"}
+
+        timestamps = pd.date_range("2018-01-01 00:15", periods=PROFILE_INTERVALS, freq="15T")
+        self.values = np.arange(PROFILE_INTERVALS) / 4
+
+        self.frame = pd.DataFrame({
+            "timestamp": timestamps.strftime("%Y-%m-%d %H:%M:%S"),
+            "elec.cooking": self.values,
+            "weather.drybulb": 10.,
+            "out.natural_gas.heating.energy_consumption": 1,
+        })
+
+    def _write(self, frame: pd.DataFrame) -> str:
+        filepath = os.path.join(self.tmp_dir.name, "profile.csv")
+        frame.to_csv(filepath, index=False)
+
+        return filepath
+
+    def test_read_fixed_grid_profile(self):
+        profile = read_fixed_grid_profile(self._write(self.frame), self.mapping)
+
+        self.assertListEqual(
+            profile.columns.tolist(),
+            [
+                "out.electricity.range_oven.energy_consumption",
+                "out.natural_gas.heating.energy_consumption",
+            ]
+        )
+        self.assertTrue((profile.dtypes == np.float64).all())
+        self.assertEqual(profile.index.name, "timestamp")
+        self.assertEqual(profile.index[0], pd.Timestamp("2018-01-01 00:00"))
+        self.assertEqual(profile.index[-1], pd.Timestamp("2018-12-31 23:45"))
+        np.testing.assert_array_equal(
+            profile["out.electricity.range_oven.energy_consumption"], self.values
+        )
+
+    def test_read_off_grid_profile(self):
+        self.assertIsNone(read_fixed_grid_profile(self._write(self.frame[:-1]), self.mapping))
+        self.assertIsNone(read_fixed_grid_profile(self._write(self.frame[::4]), self.mapping))
+
+    def test_read_colliding_columns(self):
+        self.mapping["elec.cooking_backup"] = "out.electricity.range_oven.energy_consumption"
+        self.frame["elec.cooking_backup"] = 0.
+
+        self.assertIsNone(read_fixed_grid_profile(self._write(self.frame), self.mapping))
+
+    def test_read_multi_byte_tail(self):
+        self.frame["site"] = "é" * 39
+        filepath = self._write(self.frame)
+
+        # The tail read starts inside a multi-byte character
+        with open(filepath, "rb") as f:
+            self.assertEqual(f.read()[-TAIL_SIZE] & 0xC0, 0x80)
+
+        profile = read_fixed_grid_profile(filepath, self.mapping)
+
+        self.assertEqual(profile.index[-1], pd.Timestamp("2018-12-31 23:45"))
+
+    def test_read_undecodable_tail(self):
+        filepath = self._write(self.frame)
+        with open(filepath, "ab") as f:
+            f.write(b"\xff\xfe\n")
+
+        self.assertIsNone(read_fixed_grid_profile(filepath, self.mapping))
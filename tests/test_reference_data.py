@@ -0,0 +1,81 @@
+"""
+Unit tests for ReferenceData class
+"""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from reference_data.reference_data import ReferenceData
+
+
+class TestReferenceData(unittest.TestCase):
+    def setUp(self):
+        self.reference_data = ReferenceData()
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        self.leakage_filepath = os.path.join(self.tmp_dir.name, "leakage_factors.csv")
+        pd.DataFrame({
+            "asset": ["gas_main", "gas_main", "gas_service"],
+            "code": ["CI", "PL", "CI"],
+            "value": [0.2, 0.01, 0.1],
+            "unit": ["kgCH4/ft-yr"] * 3,
+        }).to_csv(self.leakage_filepath, index=False)
+
+        self.costs_filepath = os.path.join(self.tmp_dir.name, "costs.csv")
+        pd.DataFrame({
+            "building_id": ["b1", "b2"],
+            "STOVE": [100, 200],
+        }).to_csv(self.costs_filepath, index=False)
+
+        self.rates_filepath = os.path.join(self.tmp_dir.name, "rates.csv")
+        pd.DataFrame({
+            "Year": [2020, 2021],
+            "electricity": [0.1, 0.2],
+        }).to_csv(self.rates_filepath, index=False)
+
+    def test_get_leakage_factors(self):
+        leakage_factors = self.reference_data.get_leakage_factors(self.leakage_filepath)
+
+        self.assertEqual(leakage_factors[("gas_main", "PL")], 0.01)
+        self.assertEqual(leakage_factors[("gas_service", "CI")], 0.1)
+
+        with self.assertRaises(TypeError):
+            leakage_factors[("gas_main", "CI")] = 1.
+
+    def test_get_building_costs(self):
+        costs = self.reference_data.get_building_costs(self.costs_filepath)
+
+        self.assertEqual(costs["b2"]["STOVE"], 200)
+        self.assertIsNone(costs.get("b3"))
+
+        with self.assertRaises(TypeError):
+            costs["b1"]["STOVE"] = 0
+
+    def test_get_consumption_rates(self):
+        rates = self.reference_data.get_consumption_rates(self.rates_filepath)
+
+        np.testing.assert_array_equal(rates["electricity"], [0.1, 0.2])
+
+        with self.assertRaises(ValueError):
+            rates["electricity"][0] = 1.
+
+    def test_tables_loaded_once(self):
+        with patch("reference_data.reference_data.pd.read_csv", wraps=pd.read_csv) as read_csv:
+            first = self.reference_data.get_building_costs(self.costs_filepath)
+            second = self.reference_data.get_building_costs(
+                os.path.join(self.tmp_dir.name, ".", "costs.csv")
+            )
+
+        self.assertIs(first, second)
+        read_csv.assert_called_once()
+        self.assertEqual(len(self.reference_data), 1)
+
+        self.reference_data.clear()
+
+        self.assertEqual(len(self.reference_data), 0)
@@ -0,0 +1,135 @@
+"""
+Unit tests for the ResultCombiner class
+"""
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from results.result_combiner import ResultCombiner
+
+
+class TestResultCombiner(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        self.outputs_path = self.tmp_dir.name
+        self.combiner = ResultCombiner(self.outputs_path, workers=2)
+
+        self._write_output("sf", "hybrid_gas", "fuel_type", ["GAS", "HPL"])
+        self._write_output("sf", "continued_gas", "fuel_type", ["GAS", "GAS"])
+
+    def _write_output(self, segment: str, scenario: str, table: str, values: list) -> None:
+        path = os.path.join(self.outputs_path, segment, scenario)
+        os.makedirs(path, exist_ok=True)
+
+        pd.DataFrame({"year": [2020, 2021], table: values}).to_csv(
+            os.path.join(path, f"{table}.csv"), index=False
+        )
+
+    def _read_combined(self, table: str) -> pd.DataFrame:
+        return pd.read_csv(os.path.join(self.outputs_path, "sf", "combined", f"{table}.csv"))
+
+    def test_discover_partitions(self):
+        self._write_output("", "natural_elec", "fuel_type", ["GAS", "ELEC"])
+
+        self.assertDictEqual(
+            self.combiner.discover_partitions(),
+            {
+                "": {"natural_elec": os.path.join(self.outputs_path, "natural_elec")},
+                "sf": {
+                    "continued_gas": os.path.join(self.outputs_path, "sf", "continued_gas"),
+                    "hybrid_gas": os.path.join(self.outputs_path, "sf", "hybrid_gas"),
+                },
+            }
+        )
+
+    def test_combine(self):
+        self.assertDictEqual(self.combiner.combine(), {"sf": {"fuel_type": 2}})
+
+        pd.testing.assert_frame_equal(
+            self._read_combined("fuel_type"),
+            pd.DataFrame({
+                "year": [2020, 2021, 2020, 2021],
+                "fuel_type": ["GAS", "GAS", "GAS", "HPL"],
+                "scenario": ["continued_gas"] * 2 + ["hybrid_gas"] * 2,
+            })
+        )
+
+    def test_combine_unchanged(self):
+        self.combiner.combine()
+
+        self.assertDictEqual(self.combiner.combine(), {"sf": {"fuel_type": 0}})
+
+    def test_combine_changed_and_new_scenarios(self):
+        self.combiner.combine()
+
+        self._write_output("sf", "continued_gas", "fuel_type", ["OIL", "ELEC"])
+        self._write_output("sf", "natural_elec", "fuel_type", ["GAS", "ELEC"])
+        self._write_output("sf", "natural_elec", "retrofit_year", [False, True])
+
+        self.assertDictEqual(
+            self.combiner.combine_segment("sf"),
+            {"fuel_type": 2, "retrofit_year": 1}
+        )
+
+        pd.testing.assert_frame_equal(
+            self._read_combined("fuel_type"),
+            pd.DataFrame({
+                "year": [2020, 2021] * 3,
+                "fuel_type": ["OIL", "ELEC", "GAS", "HPL", "GAS", "ELEC"],
+                "scenario": ["continued_gas"] * 2 + ["hybrid_gas"] * 2 + ["natural_elec"] * 2,
+            })
+        )
+        self.assertListEqual(
+            self._read_combined("retrofit_year")["scenario"].tolist(),
+            ["natural_elec"] * 2
+        )
+
+    def test_combine_removed_scenario(self):
+        self.combiner.combine()
+
+        os.remove(os.path.join(self.outputs_path, "sf", "hybrid_gas", "fuel_type.csv"))
+        os.rmdir(os.path.join(self.outputs_path, "sf", "hybrid_gas"))
+
+        self.combiner.combine()
+
+        self.assertListEqual(
+            self._read_combined("fuel_type")["scenario"].tolist(),
+            ["continued_gas"] * 2
+        )
+
+    def test_combine_rebuilds_missing_combined_file(self):
+        self.combiner.combine()
+        os.remove(os.path.join(self.outputs_path, "sf", "combined", "fuel_type.csv"))
+
+        self.assertDictEqual(self.combiner.combine(), {"sf": {"fuel_type": 2}})
+        self.assertEqual(len(self._read_combined("fuel_type")), 4)
+
+    def test_combine_different_columns(self):
+        path = os.path.join(self.outputs_path, "sf", "natural_elec")
+        os.makedirs(path)
+        pd.DataFrame({"year": [2020], "fuel_type": ["ELEC"], "retrofit": [True]}).to_csv(
+            os.path.join(path, "fuel_type.csv"), index=False
+        )
+
+        self.assertDictEqual(self.combiner.combine(), {"sf": {"fuel_type": 3}})
+
+        combined = self._read_combined("fuel_type")
+        self.assertListEqual(
+            combined.columns.tolist(), ["year", "fuel_type", "scenario", "retrofit"]
+        )
+        self.assertListEqual(combined["retrofit"].isna().tolist(), [True] * 4 + [False])
+
+        # The rebuilt table is kept, so unchanged sources are not parsed again
+        self.assertDictEqual(self.combiner.combine(), {"sf": {"fuel_type": 0}})
+
+        self._write_output("sf", "continued_gas", "fuel_type", ["OIL", "ELEC"])
+
+        self.assertDictEqual(self.combiner.combine(), {"sf": {"fuel_type": 1}})
+        self.assertListEqual(
+            self._read_combined("fuel_type")["fuel_type"].tolist(),
+            ["OIL", "ELEC", "GAS", "HPL", "ELEC"]
+        )
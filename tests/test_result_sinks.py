@@ -0,0 +1,123 @@
+"""
+Unit tests for the result sink classes
+"""
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import pandas as pd
+
+from results.csv_sink import CsvSink
+from results.memory_sink import MemorySink
+from results.parquet_sink import NULL_PARTITION, ParquetSink
+from results.sqlite_sink import SqliteSink
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+
+except ImportError:
+    HAS_PYARROW = False
+
+
+class ResultSinkTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        self.run_metadata = {"run_id": "run1", "segment": "sf", "scenario": "hybrid_gas"}
+        self.tables = {
+            "fuel_type": pd.DataFrame({
+                "year": [2020, 2021],
+                "fuel_type": ["GAS", "HPL"],
+                "asset_id": ["b1", "b1"],
+            })
+        }
+
+
+class TestCsvSink(ResultSinkTestCase):
+    def test_get_outputs_path(self):
+        sink = CsvSink("outputs")
+
+        self.assertEqual(
+            sink.get_outputs_path("sf", "hybrid_gas"),
+            os.path.join("outputs", "sf", "hybrid_gas")
+        )
+        self.assertEqual(
+            sink.get_outputs_path(None, "hybrid_gas"),
+            os.path.join("outputs", "hybrid_gas")
+        )
+
+    def test_write_results(self):
+        sink = CsvSink(self.tmp_dir.name)
+        sink.write_results(self.run_metadata, self.tables)
+
+        outputs_path = os.path.join(self.tmp_dir.name, "sf", "hybrid_gas")
+
+        pd.testing.assert_frame_equal(
+            pd.read_csv(os.path.join(outputs_path, "fuel_type.csv")),
+            self.tables["fuel_type"]
+        )
+
+        with open(os.path.join(outputs_path, "run_metadata.json")) as f:
+            self.assertDictEqual(json.load(f), self.run_metadata)
+
+
+class TestSqliteSink(ResultSinkTestCase):
+    def test_write_results_replaces_previous_run(self):
+        db_path = os.path.join(self.tmp_dir.name, "results.sqlite")
+        sink = SqliteSink(db_path)
+
+        sink.write_results(self.run_metadata, self.tables)
+        sink.write_results({**self.run_metadata, "run_id": "run2"}, self.tables)
+        sink.write_results({**self.run_metadata, "segment": "mf", "run_id": "run3"}, self.tables)
+
+        with sqlite3.connect(db_path) as conn:
+            fuel_type = pd.read_sql("SELECT * FROM fuel_type", conn)
+            runs = pd.read_sql("SELECT * FROM runs", conn)
+
+        self.assertListEqual(sorted(runs["run_id"]), ["run2", "run3"])
+        self.assertListEqual(
+            list(fuel_type.columns),
+            ["year", "fuel_type", "asset_id", "segment", "scenario", "run_id"]
+        )
+        self.assertListEqual(sorted(fuel_type["run_id"]), ["run2", "run2", "run3", "run3"])
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+class TestParquetSink(ResultSinkTestCase):
+    def test_write_results(self):
+        sink = ParquetSink(self.tmp_dir.name)
+
+        sink.write_results(self.run_metadata, self.tables)
+        sink.write_results({**self.run_metadata, "run_id": "run2"}, self.tables)
+
+        table_path = os.path.join(
+            self.tmp_dir.name, "segment=sf", "scenario=hybrid_gas", "table=fuel_type"
+        )
+
+        self.assertListEqual(os.listdir(table_path), ["part-run2.parquet"])
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(os.path.join(table_path, "part-run2.parquet")),
+            self.tables["fuel_type"].assign(run_id="run2")
+        )
+
+    def test_get_outputs_path_without_segment(self):
+        self.assertEqual(
+            ParquetSink("outputs").get_outputs_path(None, "hybrid_gas"),
+            os.path.join("outputs", f"segment={NULL_PARTITION}", "scenario=hybrid_gas")
+        )
+
+
+class TestMemorySink(ResultSinkTestCase):
+    def test_write_results(self):
+        sink = MemorySink()
+        sink.write_results(self.run_metadata, self.tables)
+
+        self.assertIsNone(sink.get_outputs_path("sf", "hybrid_gas"))
+        self.assertDictEqual(sink.run_metadata[("sf", "hybrid_gas")], self.run_metadata)
+        pd.testing.assert_frame_equal(
+            sink.results[("sf", "hybrid_gas")]["fuel_type"], self.tables["fuel_type"]
+        )
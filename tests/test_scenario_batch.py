@@ -0,0 +1,44 @@
+"""
+Unit tests for ScenarioBatch class
+"""
+import unittest
+from unittest.mock import Mock, call, patch
+
+from scenario_creator.scenario_batch import ScenarioBatch
+
+
+class TestScenarioBatch(unittest.TestCase):
+    def setUp(self):
+        self.scenario_batch = ScenarioBatch({
+            "continued_gas": "continued_gas_settings.json",
+            "hybrid_gas": "hybrid_gas_settings.json",
+        })
+
+    @patch("scenario_creator.scenario_batch.ScenarioCreator")
+    def test_run_scenarios(self, mock_scenario_creator: Mock):
+        scenario_instance = Mock()
+        scenario_instance.buildings = {}
+        mock_scenario_creator.return_value = scenario_instance
+
+        self.scenario_batch.run_scenarios()
+
+        shared_kwargs = {
+            "write_building_energy_timeseries": False,
+            "workers": 1,
+            "profile_library": self.scenario_batch.profile_library,
+            "network_tables": self.scenario_batch.network_tables,
+            "network_topologies": self.scenario_batch.network_topologies,
+            "executor": None,
+            "profile_cache_dir": None,
+            "segment": None,
+            "result_sink": None,
+            "precision": "float64",
+            "report_accuracy": False,
+        }
+
+        mock_scenario_creator.assert_has_calls([
+            call("continued_gas_settings.json", **shared_kwargs),
+            call().create_scenario(),
+            call("hybrid_gas_settings.json", **shared_kwargs),
+            call().create_scenario(),
+        ])
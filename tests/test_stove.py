@@ -3,6 +3,7 @@ Contains tests for the Stove end use
 """
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from end_uses.building_end_uses.stove import Stove
@@ -35,7 +36,7 @@ class TestStove(unittest.TestCase):
         self.stove._get_custom_energies()
 
         pd.testing.assert_frame_equal(
-            self.stove.baseline_energy_use,
+            self.stove.baseline_energy_use.to_frame(),
             pd.DataFrame({
                 "out.electricity.range_oven.energy_consumption": {0: 0, 1: 0},
                 "out.natural_gas.range_oven.energy_consumption": {0: 10, 1: 3},
@@ -44,7 +45,7 @@ class TestStove(unittest.TestCase):
         )
 
         pd.testing.assert_frame_equal(
-            self.stove.retrofit_energy_use,
+            self.stove.retrofit_energy_use.to_frame(),
             pd.DataFrame({
                 "out.electricity.range_oven.energy_consumption": {0: 10, 1: 3},
                 "out.natural_gas.range_oven.energy_consumption": {0: 0, 1: 0},
@@ -52,62 +53,60 @@ class TestStove(unittest.TestCase):
             })
         )
 
-    def test_get_existing_book_val(self):
-        self.stove._kwargs = {
-            "existing_install_year": 2015,
-            "lifetime": 10,
-            "existing_install_cost": 750,
-            "escalator": 0,
-        }
+    def _create_stove(self, **kwargs) -> Stove:
+        stove = Stove(self.years_vec, pd.DataFrame(), pd.DataFrame(), **kwargs)
+        stove.initialize_end_use()
 
-        expected_book_val = [375., 300., 225., 150., 75.]
+        return stove
 
-        self.assertListEqual(
-            expected_book_val,
-            self.stove._get_existing_book_val()
+    def test_existing_book_val(self):
+        stove = self._create_stove(
+            existing_install_year=2015, lifetime=10, existing_install_cost=750, escalator=0
         )
 
-    def test_get_replacement_vec(self):
-        self.stove._kwargs = {"replacement_year": 2023}
+        np.testing.assert_allclose(stove.existing_book_val, [375., 300., 225., 150., 75.])
+
+    def test_replacement_vec(self):
+        stove = self._create_stove(replacement_year=2023)
 
         self.assertListEqual(
             [False, False, False, True, False],
-            self.stove._get_replacement_vec()
+            stove._replacement_vec.tolist()
         )
 
-    def test_get_existing_stranded_val(self):
-        self.stove._kwargs = {
-            "replacement_year": 2023,
-        }
+    def test_existing_stranded_val(self):
+        stove = self._create_stove(
+            existing_install_year=2015, lifetime=10, existing_install_cost=750, escalator=0,
+            replacement_year=2023
+        )
 
-        self.stove.existing_book_val = [500, 400, 300, 200, 100]
-        self.stove._replacement_vec = [False, False, False, True, False]
+        np.testing.assert_allclose(stove.existing_stranded_val, [0, 0, 0, 150., 0])
 
-        self.assertListEqual(
-            [0, 0, 0, 200, 0],
-            self.stove._get_existing_stranded_val()
-        )
+    def test_replacement_cost(self):
+        stove = self._create_stove(replacement_cost=1000, replacement_year=2023, escalator=0.1)
 
-    def test_get_replacement_cost(self):
-        self.stove._kwargs = {
-            "replacement_cost": 1000,
-            "replacement_year": 2023,
-            "escalator": 0.1,
-        }
+        np.testing.assert_allclose(stove.replacement_cost, [0, 0, 0, 1100., 0])
 
-        self.assertListEqual(
-            [0, 0, 0, 1100., 0],
-            self.stove._get_replacement_cost()
+    def test_replacement_book_val(self):
+        stove = self._create_stove(
+            replacement_cost=1200, replacement_year=2023, replacement_lifetime=5, escalator=0
         )
 
-    def test_get_replacement_book_value(self):
-        self.stove.replacement_cost = [0, 0, 0, 1200, 0]
-        self.stove._kwargs = {
-            "replacement_year": 2023,
-            "replacement_lifetime": 5,
-        }
+        np.testing.assert_allclose(stove.replacement_book_val, [0, 0, 0, 1200., 960.])
 
-        self.assertListEqual(
-            [0, 0, 0, 1200., 960.,],
-            self.stove._get_replacement_book_value()
-        )
+    def test_custom_energies_are_views(self):
+        self.stove._get_custom_energies()
+
+        self.assertTrue(np.shares_memory(
+            self.stove.baseline_energy_use["out.natural_gas.range_oven.energy_consumption"],
+            self.stove._custom_baseline_energy.values
+        ))
+
+        propane_key = "out.propane.range_oven.energy_consumption"
+        zeros = self.stove.baseline_energy_use[propane_key]
+
+        self.assertIs(zeros, self.stove.retrofit_energy_use[propane_key])
+        self.assertFalse(zeros.flags.writeable)
+
+        with self.assertRaises(KeyError):
+            self.stove.baseline_energy_use["out.electricity.something"]
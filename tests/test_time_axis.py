@@ -0,0 +1,51 @@
+"""
+Unit tests for the positional time axis
+"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from loads.time_axis import (
+    HOUR_OF_YEAR, HOURS_PER_YEAR, YEAR_TIMESTAMPS, get_intervals_per_hour, to_positional
+)
+
+
+class TestTimeAxis(unittest.TestCase):
+    def test_axis(self):
+        self.assertEqual(len(HOUR_OF_YEAR), HOURS_PER_YEAR)
+        self.assertEqual(len(YEAR_TIMESTAMPS), HOURS_PER_YEAR)
+        self.assertEqual(YEAR_TIMESTAMPS[0], pd.Timestamp("2018-01-01"))
+
+    def test_get_intervals_per_hour(self):
+        index = pd.date_range(start="2017-12-31 23:45", periods=8, freq="15T")
+        self.assertEqual(get_intervals_per_hour(index), 4)
+
+        index = pd.date_range(start="2018-01-01", periods=3, freq="H")
+        self.assertEqual(get_intervals_per_hour(index), 1)
+
+    def test_get_intervals_per_hour_invalid(self):
+        with self.assertRaises(ValueError):
+            get_intervals_per_hour(pd.DatetimeIndex(["2018-01-01"]))
+
+        with self.assertRaises(ValueError):
+            get_intervals_per_hour(pd.DatetimeIndex(
+                ["2018-01-01 00:00", "2018-01-01 00:15", "2018-01-01 01:00"]
+            ))
+
+        with self.assertRaises(ValueError):
+            get_intervals_per_hour(pd.date_range(start="2018-01-01", periods=3, freq="7T"))
+
+    def test_to_positional(self):
+        frame = pd.DataFrame(
+            {"a": [1., np.nan, 3., 4.], "b": [1, 1, 1, 1]},
+            index=pd.date_range(start="2017-12-31 23:45", periods=4, freq="15T")
+        )
+
+        np.testing.assert_array_equal(
+            to_positional(frame, ["b", "a", "c"], 4),
+            [[1., 1., 1., 1.], [1., 0., 3., 4.], [0., 0., 0., 0.]]
+        )
+
+        with self.assertRaises(ValueError):
+            to_positional(frame, ["a"], 3)
@@ -4,6 +4,8 @@ Integration tests for the gas service line
 import unittest
 from unittest.mock import Mock
 
+import numpy as np
+
 from end_uses.utility_end_uses.gas_service import GasService
 
 
@@ -43,9 +45,9 @@ class TestGasService(unittest.TestCase):
         self.gas_service.initialize_end_use()
 
     def test_annual_total_leaks(self):
-        self.assertListEqual(
-            [0.227*10]*5 + [0]*5,
-            self.gas_service.annual_total_leakage
+        np.testing.assert_allclose(
+            self.gas_service.annual_total_leakage,
+            [0.227*10]*5 + [0]*5
         )
 
     def test_annual_total_energy_use(self):
@@ -67,10 +69,10 @@ class TestGasService(unittest.TestCase):
         )
 
     def test_stranded_value(self):
-        self.assertListEqual(
+        np.testing.assert_array_equal(
+            self.gas_service.stranded_value,
             [
                 0, 0, 0, 0, 0,
                 0, 0, 0, 0, 0
-            ],
-            self.gas_service.stranded_value
+            ]
         )
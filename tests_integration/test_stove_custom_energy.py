@@ -45,7 +45,7 @@ class TestStoveIntegration(unittest.TestCase):
         self.stove.initialize_end_use()
 
         pd.testing.assert_frame_equal(
-            self.stove.baseline_energy_use,
+            self.stove.baseline_energy_use.to_frame(),
             pd.DataFrame({
                 "out.electricity.range_oven.energy_consumption": {0: 0, 1: 0, 2: 1, 3: 0},
                 "out.natural_gas.range_oven.energy_consumption": {0: 0, 1: 0, 2: 0, 3: 0},
@@ -54,7 +54,7 @@ class TestStoveIntegration(unittest.TestCase):
         )
 
         pd.testing.assert_frame_equal(
-            self.stove.retrofit_energy_use,
+            self.stove.retrofit_energy_use.to_frame(),
             pd.DataFrame({
                 "out.electricity.range_oven.energy_consumption": {0: 0, 1: 0, 2: 12, 3: 0},
                 "out.natural_gas.range_oven.energy_consumption": {0: 0, 1: 0, 2: 0, 3: 0},
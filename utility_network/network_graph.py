@@ -0,0 +1,146 @@
+"""
+Defines the graph of parent-child connections between the assets of a utility network
+"""
+from typing import Dict, Hashable, List
+
+import pandas as pd
+
+
+class NetworkGraph:
+    """
+    Directed graph of a utility network, with an edge from each asset to its parent. Children are
+    indexed by parent ID when they are added, so looking up the children of an asset does not scan
+    the network
+
+    Assets are ordered bottom-up with a topological sort, so downstream assets are always processed
+    before the assets they connect to, at any depth of the network
+
+    Args:
+        None
+
+    Attributes:
+        None
+
+    Methods:
+        add_node (None): Add an asset and its connection to its parent
+        get_parent (Hashable): Get the parent ID of an asset
+        get_children (List[Hashable]): Get the IDs of the assets connected to an asset
+        get_orphans (List[Hashable]): Get the assets whose parent is not in the network
+        topological_sort (List[Hashable]): Get the asset IDs ordered with children before parents
+    """
+    def __init__(self):
+        self._parents: Dict[Hashable, Hashable] = {}
+        self._is_root: Dict[Hashable, bool] = {}
+        self._children: Dict[Hashable, List[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def __contains__(self, node_id: Hashable) -> bool:
+        return node_id in self._parents
+
+    def add_node(
+            self, node_id: Hashable, parent_id: Hashable = None, is_root: bool = False
+    ) -> None:
+        """
+        Add an asset to the graph. Children are kept in the order they are added
+
+        Args:
+            node_id (Hashable): The ID of the asset
+
+        Optional args:
+            parent_id (Hashable): The ID of the parent of the asset. Empty for assets without a
+                parent
+            is_root (bool): True if the asset is at the top of the network. The parents of root
+                assets are outside of the network, so they are not reported as orphans
+
+        Returns:
+            None
+        """
+        if node_id in self._parents:
+            raise ValueError(f"Asset {node_id} is defined more than once in the network.")
+
+        if _is_missing(parent_id):
+            parent_id = None
+
+        self._parents[node_id] = parent_id
+        self._is_root[node_id] = is_root
+
+        if parent_id is not None:
+            self._children.setdefault(parent_id, []).append(node_id)
+
+    def get_parent(self, node_id: Hashable) -> Hashable:
+        """
+        Get the parent ID of an asset
+
+        Args:
+            node_id (Hashable): The ID of the asset
+
+        Returns:
+            Hashable: The parent ID, or None if the asset has no parent
+        """
+        return self._parents[node_id]
+
+    def get_children(self, node_id: Hashable) -> List[Hashable]:
+        """
+        Get the assets directly connected downstream of an asset
+
+        Args:
+            node_id (Hashable): The ID of the asset
+
+        Returns:
+            List[Hashable]: IDs of the child assets, in the order they were added
+        """
+        return list(self._children.get(node_id, []))
+
+    def get_orphans(self) -> List[Hashable]:
+        """
+        Get the assets that are not connected to the network. These are non-root assets whose
+        parent ID does not match any asset
+
+        Returns:
+            List[Hashable]: IDs of the orphaned assets, in the order they were added
+        """
+        return [
+            node_id for node_id, parent_id in self._parents.items()
+            if not self._is_root[node_id] and parent_id not in self._parents
+        ]
+
+    def topological_sort(self) -> List[Hashable]:
+        """
+        Order the assets so that every asset comes after all of its children. Assets without
+        children come first, in the order they were added
+
+        Returns:
+            List[Hashable]: IDs of all assets, ordered bottom-up
+        """
+        pending = {node_id: len(self.get_children(node_id)) for node_id in self._parents}
+        ready = [node_id for node_id, n_children in pending.items() if n_children == 0]
+
+        ordered = []
+        while ready:
+            next_ready = []
+
+            for node_id in ready:
+                ordered.append(node_id)
+
+                parent_id = self._parents[node_id]
+                if parent_id in pending:
+                    pending[parent_id] -= 1
+
+                    if pending[parent_id] == 0:
+                        next_ready.append(parent_id)
+
+            ready = next_ready
+
+        if len(ordered) < len(self._parents):
+            unresolved = [node_id for node_id in self._parents if pending[node_id] > 0]
+            raise ValueError(
+                f"The network contains a cycle. Assets on or above the cycle: {unresolved}."
+            )
+
+        return ordered
+
+
+def _is_missing(node_id: Hashable) -> bool:
+    return node_id is None or (not isinstance(node_id, str) and bool(pd.isna(node_id)))
@@ -0,0 +1,44 @@
+"""
+Defines the topology of a utility network: its assets, their config rows, and their connections
+"""
+from typing import Dict, Hashable, List, Tuple
+
+import pandas as pd
+
+from utility_network.network_graph import NetworkGraph
+
+
+class NetworkTopology:
+    """
+    The assets of a network, ordered bottom-up, with the config row, class, and list attr of each
+    asset. The topology only depends on the network config tables, not on the scenario, so
+    scenarios on the same street segment can build it once and each create their own assets from it
+
+    Args:
+        levels (List[Tuple[str, type, str]]): Config table, asset class, and list attr of each level
+            of the network, from the meters up. The last level is the top of the network
+        configs (List[pd.DataFrame]): The config table of each level
+
+    Attributes:
+        graph (NetworkGraph): Graph of the connections between the assets
+        asset_configs (Dict[Hashable, Tuple[type, str, pd.Series]]): Asset class, list attr, and
+            config row of each asset, by asset ID, in config order
+        ordered (List[Hashable]): Asset IDs ordered with children before parents
+        orphans (List[Hashable]): Assets whose parent is not in the network
+
+    Methods:
+        None
+    """
+    def __init__(self, levels: List[Tuple[str, type, str]], configs: List[pd.DataFrame]):
+        self.graph: NetworkGraph = NetworkGraph()
+        self.asset_configs: Dict[Hashable, Tuple[type, str, pd.Series]] = {}
+
+        for level, ((_, asset_class, attribute), level_configs) in enumerate(zip(levels, configs)):
+            for _, config in level_configs.iterrows():
+                self.graph.add_node(
+                    config["gisid"], config.get("parentid"), is_root=level == len(levels) - 1
+                )
+                self.asset_configs[config["gisid"]] = (asset_class, attribute, config)
+
+        self.ordered: List[Hashable] = self.graph.topological_sort()
+        self.orphans: List[Hashable] = self.graph.get_orphans()
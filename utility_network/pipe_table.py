@@ -0,0 +1,301 @@
+"""
+Array-backed table of the gas pipes of a utility network, initialized all at once
+"""
+import warnings
+from typing import List
+
+import numpy as np
+
+from end_uses.utility_end_uses import gas_main, gas_service
+from end_uses.utility_end_uses.pipeline import LEAKAGE_FACTORS_FILEPATH, Pipeline
+from loads.time_axis import YEAR_TIMESTAMPS
+from reference_data.reference_data import REFERENCE_DATA
+
+
+# Scenario rules of each pipe type: (retrofit scenarios, shutoff scenarios, retrofit year)
+PIPE_RULES = {
+    "gas_service": (
+        gas_service.GAS_RETROFIT_SCENARIOS, gas_service.GAS_SHUTOFF_SCENARIOS,
+        gas_service.RETROFIT_YEAR
+    ),
+    "gas_main": (
+        gas_main.GAS_RETROFIT_SCENARIOS, gas_main.GAS_SHUTOFF_SCENARIOS, gas_main.RETROFIT_YEAR
+    ),
+}
+
+FEET_PER_MILE = 5280
+
+
+class PipeTable:
+    """
+    Holds the gas services and mains of a network as arrays, one row per pipe: pipeline type,
+    material code, length, lifetime, costs, and the index of the parent pipe. Operational vectors,
+    retrofit and depreciation vectors, methane leaks, O&M expenses, shutoff years, and stranded
+    values are computed for every pipe at once, with reductions over the parent index from the
+    bottom of the network up. Results are then set on the pipe objects as read-only rows of the
+    table, with the same values as GasService.initialize_end_use and GasMain.initialize_end_use
+
+    Args:
+        pipes (List[Pipeline]): The pipes of the network, with their connected assets set. Meters
+            connected to the pipes must be initialized
+
+    Attributes:
+        pipes (List[Pipeline]): The pipes of the network
+        years_vector (List[int]): The simulation years, shared by all pipes
+        pipeline_type (np.ndarray): Pipeline type of each pipe
+        material_code (np.ndarray): Index of the material of each pipe in materials
+        materials (np.ndarray): The distinct pipe materials
+        length (np.ndarray): Length of each pipe in feet
+        lifetime (np.ndarray): Lifetime of each pipe in years
+        replacement_cost (np.ndarray): Replacement cost of each pipe
+        parent_index (np.ndarray): Row of the parent pipe of each pipe, -1 for none
+        height (np.ndarray): Number of pipe levels below each pipe
+        operational_vector (np.ndarray): Operational vectors, shape (pipes, years)
+        retrofit_vector (np.ndarray): Retrofit vectors, shape (pipes, years)
+        replacement_vector (np.ndarray): Replacement vectors, shape (pipes, years)
+        install_cost (np.ndarray): Install costs, shape (pipes, years)
+        depreciation (np.ndarray): Depreciated values, shape (pipes, years)
+        shutoff_year (np.ndarray): 1 in the shutoff year of each pipe, shape (pipes, years)
+        stranded_value (np.ndarray): Stranded values, shape (pipes, years)
+        annual_operating_expenses (np.ndarray): O&M expenses, shape (pipes, years)
+        annual_total_leakage (np.ndarray): Methane leaks, shape (pipes, years)
+
+    Methods:
+        initialize_pipes (None): Compute the results of every pipe and set them on the pipes
+    """
+    def __init__(self, pipes: List[Pipeline]):
+        self.pipes: List[Pipeline] = pipes
+        self.years_vector: List[int] = pipes[0].get_years_vector() if pipes else []
+
+        rows = {id(pipe): row for row, pipe in enumerate(pipes)}
+
+        self.pipeline_type: np.ndarray = np.array([pipe.pipeline_type for pipe in pipes])
+        self.materials, self.material_code = np.unique(
+            np.array([str(pipe.material) for pipe in pipes]), return_inverse=True
+        )
+        self.length: np.ndarray = np.array([pipe.length for pipe in pipes], dtype=float)
+        self.lifetime: np.ndarray = np.array([pipe.lifetime for pipe in pipes], dtype=float)
+        self.replacement_cost: np.ndarray = np.array(
+            [pipe.replacement_cost for pipe in pipes], dtype=float
+        )
+
+        self.parent_index: np.ndarray = np.full(len(pipes), -1)
+        self._has_children: np.ndarray = np.zeros(len(pipes), dtype=bool)
+        self._meters: List[tuple] = []
+
+        for row, pipe in enumerate(pipes):
+            self._has_children[row] = bool(pipe.connected_assets)
+
+            for asset in pipe.connected_assets or []:
+                if id(asset) in rows:
+                    self.parent_index[rows[id(asset)]] = row
+                else:
+                    self._meters.append((row, asset))
+
+        self.height: np.ndarray = self._get_height()
+
+        self.operational_vector: np.ndarray = None
+        self.retrofit_vector: np.ndarray = None
+        self.replacement_vector: np.ndarray = None
+        self.install_cost: np.ndarray = None
+        self.depreciation: np.ndarray = None
+        self.shutoff_year: np.ndarray = None
+        self.stranded_value: np.ndarray = None
+        self.annual_operating_expenses: np.ndarray = None
+        self.annual_total_leakage: np.ndarray = None
+
+    def __len__(self) -> int:
+        return len(self.pipes)
+
+    def _get_height(self) -> np.ndarray:
+        """
+        Number of pipe levels below each pipe. Pipes only connected to meters have height 0
+        """
+        height = np.zeros(len(self.pipes), dtype=int)
+
+        level = np.flatnonzero(self.parent_index >= 0)
+        while len(level):
+            parents = self.parent_index[level]
+            np.maximum.at(height, parents, height[level] + 1)
+
+            level = np.unique(parents[self.parent_index[parents] >= 0])
+
+        return height
+
+    def _reduce_up(self, values: np.ndarray, ufunc: np.ufunc) -> np.ndarray:
+        """
+        Reduce the rows of each pipe into its parent, from the bottom of the network up, so each
+        pipe includes every pipe below it
+        """
+        for height in range(self.height.max(initial=-1) + 1):
+            children = np.flatnonzero((self.height == height) & (self.parent_index >= 0))
+            ufunc.at(values, self.parent_index[children], values[children])
+
+        return values
+
+    def _get_type_mask(self, rule: int, value_in_rule: str) -> np.ndarray:
+        return np.array([
+            value_in_rule in PIPE_RULES[pipeline_type][rule] for pipeline_type in self.pipeline_type
+        ])
+
+    def initialize_pipes(self) -> None:
+        """
+        Compute the results of every pipe and set them on the pipe objects
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if not self.pipes:
+            return
+
+        self._compute()
+
+        for row, pipe in enumerate(self.pipes):
+            self._apply(row, pipe)
+
+    def _compute(self) -> None:
+        n_pipes, n_years = len(self.pipes), len(self.years_vector)
+        sim_start_year = self.pipes[0].sim_start_year
+        decarb_scenario = self.pipes[0].decarb_scenario
+
+        # Operational while any downstream meter is operational
+        operational = np.zeros((n_pipes, n_years), dtype=np.int8)
+        for row, meter in self._meters:
+            np.maximum(operational[row], meter.operational_vector, out=operational[row])
+        self.operational_vector = self._reduce_up(operational, np.maximum)
+
+        # Retrofit, replacement, install cost, and depreciation from the retrofit year on
+        is_retrofit = self._get_type_mask(0, decarb_scenario)
+        retrofit_idx = np.array([
+            PIPE_RULES[pipeline_type][2] - sim_start_year for pipeline_type in self.pipeline_type
+        ])
+        year_idx = np.arange(n_years)
+
+        self.retrofit_vector = is_retrofit[:, None] & (year_idx >= retrofit_idx[:, None])
+        self.replacement_vector = is_retrofit[:, None] & (year_idx == retrofit_idx[:, None])
+        self.install_cost = np.where(self.replacement_vector, self.replacement_cost[:, None], 0.)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            depreciation_rate = self.replacement_cost / self.lifetime
+
+        years_since_retrofit = year_idx - retrofit_idx[:, None]
+        self.depreciation = np.where(
+            self.retrofit_vector,
+            np.maximum(
+                self.replacement_cost[:, None] - depreciation_rate[:, None] * years_since_retrofit,
+                0
+            ),
+            0.
+        )
+
+        self.shutoff_year = self._get_shutoff_year(decarb_scenario)
+        self.stranded_value = self.depreciation * self.shutoff_year
+        self.annual_operating_expenses = self._get_annual_om()
+        self.annual_total_leakage = self._get_annual_total_leakage()
+
+    def _get_shutoff_year(self, decarb_scenario: str) -> np.ndarray:
+        """
+        Services shut off with the building of their first meter. Mains shut off in the last
+        retrofit year of the buildings of their services
+        """
+        n_pipes, n_years = len(self.pipes), len(self.years_vector)
+        is_shutoff = self._get_type_mask(1, decarb_scenario)
+
+        # Retrofit vector of the building of the first meter of each pipe
+        building_retrofit = np.zeros((n_pipes, n_years), dtype=bool)
+        has_meter = np.zeros(n_pipes, dtype=bool)
+        for row, meter in self._meters:
+            if not has_meter[row]:
+                building_retrofit[row] = meter.building._retrofit_vec
+                has_meter[row] = True
+
+        last_retrofit = np.where(
+            building_retrofit.any(axis=1),
+            n_years - 1 - np.argmax(building_retrofit[:, ::-1], axis=1),
+            0
+        )
+
+        # Mains take the latest retrofit across the pipes directly connected to them
+        main_shutoff = np.zeros(n_pipes, dtype=int)
+        children = np.flatnonzero(self.parent_index >= 0)
+        np.maximum.at(main_shutoff, self.parent_index[children], last_retrofit[children])
+
+        shutoff_year = np.zeros((n_pipes, n_years))
+
+        is_service = is_shutoff & (self.pipeline_type == "gas_service")
+        shutoff_year[is_service] = building_retrofit[is_service]
+
+        is_main = np.flatnonzero(
+            is_shutoff & (self.pipeline_type == "gas_main") & (main_shutoff > 0)
+        )
+        shutoff_year[is_main, main_shutoff[is_main]] = 1
+
+        return shutoff_year
+
+    def _get_annual_om(self) -> np.ndarray:
+        om_table = REFERENCE_DATA.get_operating_expenses(gas_service.ANNUAL_OM_FILEPATH)
+
+        expense_per_mile = np.zeros(len(self.materials))
+        for code, material in enumerate(self.materials):
+            if material not in om_table:
+                warnings.warn(f"Material {material} not in O&M table! Using $0 / year.")
+
+            expense_per_mile[code] = om_table.get(material, {}).get(
+                "operating_expense_per_mile", 0
+            )
+
+        annual_expense = expense_per_mile[self.material_code] * (self.length / FEET_PER_MILE)
+
+        return annual_expense[:, None] * self.operational_vector
+
+    def _get_annual_total_leakage(self) -> np.ndarray:
+        """
+        Leaks of the pipe material, or of plastic in the retrofit years, while operational. Only
+        computed for pipes with connected assets
+        """
+        leakage_factors = REFERENCE_DATA.get_leakage_factors(LEAKAGE_FACTORS_FILEPATH)
+
+        material_factor = np.zeros(len(self.pipes))
+        retrofit_factor = np.zeros(len(self.pipes))
+
+        for row in np.flatnonzero(self._has_children):
+            pipeline_type = self.pipeline_type[row]
+            material_factor[row] = leakage_factors[(pipeline_type, self.pipes[row].material)]
+            retrofit_factor[row] = leakage_factors[(pipeline_type, "PL")]
+
+        annual_leakage = np.where(
+            self.retrofit_vector,
+            (retrofit_factor * self.length)[:, None],
+            self.operational_vector * (material_factor * self.length)[:, None]
+        )
+
+        return annual_leakage * self.operational_vector
+
+    def _apply(self, row: int, pipe: Pipeline) -> None:
+        pipe.years_vector = self.years_vector
+        pipe.year_timestamps = YEAR_TIMESTAMPS
+
+        pipe.operational_vector = _read_only(self.operational_vector[row])
+        pipe.retrofit_vector = _read_only(self.retrofit_vector[row])
+        pipe.replacement_vector = _read_only(self.replacement_vector[row])
+        pipe.install_cost = _read_only(self.install_cost[row])
+        pipe.depreciation = _read_only(self.depreciation[row])
+        pipe.shutoff_year = _read_only(self.shutoff_year[row])
+        pipe.stranded_value = _read_only(self.stranded_value[row])
+        pipe.annual_operating_expenses = _read_only(self.annual_operating_expenses[row])
+
+        if self._has_children[row]:
+            pipe.leakage_factors = pipe._load_leakage_factors()
+            pipe.annual_total_energy_use = pipe.get_annual_total_energy_use()
+            pipe.annual_peak_energy_use = pipe.get_annual_peak_energy_use()
+            pipe.annual_energy_use_timeseries = pipe.get_annual_energy_use_timeseries()
+            pipe.annual_total_leakage = _read_only(self.annual_total_leakage[row])
+
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    values.flags.writeable = False
+
+    return values
@@ -1,12 +1,14 @@
 """
 Defines a utility network and instantiates all related classes for utility assets
 """
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import pandas as pd
 
 import json
+import warnings
 
 from buildings.building import Building
+from end_uses.asset_table import AssetTable
 from end_uses.utility_end_uses.gas_main import GasMain
 from end_uses.utility_end_uses.gas_service import GasService
 from end_uses.meters.gas_meter import GasMeter
@@ -16,17 +18,49 @@ from end_uses.utility_end_uses.elec_secondary import ElecSecondary
 from end_uses.utility_end_uses.elec_transformer import ElecTransformer
 from end_uses.utility_end_uses.elec_primary import ElecPrimary
 from end_uses.meters.elec_meter import ElecMeter
+from end_uses.meters.meter import Meter
+from end_uses.utility_end_uses.utility_end_use import UtilityEndUse
+from end_uses.utility_end_uses.pipeline import Pipeline
+from utility_network.network_topology import NetworkTopology
+from utility_network.pipe_table import PipeTable
+
+
+# Config table, asset class, and list attr of each level of the networks, from the meters up. The
+# order sets the order of the children of an asset, and the last level is the top of the network
+NETWORK_LEVELS = {
+    "gas": [
+        ("meter_config", GasMeter, "gas_meters"),
+        ("service_config", GasService, "gas_services"),
+        ("mains_config", GasMain, "gas_mains"),
+    ],
+    "elec": [
+        ("meter_config", ElecMeter, "elec_meters"),
+        ("service_config", ElecService, "elec_services"),
+        ("secondary_config", ElecSecondary, "elec_secondaries"),
+        ("xfmrs_config", ElecTransformer, "elec_transformers"),
+        ("primary_config", ElecPrimary, "elec_primaries"),
+    ],
+}
 
 
 class UtilityNetwork:
     """
-    Defines the utility network as an aggregation of discrete utility assets
+    Defines the utility network as an aggregation of discrete utility assets. Each network is built
+    as a graph of the assets in its config tables, and assets are created bottom-up so each one
+    aggregates the results of its already initialized children
 
     Args:
         network_config_filepath (str): Filepath to utility network config file
         sim_settings (dict): Dict of simulation settings
         buildings (Dict[str, Building]): Dict of Building instances in the scenario, organized by id
 
+    Optional args:
+        network_tables (Dict[str, pd.DataFrame]): Cache of parsed network typology tables, keyed by
+            filepath. Allows scenarios on the same street segment to read each table once
+        network_topologies (Dict[Tuple[str, Tuple[str, ...]], NetworkTopology]): Cache of network
+            topologies, keyed by network and config table filepaths. Allows scenarios on the same
+            street segment to build each network graph once
+
     Attributes:
         buildings (Dict[str, Building]): Dict of Building instances in the scenario, organized by id
         years_vec (list): List of years in the simulation
@@ -48,13 +82,18 @@ class UtilityNetwork:
         network_config_filepath: str,
         sim_settings: dict,
         buildings: Dict[str, Building],
+        network_tables: Dict[str, pd.DataFrame] = None,
+        network_topologies: Dict[Tuple[str, Tuple[str, ...]], NetworkTopology] = None,
     ):
         self._network_config_filepath: str = network_config_filepath
         self._sim_settings: dict = sim_settings
         self.buildings: Dict[str, Building] = buildings
+        self._network_tables: Dict[str, pd.DataFrame] = network_tables
+        self._network_topologies: Dict[
+            Tuple[str, Tuple[str, ...]], NetworkTopology
+        ] = network_topologies
 
         self._network_config: dict = {}
-        self._year_timestamps: pd.DatetimeIndex = None
         self.years_vec: list = []
 
         self.gas_mains: List[GasMain] = []
@@ -76,23 +115,20 @@ class UtilityNetwork:
 
         self._get_years_vec()
 
-        # order is important
-        self._create_gas_meters()
-        self._create_gas_services()
-        self._create_gas_mains()
-
-        self._create_elec_meters()
-        self._create_elec_services()
-        self._create_elec_secondaries()
-        self._create_elec_transformers()
-        self._create_elec_primaries()
+        for network in NETWORK_LEVELS:
+            self._create_network(network)
 
     def _read_csv_config(self, config_file_path=None) -> None:
         """
         Read in the utilty network config file and save to network_config attr
         """
-        data = pd.read_csv(config_file_path)
-        return data
+        if self._network_tables is None:
+            return pd.read_csv(config_file_path)
+
+        if config_file_path not in self._network_tables:
+            self._network_tables[config_file_path] = pd.read_csv(config_file_path)
+
+        return self._network_tables[config_file_path]
 
     def _read_json_config(self, config_file_path=None) -> None:
         """
@@ -110,169 +146,79 @@ class UtilityNetwork:
         end_year = self._sim_settings.get("sim_end_year", 2050)
         self.years_vec = list(range(start_year, end_year + 1))
 
-        self._year_timestamps = pd.date_range(
-            start="{}-01-01".format(start_year),
-            end="{}-01-01".format(start_year + 1),
-            freq="H",
-            inclusive="left",
-        )
-
-    def _create_gas_meters(self) -> None:
-        """
-        Instantiate all necessary GasMeter instances and save to gas_meters list attr
-        """
-        meter_config_file = self._network_config["networks"]["gas"]["meter_config"]
-        meter_configs = self._read_csv_config(config_file_path=meter_config_file)
-
-        for _, meter_config in meter_configs.iterrows():
-            building_id = meter_config["LOC_ID"]
-            building = self.buildings.get(building_id, None)
-            gas_meter = GasMeter(**meter_config, **self._sim_settings, building=building)
-            gas_meter.initialize_end_use()
-            self.gas_meters.append(gas_meter)
-
-    def _get_children(self, parent_id=None, all_children=None) -> List:
-        selected_children = []
-        for child in all_children:
-            if child.parent_id == parent_id:
-                selected_children.append(child)
-        return selected_children
-
-    def _create_gas_services(self) -> None:
-        """
-        Instantiate all necessary GasService instances and save to gas_services list attr
-        """
-        service_config_file = self._network_config["networks"]["gas"]["service_config"]
-        service_configs = self._read_csv_config(config_file_path=service_config_file)
-        for _, service_config in service_configs.iterrows():
-            connected_meters = self._get_children(
-                parent_id=service_config["gisid"], all_children=self.gas_meters
-            )
-
-            gas_service = GasService(
-                **service_config, **self._sim_settings, connected_assets=connected_meters
-            )
-
-            gas_service.initialize_end_use()
-            self.gas_services.append(gas_service)
-
-    def _create_gas_mains(self) -> None:
+    def _get_topology(self, network: str) -> NetworkTopology:
         """
-        Instantiate the GasMain and write to gas_main attr
+        Get the topology of a network from the cache, or build it from the config tables
         """
-        main_config_file = self._network_config["networks"]["gas"]["mains_config"]
-        main_configs = self._read_csv_config(config_file_path=main_config_file)
-        for _, main_config in main_configs.iterrows():
-
-            connected_services = self._get_children(
-                parent_id=main_config["gisid"], all_children=self.gas_services
-            )
-
-            gas_main = GasMain(
-                **main_config, **self._sim_settings, connected_assets=connected_services
-            )
+        levels = NETWORK_LEVELS[network]
+        config_files = tuple(
+            self._network_config["networks"][network][config_key] for config_key, _, _ in levels
+        )
 
-            gas_main.initialize_end_use()
-            self.gas_mains.append(gas_main)
+        key = (network, config_files)
 
-    def _create_elec_meters(self) -> None:
-        """
-        Instantiate all necessary ElecMeter instances and save to gas_meters list attr
-        """
-        meter_config_file = self._network_config["networks"]["elec"]["meter_config"]
-        meter_configs = self._read_csv_config(config_file_path=meter_config_file)
-
-        for _, meter_config in meter_configs.iterrows():
-            building_id = meter_config["LOC_ID"]
-            building = self.buildings.get(building_id, None)
-            elec_meter = ElecMeter(
-                **meter_config, **self._sim_settings, building=building
-            )
-            elec_meter.initialize_end_use()
-            self.elec_meters.append(elec_meter)
+        if self._network_topologies is not None and key in self._network_topologies:
+            return self._network_topologies[key]
 
-    def _create_elec_services(self) -> None:
-        """
-        Instantiate all necessary ElecService instances and save to gas_services list attr
-        """
-        service_config_file = self._network_config["networks"]["elec"]["service_config"]
-        service_configs = self._read_csv_config(config_file_path=service_config_file)
-        for _, service_config in service_configs.iterrows():
-            connected_meters = self._get_children(
-                parent_id=service_config["gisid"], all_children=self.elec_meters
-            )
+        topology = NetworkTopology(
+            levels,
+            [self._read_csv_config(config_file_path=config_file) for config_file in config_files]
+        )
 
-            elec_service = ElecService(
-                **service_config, **self._sim_settings, connected_assets=connected_meters
-            )
+        if self._network_topologies is not None:
+            self._network_topologies[key] = topology
 
-            elec_service.initialize_end_use()
-            self.elec_services.append(elec_service)
+        return topology
 
-    def _create_elec_secondaries(self) -> None:
+    def _create_network(self, network: str) -> None:
         """
-        Instantiate all necessary ElecSecondaries instances and save to gas_services list attr
+        Instantiate the assets of a network bottom-up and save them to the list attr of each level.
+        Assets are connected to the asset whose gisid matches their parentid, at any level, and
+        each asset is created after all of its children so it can aggregate their results. The
+        assets are created for this scenario from a topology that can be shared between scenarios
         """
-        secondary_config_file = self._network_config["networks"]["elec"][
-            "secondary_config"
-        ]
-        secondary_configs = self._read_csv_config(
-            config_file_path=secondary_config_file
-        )
-        for _, secondary_config in secondary_configs.iterrows():
-            connected_services = self._get_children(
-                parent_id=secondary_config["gisid"], all_children=self.elec_services
-            )
+        topology = self._get_topology(network)
+        asset_configs = topology.asset_configs
 
-            elec_secondary = ElecSecondary(
-                **secondary_config,
-                **self._sim_settings,
-                connected_assets=connected_services
-            )
+        if topology.orphans:
+            warnings.warn(f"Assets {topology.orphans} are not connected to the {network} network!")
 
-            elec_secondary.initialize_end_use()
-            self.elec_secondaries.append(elec_secondary)
+        assets = {}
+        for asset_id in topology.ordered:
+            asset_class, _, config = asset_configs[asset_id]
+            connected_assets = [
+                assets[child_id] for child_id in topology.graph.get_children(asset_id)
+            ]
+            assets[asset_id] = self._create_asset(asset_class, config, connected_assets)
 
-    def _create_elec_transformers(self) -> None:
-        """
-        Instantiate all necessary ElecSecondaries instances and save to gas_services list attr
-        """
-        xfmrs_config_file = self._network_config["networks"]["elec"]["xfmrs_config"]
-        xfmrs_configs = self._read_csv_config(config_file_path=xfmrs_config_file)
-        for _, xfmr_config in xfmrs_configs.iterrows():
-            connected_services = self._get_children(
-                parent_id=xfmr_config["gisid"], all_children=self.elec_services
-            )
+        # Lifecycle vectors are computed together, then assets are initialized bottom-up. Pipes are
+        # initialized together, once all meters are
+        pipes = [asset for asset in assets.values() if isinstance(asset, Pipeline)]
+        other_assets = [asset for asset in assets.values() if not isinstance(asset, Pipeline)]
 
-            connected_secondaries = self._get_children(
-                parent_id=xfmr_config["gisid"], all_children=self.elec_secondaries
-            )
-
-            connected_assets = connected_services + connected_secondaries
+        AssetTable(other_assets).initialize_assets()
+        for asset in other_assets:
+            asset.initialize_end_use()
 
-            elec_xfmr = ElecTransformer(
-                **xfmr_config, **self._sim_settings, connected_assets=connected_assets
-            )
+        PipeTable(pipes).initialize_pipes()
 
-            elec_xfmr.initialize_end_use()
-            self.elec_transformers.append(elec_xfmr)
+        for asset_id, (_, attribute, _) in asset_configs.items():
+            getattr(self, attribute).append(assets[asset_id])
 
-    def _create_elec_primaries(self) -> None:
+    def _create_asset(
+            self, asset_class: type, config: pd.Series, connected_assets: list
+    ) -> UtilityEndUse:
         """
-        Instantiate all necessary ElecPrimaries instances and save to gas_services list attr
+        Instantiate a single asset. Meters are connected to their building, and all other assets to
+        their downstream assets
         """
-        primary_config_file = self._network_config["networks"]["elec"]["primary_config"]
-        primary_configs = self._read_csv_config(config_file_path=primary_config_file)
-        for _, primary_config in primary_configs.iterrows():
-            connected_transformers = self._get_children(
-                parent_id=primary_config["gisid"], all_children=self.elec_transformers
-            )
+        if issubclass(asset_class, Meter):
+            building = self.buildings.get(config["LOC_ID"], None)
+            asset = asset_class(**config, **self._sim_settings, building=building)
 
-            elec_primary = ElecPrimary(
-                **primary_config,
-                **self._sim_settings,
-                connected_assets=connected_transformers
+        else:
+            asset = asset_class(
+                **config, **self._sim_settings, connected_assets=connected_assets
             )
 
-            elec_primary.initialize_end_use()
-            self.elec_primaries.append(elec_primary)
+        return asset